@@ -144,7 +144,7 @@ class AsyncLoopingOrchestrator:
 
             await self.broadcast_event(session_id, "moderator_complete", {
                 "new_version": prd.version,
-                "tokens": tokens
+                "tokens": dict(tokens)
             })
 
             iteration += 1
@@ -181,7 +181,7 @@ class AsyncLoopingOrchestrator:
             "critic": critic.name,
             "issues_count": len(review.issues),
             "high_count": high_count,
-            "tokens": tokens
+            "tokens": dict(tokens)
         })
 
         return review
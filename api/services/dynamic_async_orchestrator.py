@@ -401,7 +401,7 @@ class DynamicAsyncOrchestrator:
 
             await self.broadcast_event(session_id, "moderator_complete", {
                 "new_version": doc.version + 1,
-                "tokens": tokens
+                "tokens": dict(tokens)
             })
 
             # Create new version
@@ -509,7 +509,7 @@ class DynamicAsyncOrchestrator:
             "critic": critic.name,
             "issues_count": len(review.issues),
             "high_count": high_count,
-            "tokens": tokens,
+            "tokens": dict(tokens),
             "top_issues": [i.model_dump() for i in review.issues[:2]],
             "assessment": review.overall_assessment
         })
@@ -641,7 +641,7 @@ class DynamicAsyncOrchestrator:
 
             await self.broadcast_event(session_id, "moderator_complete", {
                 "new_version": doc.version + 1,
-                "tokens": tokens
+                "tokens": dict(tokens)
             })
 
             # Create new version
@@ -42,7 +42,13 @@ Example:
 __version__ = "0.1.0"
 
 # Public API - Main function
-from .orchestration.runner import run_roundtable, DefaultEngine
+from .orchestration.runner import (
+    run_roundtable,
+    run_roundtable_async,
+    DefaultEngine,
+    AsyncEngine,
+    ThreadedEngine,
+)
 
 # Public API - Configuration and Result types
 from .types import (
@@ -78,14 +84,17 @@ from .exceptions import (
 )
 
 # Public API - Logging
-from .logging import OrchestratorLogger, create_logger
+from .logging import NullLogger, OrchestratorLogger, create_logger
 
 __all__ = [
     # Version
     "__version__",
     # Main function
     "run_roundtable",
+    "run_roundtable_async",
     "DefaultEngine",
+    "AsyncEngine",
+    "ThreadedEngine",
     # Types
     "RoundtableConfig",
     "RoundtableResult",
@@ -112,5 +121,6 @@ __all__ = [
     "EngineError",
     # Logging
     "OrchestratorLogger",
+    "NullLogger",
     "create_logger",
 ]
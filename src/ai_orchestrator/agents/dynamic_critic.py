@@ -2,14 +2,22 @@
 """
 Dynamic Critic: A critic agent that can take on any role based on generated configuration
 """
-from typing import Tuple, Optional
+from typing import Any, Tuple, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.output_parsers import JsonOutputParser
 from ..models.document_models import Document, DocumentReview, DocumentIssue
 from ..utils.llm_factory import create_llm, extract_token_usage
+from ..utils.json_parsing import loads_lenient, strip_fences
 import os
 
 
+def _debug_enabled(logger: Optional[Any]) -> bool:
+    """True if logger would emit debug records (loggers without a check always do)."""
+    if logger is None:
+        return False
+    check = getattr(logger, "is_debug_enabled", None)
+    return check() if check is not None else True
+
+
 class DynamicCritic:
     """
     A flexible critic agent that can review documents from any perspective.
@@ -44,24 +52,9 @@ class DynamicCritic:
         self.role = role
         self.system_prompt = system_prompt
         self.llm = create_llm(model=model, temperature=temperature)
-        self.parser = JsonOutputParser(pydantic_object=DocumentReview)
-
-    def review(
-        self,
-        document: Document,
-        logger: Optional[any] = None
-    ) -> Tuple[DocumentReview, dict]:
-        """
-        Review the document from this critic's perspective.
-
-        Args:
-            document: The document to review
-            logger: Optional logger for tracking
-
-        Returns:
-            Tuple of (DocumentReview, token_usage)
-        """
 
+    def _build_messages(self, document: Document) -> list:
+        """Build the system + human messages for reviewing a document."""
         human_prompt = f"""Review the following document:
 
 Title: {document.title}
@@ -76,29 +69,71 @@ Focus on your specific area of expertise and flag any issues you identify.
 Return your response as a JSON object with 'issues' and 'overall_assessment' fields.
 """
 
-        messages = [
+        return [
             SystemMessage(content=self.system_prompt),
             HumanMessage(content=human_prompt)
         ]
 
-        if logger:
-            logger.debug(f"[{self.name}] Starting review...")
-            logger.debug(f"System prompt length: {len(self.system_prompt)} chars")
-            logger.debug(f"Document content length: {len(document.content)} chars")
+    def review(
+        self,
+        document: Document,
+        logger: Optional[any] = None
+    ) -> Tuple[DocumentReview, dict]:
+        """
+        Review the document from this critic's perspective.
 
+        Args:
+            document: The document to review
+            logger: Optional logger for tracking
+
+        Returns:
+            Tuple of (DocumentReview, token_usage)
+        """
+        messages = self._build_messages(document)
+        self._log_request(document, logger)
         response = self.llm.invoke(messages)
+        return self._parse_response(response, logger)
 
-        if logger:
-            logger.debug(f"[{self.name}] Received response ({len(response.content)} chars)")
-            logger.debug(f"[{self.name}] Response preview: {response.content[:200]}...")
+    async def areview(
+        self,
+        document: Document,
+        logger: Optional[any] = None
+    ) -> Tuple[DocumentReview, dict]:
+        """
+        Async variant of review() using the LLM's native ainvoke.
+
+        Args:
+            document: The document to review
+            logger: Optional logger for tracking
+
+        Returns:
+            Tuple of (DocumentReview, token_usage)
+        """
+        messages = self._build_messages(document)
+        self._log_request(document, logger)
+        response = await self.llm.ainvoke(messages)
+        return self._parse_response(response, logger)
+
+    def _log_request(self, document: Document, logger: Optional[Any]) -> None:
+        if _debug_enabled(logger):
+            logger.debug("[%s] Starting review...", self.name)
+            logger.debug("System prompt length: %d chars", len(self.system_prompt))
+            logger.debug("Document content length: %d chars", len(document.content))
+
+    def _parse_response(self, response, logger: Optional[Any]) -> Tuple[DocumentReview, dict]:
+        """Parse an LLM response into a DocumentReview plus token usage."""
+        debug = _debug_enabled(logger)
+        if debug:
+            logger.debug("[%s] Received response (%d chars)", self.name, len(response.content))
+            logger.debug("[%s] Response preview: %s...", self.name, response.content[:200])
 
         # Parse response
         try:
-            if logger:
-                logger.debug(f"[{self.name}] Parsing JSON response...")
-            review_data = self.parser.parse(response.content)
-            if logger:
-                logger.debug(f"[{self.name}] Successfully parsed JSON")
+            if debug:
+                logger.debug("[%s] Parsing JSON response...", self.name)
+            review_data = loads_lenient(strip_fences(response.content))
+            if debug:
+                logger.debug("[%s] Successfully parsed JSON", self.name)
         except Exception as e:
             if logger:
                 logger.error(f"[{self.name}] JSON parsing failed: {str(e)}")
@@ -120,20 +155,17 @@ Return your response as a JSON object with 'issues' and 'overall_assessment' fie
                 transformed_issues.append(transformed_issue)
             review_data["issues"] = transformed_issues
 
-        # Create review object
-        review = DocumentReview(
-            reviewer_name=self.name,
-            **review_data
-        )
+        # Validate once into the review model
+        review_data["reviewer_name"] = self.name
+        review = DocumentReview.model_validate(review_data)
 
         # Extract token usage (handles both OpenAI and Gemini formats)
         token_usage = extract_token_usage(response)
 
         if logger:
-            high_count = sum(1 for issue in review.issues if issue.severity == "High")
             medium_count = sum(1 for issue in review.issues if issue.severity == "Medium")
             low_count = sum(1 for issue in review.issues if issue.severity == "Low")
-            logger.info(f"[{self.name}] Found {len(review.issues)} issues: {high_count} high, {medium_count} medium, {low_count} low")
+            logger.info(f"[{self.name}] Found {review.total_count} issues: {review.high_count} high, {medium_count} medium, {low_count} low")
             logger.info(f"[{self.name}] Tokens: {token_usage['total_tokens']}")
 
         return review, token_usage
@@ -236,15 +268,16 @@ Output the complete refined document.
             HumanMessage(content=human_prompt)
         ]
 
-        if logger:
+        debug = _debug_enabled(logger)
+        if debug:
             logger.debug("[Moderator] Refining document...")
-            logger.debug(f"Document length: {len(document.content)} chars")
-            logger.debug(f"Total issues to address: {sum(len(r.issues) for r in reviews)}")
+            logger.debug("Document length: %d chars", len(document.content))
+            logger.debug("Total issues to address: %d", sum(len(r.issues) for r in reviews))
 
         response = self.llm.invoke(messages)
 
-        if logger:
-            logger.debug(f"[Moderator] Generated refined content ({len(response.content)} chars)")
+        if debug:
+            logger.debug("[Moderator] Generated refined content (%d chars)", len(response.content))
 
         refined_content = response.content.strip()
 
@@ -1,8 +1,8 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.output_parsers import JsonOutputParser
 from ..models.prd_models import PRD, PRDReview
 from ..prompts.system_prompts import ENGINEERING_CRITIC_SYSTEM, get_review_prompt
+from ..utils.json_parsing import fast_parse
 from typing import Optional, Tuple
 import os
 
@@ -15,7 +15,6 @@ class EngineeringCritic:
             temperature=temperature,
             api_key=os.getenv("OPENAI_API_KEY")
         )
-        self.parser = JsonOutputParser(pydantic_object=PRDReview)
         self.name = "engineering_critic"
 
     def review(self, prd: PRD, logger: Optional[object] = None) -> Tuple[PRDReview, dict]:
@@ -38,12 +37,11 @@ class EngineeringCritic:
         if logger:
             logger.log_llm_response(self.name, response.content, token_usage)
 
-        review_data = self.parser.parse(response.content)
-        review = PRDReview(**review_data)
+        review = fast_parse(response.content, PRDReview)
 
         if logger:
             high_count = sum(1 for i in review.issues if i.severity == "High")
             logger.log_review_summary(self.name, len(review.issues), high_count, review.overall_assessment)
-            logger.log_issues(self.name, [i.model_dump() for i in review.issues])
+            logger.log_issues(self.name, review.issues)
 
         return review, token_usage
@@ -34,11 +34,65 @@ Example usage:
 """
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
 
-@dataclass
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Canonical severities, interned so normalized values can be compared by identity
+_SEV_INTERN = {s: sys.intern(s) for s in ("high", "medium", "low")}
+
+
+def _norm_sev(value: Any) -> str:
+    """Normalize an extracted severity to a lowercase (interned when canonical) string."""
+    if value is None:
+        return _SEV_INTERN["low"]
+    s = value if isinstance(value, str) else str(value)
+    if not s.islower():
+        s = s.lower()
+    return _SEV_INTERN.get(s, s)
+
+
+# langextract module (or the ImportError raised loading it), resolved once on first use
+_lx: Any = None
+_lx_error: Optional[ImportError] = None
+
+
+def _get_lx() -> Any:
+    """Return the langextract module, importing it on first call.
+
+    Raises:
+        ImportError: If langextract is not installed (cached after the first attempt).
+    """
+    global _lx, _lx_error
+    if _lx is not None:
+        return _lx
+    if _lx_error is None:
+        try:
+            import langextract  # type: ignore
+        except ImportError as e:
+            _lx_error = ImportError(
+                "LangExtract is not installed. "
+                "Run `pip install langextract` (or `pip install -e .[langextract]`)."
+            )
+            _lx_error.__cause__ = e
+        else:
+            _lx = langextract
+            return _lx
+    raise _lx_error
+
+
+@dataclass(slots=True, frozen=True)
 class ExtractedIssue:
     """An issue extracted from a document with provenance.
 
@@ -51,14 +105,42 @@ class ExtractedIssue:
     evidence: Optional[Mapping[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "severity": self.severity,
-            "message": self.message,
-            "evidence": dict(self.evidence) if self.evidence else None,
-        }
+        return asdict_fast(self)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (see encode_issues)."""
+        return encode_issues(self)
+
+
+def asdict_fast(issue: ExtractedIssue) -> Dict[str, Any]:
+    """Shallow dict of an ExtractedIssue built from its slots.
+
+    Unlike dataclasses.asdict this does not recurse or deep-copy; evidence is
+    copied into a plain dict so the result is JSON-serializable.
+    """
+    data = {name: getattr(issue, name) for name in ExtractedIssue.__slots__}
+    evidence = data["evidence"]
+    data["evidence"] = dict(evidence) if evidence else None
+    return data
+
 
+def encode_issues(issues: ExtractedIssue | Iterable[ExtractedIssue]) -> bytes:
+    """Serialize one issue or a list of issues to JSON bytes.
 
-@dataclass
+    Uses msgspec when installed, then orjson, then the stdlib json module.
+    """
+    if isinstance(issues, ExtractedIssue):
+        payload: Any = asdict_fast(issues)
+    else:
+        payload = [asdict_fast(issue) for issue in issues]
+    if msgspec is not None:
+        return msgspec.json.encode(payload)
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@dataclass(slots=True)
 class LangExtractSpec:
     """Defines what to extract using LangExtract.
 
@@ -77,7 +159,7 @@ class LangExtractSpec:
     use_schema_constraints: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LangExtractExtractorAgent:
     """Structured extraction agent using LangExtract.
 
@@ -120,13 +202,7 @@ class LangExtractExtractorAgent:
         if self.spec is None:
             raise ValueError("LangExtractExtractorAgent.spec must be set")
 
-        try:
-            import langextract as lx  # type: ignore
-        except ImportError as e:
-            raise ImportError(
-                "LangExtract is not installed. "
-                "Run `pip install langextract` (or `pip install -e .[langextract]`)."
-            ) from e
+        lx = _get_lx()
 
         # LangExtract's top-level API supports multi-provider model_id routing.
         # Using OpenAI requires api_key, fence_output=True, use_schema_constraints=False
@@ -179,9 +255,7 @@ class LangExtractExtractorAgent:
         if isinstance(extractions, list):
             for ex in extractions:
                 if isinstance(ex, dict):
-                    severity = str(
-                        ex.get("severity") or ex.get("priority") or "low"
-                    ).lower()
+                    severity = _norm_sev(ex.get("severity") or ex.get("priority"))
                     message = str(
                         ex.get("message")
                         or ex.get("issue")
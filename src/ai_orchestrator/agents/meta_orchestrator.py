@@ -2,13 +2,21 @@
 """
 Meta-Orchestrator: Dynamically generates roundtable participants based on topic
 """
-from typing import List, Dict, Any
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.output_parsers import JsonOutputParser
+from typing import List, Dict, Any, Type, TypeVar
+import time
+from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
 from pydantic import BaseModel, Field
 from ..utils.llm_factory import create_llm
+from ..utils.json_parsing import fast_parse
+from ..presets import load_preset_data
 import os
 
+T = TypeVar("T", bound=BaseModel)
+
+# Re-prompt attempts after a response fails to parse (retry-with-feedback)
+PARSE_RETRIES = 2
+PARSE_RETRY_BACKOFF_S = 1.0
+
 
 class Participant(BaseModel):
     """A roundtable participant with their role and expertise"""
@@ -36,8 +44,26 @@ class MetaOrchestrator:
 
     def __init__(self, model: str = "gpt-4-turbo", temperature: float = 0.7):
         self.llm = create_llm(model=model, temperature=temperature)
-        self.parser = JsonOutputParser(pydantic_object=RoundtableConfig)
-        self.single_participant_parser = JsonOutputParser(pydantic_object=Participant)
+
+    def _invoke_parsed(self, messages: list, cls: Type[T]) -> T:
+        """
+        Invoke the LLM and parse its response into ``cls``.
+
+        If parsing fails even after local JSON repair, the error is fed back
+        to the model and the call is retried up to PARSE_RETRIES times.
+        """
+        messages = list(messages)
+        for attempt in range(PARSE_RETRIES + 1):
+            response = self.llm.invoke(messages)
+            try:
+                return fast_parse(response.content, cls)
+            except ValueError as e:
+                if attempt == PARSE_RETRIES:
+                    raise
+                messages.append(AIMessage(content=response.content))
+                messages.append(HumanMessage(content=f"Your output had error: {e}. Fix and retry."))
+                time.sleep(PARSE_RETRY_BACKOFF_S * (attempt + 1))
+        raise AssertionError("unreachable: the last attempt returns or raises")
 
     def generate_roundtable(
         self,
@@ -159,10 +185,7 @@ ALL fields are required except suggested_fix which can be null. Use 'reviewer' f
             HumanMessage(content=human_prompt)
         ]
 
-        response = self.llm.invoke(messages)
-        config = self.parser.parse(response.content)
-
-        return RoundtableConfig(**config)
+        return self._invoke_parsed(messages, RoundtableConfig)
 
     def generate_single_participant(
         self,
@@ -280,10 +303,7 @@ ALL fields are required except suggested_fix which can be null. Use 'reviewer' f
             HumanMessage(content=human_prompt)
         ]
 
-        response = self.llm.invoke(messages)
-        participant_dict = self.single_participant_parser.parse(response.content)
-
-        return Participant(**participant_dict)
+        return self._invoke_parsed(messages, Participant)
 
     def generate_moderator_config(
         self,
@@ -365,6 +385,9 @@ Generate moderator instructions that will effectively synthesize feedback from t
         """
         Generate roundtable config from a preset template.
 
+        Uses the prebuilt config shipped in ai_orchestrator.presets when one
+        exists for the current PRESET_VERSION; otherwise asks the LLM.
+
         Args:
             preset: One of "prd", "code-review", "architecture", "business-strategy"
 
@@ -398,6 +421,10 @@ Generate moderator instructions that will effectively synthesize feedback from t
         if preset not in presets:
             raise ValueError(f"Unknown preset: {preset}. Choose from {list(presets.keys())}")
 
+        prebuilt = load_preset_data(preset)
+        if prebuilt is not None:
+            return RoundtableConfig.model_validate(prebuilt)
+
         config = presets[preset]
 
         # Generate with hint
@@ -1,49 +1,169 @@
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.output_parsers import JsonOutputParser
-from ..models.prd_models import PRD, PRDReview
+from ..models.prd_models import PRD, PRDIssue, PRDReview
 from ..prompts.system_prompts import PRD_CRITIC_SYSTEM, get_review_prompt
-from typing import Optional, Tuple
-import os
+from ..utils.json_parsing import fast_parse
+from ..utils.llm_factory import extract_token_usage, get_shared_client
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
-class PRDCritic:
-    """Product quality critic agent"""
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
-    def __init__(self, model: str = "gpt-4-turbo", temperature: float = 0.2):
-        self.llm = ChatOpenAI(
-            model=model,
-            temperature=temperature,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
-        self.parser = JsonOutputParser(pydantic_object=PRDReview)
-        self.name = "prd_critic"
 
-    def review(self, prd: PRD, logger: Optional[object] = None) -> Tuple[PRDReview, dict]:
-        """Review PRD and return structured issues with metadata"""
-        messages = [
+class _IssueParser:
+    """Incrementally extracts completed ``issues`` items from streamed review JSON"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._items = None
+        self._coro = None
+        self._started = False
+        if ijson is not None:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, "issues.item")
+
+    @property
+    def content(self) -> str:
+        return "".join(self.parts)
+
+    def feed(self, text: str) -> List[dict]:
+        """Feed a response chunk and return any issue objects it completed"""
+        self.parts.append(text)
+        if self._coro is None or not text:
+            return []
+
+        if not self._started:
+            # Skip a leading markdown fence; start at the JSON object itself
+            pending = self.content
+            start = pending.find("{")
+            if start < 0:
+                return []
+            self._started = True
+            text = pending[start:]
+
+        try:
+            self._coro.send(text.encode("utf-8"))
+        except ijson.JSONError:
+            # Trailing fence or malformed output: the final full parse decides
+            self._coro = None
+
+        completed = list(self._items)
+        del self._items[:]
+        return completed
+
+
+class ReviewStream:
+    """
+    Issues from a streamed PRD review, yielded as the model emits them.
+
+    Iterate with ``for`` (sync) or ``async for`` (async). Once iteration
+    finishes, ``review`` and ``token_usage`` hold the complete result.
+    """
+
+    def __init__(self, critic: "PRDCritic", prd: PRD, logger: Optional[object] = None,
+                 stop_on_first_high_issue: bool = False):
+        self.critic = critic
+        self.prd = prd
+        self.logger = logger
+        self.stop_on_first_high_issue = stop_on_first_high_issue
+        self.review: Optional[PRDReview] = None
+        self.token_usage: dict = {}
+        self._parser = _IssueParser()
+        self._issues: List[PRDIssue] = []
+        self._final_chunk = None
+        self._stopped_early = False
+
+    def _messages(self) -> list:
+        prompt = get_review_prompt(self.prd)
+        if self.logger:
+            self.logger.log_llm_request(self.critic.name, prompt)
+        return [
             SystemMessage(content=PRD_CRITIC_SYSTEM),
-            HumanMessage(content=get_review_prompt(prd))
+            HumanMessage(content=prompt)
         ]
 
-        if logger:
-            logger.log_llm_request(self.name, get_review_prompt(prd))
-
-        response = self.llm.invoke(messages)
+    def _consume(self, chunk) -> List[PRDIssue]:
+        """Accumulate a chunk and return newly completed issues"""
+        self._final_chunk = chunk if self._final_chunk is None else self._final_chunk + chunk
+        completed = []
+        for item in self._parser.feed(chunk.content):
+            try:
+                issue = PRDIssue.__pydantic_validator__.validate_python(item)
+            except ValueError:
+                continue
+            self._issues.append(issue)
+            completed.append(issue)
+            if self.stop_on_first_high_issue and issue.severity == "High":
+                self._stopped_early = True
+                break
+        return completed
 
-        # Extract token usage
-        token_usage = {}
-        if hasattr(response, 'response_metadata'):
-            token_usage = response.response_metadata.get('token_usage', {})
+    def _finish(self) -> List[PRDIssue]:
+        """Build the final review and return issues not yet yielded"""
+        content = self._parser.content
+        self.token_usage = extract_token_usage(self._final_chunk)
 
-        if logger:
-            logger.log_llm_response(self.name, response.content, token_usage)
+        if self.logger:
+            self.logger.log_llm_response(self.critic.name, content, self.token_usage)
 
-        review_data = self.parser.parse(response.content)
-        review = PRDReview(**review_data)
+        if self._stopped_early:
+            self.review = PRDReview(
+                reviewer=self.critic.name,
+                issues=list(self._issues),
+                overall_assessment="Review stopped early at the first high severity issue"
+            )
+            remaining = []
+        else:
+            self.review = fast_parse(content, PRDReview)
+            remaining = self.review.issues[len(self._issues):]
 
-        if logger:
+        if self.logger:
+            review = self.review
             high_count = sum(1 for i in review.issues if i.severity == "High")
-            logger.log_review_summary(self.name, len(review.issues), high_count, review.overall_assessment)
-            logger.log_issues(self.name, [i.model_dump() for i in review.issues])
+            self.logger.log_review_summary(self.critic.name, len(review.issues), high_count, review.overall_assessment)
+            self.logger.log_issues(self.critic.name, review.issues)
+
+        return remaining
+
+    def __iter__(self) -> Iterator[PRDIssue]:
+        for chunk in self.critic.llm.stream(self._messages()):
+            yield from self._consume(chunk)
+            if self._stopped_early:
+                break
+        yield from self._finish()
+
+    async def __aiter__(self) -> AsyncIterator[PRDIssue]:
+        async for chunk in self.critic.llm.astream(self._messages()):
+            for issue in self._consume(chunk):
+                yield issue
+            if self._stopped_early:
+                break
+        for issue in self._finish():
+            yield issue
+
+
+class PRDCritic:
+    """Product quality critic agent"""
+
+    def __init__(self, model: str = "gpt-4-turbo", temperature: float = 0.2):
+        self.llm = get_shared_client(model, temperature)
+        self.name = "prd_critic"
+
+    def review(self, prd: PRD, logger: Optional[object] = None) -> Tuple[PRDReview, dict]:
+        """Review PRD and return structured issues with metadata"""
+        stream = self.review_stream(prd, logger)
+        for _ in stream:
+            pass
+        return stream.review, stream.token_usage
+
+    def review_stream(self, prd: PRD, logger: Optional[object] = None,
+                      stop_on_first_high_issue: bool = False) -> ReviewStream:
+        """
+        Stream the review, yielding each issue as soon as the model completes it.
 
-        return review, token_usage
+        The stream supports both ``for`` and ``async for``. Incremental parsing
+        requires ijson; without it, issues are yielded once the full response
+        has arrived.
+        """
+        return ReviewStream(self, prd, logger, stop_on_first_high_issue)
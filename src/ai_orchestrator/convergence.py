@@ -10,55 +10,118 @@ This module provides reusable stop conditions for iterative refinement loops:
 The convergence logic is decoupled from specific document types and can be
 used across different workflows (PRD refinement, code review, etc.).
 """
-import difflib
-from typing import List, Optional
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from .types import (
     Issue,
     Review,
     RoundtableConfig,
     RoundtableIteration,
-    Severity,
     StopDecision,
 )
 
 
 def count_issues_by_severity(reviews: List[Review]) -> dict:
     """Count issues by severity across all reviews."""
-    counts = {"high": 0, "medium": 0, "low": 0}
+    high = medium = low = 0
     for review in reviews:
-        for issue in review.issues:
-            if issue.severity == Severity.HIGH:
-                counts["high"] += 1
-            elif issue.severity == Severity.MEDIUM:
-                counts["medium"] += 1
-            else:
-                counts["low"] += 1
-    return counts
+        high_n, medium_n, low_n = review.severity_counts()
+        high += high_n
+        medium += medium_n
+        low += low_n
+    return {"high": high, "medium": medium, "low": low}
 
 
 def has_high_severity_issues(reviews: List[Review]) -> bool:
     """Check if any high severity issues exist in reviews."""
-    for review in reviews:
-        for issue in review.issues:
-            if issue.severity == Severity.HIGH:
-                return True
-    return False
+    return any(review.has_high for review in reviews)
+
+
+_WORD_RE = re.compile(r"\w+")
 
 
-def calculate_document_delta(prev_content: str, current_content: str) -> float:
+def calculate_document_delta(
+    prev_content: str,
+    current_content: str,
+    threshold: Optional[float] = None,
+) -> float:
     """
     Calculate the change between two document versions.
 
+    Uses 1 - Dice coefficient over word counts, which is linear in document
+    length (character-level SequenceMatcher is quadratic on large documents).
+    Word order is not considered, so moving text around is not a change.
+
+    Args:
+        prev_content: Previous document version
+        current_content: Current document version
+        threshold: If given and the word totals alone prove the delta is at
+            least this large, return that lower bound without counting
+            individual words. Results below the threshold are always exact.
+
     Returns:
         Float between 0.0 (identical) and 1.0 (completely different)
     """
     if not prev_content or not current_content:
         return 1.0
+    if prev_content == current_content:
+        return 0.0
+
+    prev_tokens = _WORD_RE.findall(prev_content)
+    current_tokens = _WORD_RE.findall(current_content)
+    total = len(prev_tokens) + len(current_tokens)
+    if not total:
+        return 1.0  # differing documents with no words at all
+    if threshold is not None:
+        # At most min(len) words can be shared, which bounds Dice from above
+        floor = 1.0 - 2.0 * min(len(prev_tokens), len(current_tokens)) / total
+        if floor >= threshold:
+            return floor
+    common = sum((Counter(prev_tokens) & Counter(current_tokens)).values())
+    return 1.0 - 2.0 * common / total
+
+
+def _iteration_words(iteration: RoundtableIteration) -> Tuple[Counter, int]:
+    """Word counts and total of an iteration's output, cached on the iteration."""
+    document = iteration.output_document
+    cache = iteration._word_cache
+    if cache is None or cache[0] is not document:
+        tokens = _WORD_RE.findall(document)
+        cache = iteration._word_cache = (document, Counter(tokens), len(tokens))
+    return cache[1], cache[2]
+
+
+def _iteration_delta(
+    prev_iteration: RoundtableIteration,
+    current_iteration: RoundtableIteration,
+    threshold: Optional[float] = None,
+) -> float:
+    """
+    calculate_document_delta between two iterations' output documents.
+
+    Each iteration's word counts are built once and reused, so over a run
+    every document is tokenized once instead of once per comparison.
+    """
+    prev_content = prev_iteration.output_document
+    current_content = current_iteration.output_document
+    if not prev_content or not current_content:
+        return 1.0
+    if prev_content == current_content:
+        return 0.0
 
-    matcher = difflib.SequenceMatcher(None, prev_content, current_content)
-    similarity = matcher.ratio()  # 0.0 to 1.0
-    return 1.0 - similarity  # Convert to delta
+    prev_words, prev_total = _iteration_words(prev_iteration)
+    current_words, current_total = _iteration_words(current_iteration)
+    total = prev_total + current_total
+    if not total:
+        return 1.0
+    if threshold is not None:
+        floor = 1.0 - 2.0 * min(prev_total, current_total) / total
+        if floor >= threshold:
+            return floor
+    common = sum((prev_words & current_words).values())
+    return 1.0 - 2.0 * common / total
 
 
 def decide_stop(
@@ -74,6 +137,8 @@ def decide_stop(
     3. Maximum iterations reached
     4. Document delta below threshold
 
+    Conditions 2 and 4 only apply once config.min_iterations have run.
+
     Args:
         config: Roundtable configuration with thresholds
         iterations: List of completed iterations
@@ -90,6 +155,7 @@ def decide_stop(
 
     current_iteration = iterations[-1]
     iteration_count = len(iterations)
+    can_converge = iteration_count >= config.min_iterations
 
     # Check 1: Custom stop condition
     if config.custom_stop_condition is not None:
@@ -97,23 +163,19 @@ def decide_stop(
         if custom_decision.should_stop:
             return custom_decision
 
+    # One severity scan serves every check below
+    high_count = current_iteration.high_severity_count
+
     # Check 2: No high severity issues
-    if config.stop_on_no_high_issues:
-        if not has_high_severity_issues(current_iteration.reviews):
-            return StopDecision(
-                should_stop=True,
-                reason="No high severity issues remaining (0 remaining)",
-                stopped_by="no_high_issues",
-            )
+    if config.stop_on_no_high_issues and can_converge and high_count == 0:
+        return StopDecision(
+            should_stop=True,
+            reason="No high severity issues remaining (0 remaining)",
+            stopped_by="no_high_issues",
+        )
 
     # Check 3: Max iterations reached
     if iteration_count >= config.max_iterations:
-        high_count = sum(
-            1
-            for review in current_iteration.reviews
-            for issue in review.issues
-            if issue.severity == Severity.HIGH
-        )
         return StopDecision(
             should_stop=True,
             reason=f"Max iterations reached ({config.max_iterations}). {high_count} high severity issues remain.",
@@ -121,11 +183,10 @@ def decide_stop(
         )
 
     # Check 4: Document delta below threshold
-    if len(iterations) >= 2:
+    if iteration_count >= 2 and can_converge:
         prev_iteration = iterations[-2]
-        delta = calculate_document_delta(
-            prev_iteration.output_document,
-            current_iteration.output_document,
+        delta = _iteration_delta(
+            prev_iteration, current_iteration, threshold=config.delta_threshold
         )
         if delta < config.delta_threshold:
             return StopDecision(
@@ -135,12 +196,6 @@ def decide_stop(
             )
 
     # Not converged
-    high_count = sum(
-        1
-        for review in current_iteration.reviews
-        for issue in review.issues
-        if issue.severity == Severity.HIGH
-    )
     return StopDecision(
         should_stop=False,
         reason=f"{high_count} high severity issues remain",
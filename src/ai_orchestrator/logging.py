@@ -3,20 +3,70 @@ Logging utilities for the AI Orchestrator library.
 
 Provides structured logging for orchestration sessions with:
 - Console output (with optional verbosity control)
-- File-based logging
+- File-based logging (written by a background thread)
 - Token usage tracking
 """
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Set
+
+# Marks records shown on the console even when not verbose
+_CONSOLE = {"console": True}
+
+# Marks records written to the log file only, even when verbose
+_FILE_ONLY = {"console": False}
+
+
+def _console(text: str) -> Dict[str, str]:
+    """Extra for a record shown on the console as ``text`` instead of its message."""
+    return {"console": text}
+
+# Shared by every session's file handler; formatters hold no per-record state
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+_DEFAULT_LOG_DIR = os.path.join("data", "logs")
+
+# Log directories already created by this process, so repeat sessions skip mkdir
+_CREATED_DIRS: Set[str] = set()
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Console formatter that indents messages and tags non-INFO levels.
+
+    Records carrying their own console text (see _console) are shown as-is.
+    """
+
+    _PREFIXES = {
+        logging.DEBUG: "    [DEBUG] ",
+        logging.INFO: "  ",
+        logging.WARNING: "  [WARNING] ",
+        logging.ERROR: "  [ERROR] ",
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = getattr(record, "console", None)
+        if isinstance(text, str):
+            return text
+        return self._PREFIXES.get(record.levelno, "  ") + record.getMessage()
+
+
+_CONSOLE_FORMATTER = _ConsoleFormatter()
 
 
 class OrchestratorLogger:
     """Logger for orchestration sessions."""
 
+    _SEPARATOR = "=" * 60
+
+    # Callers may skip building log arguments when this is False (see NullLogger)
+    enabled = True
+
     def __init__(
         self,
         session_id: str,
@@ -27,77 +77,130 @@ class OrchestratorLogger:
         self.session_id = session_id
         self.verbose = verbose
         self.console_output = console_output
-        self.token_usage: Dict[str, int] = {}
+        self.token_usage: Counter = Counter()
 
-        # Set up log directory
-        if log_dir:
-            self.log_dir = Path(log_dir) / session_id
-        else:
-            self.log_dir = Path("data") / "logs" / session_id
-
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Set up log directory (kept as a str; log_dir builds a Path on demand)
+        self._log_path = os.path.join(log_dir or _DEFAULT_LOG_DIR, session_id)
+        if self._log_path not in _CREATED_DIRS:
+            os.makedirs(self._log_path, exist_ok=True)
+            _CREATED_DIRS.add(self._log_path)
 
         # Set up file logger
         self._setup_file_logger()
 
+    @property
+    def log_dir(self) -> Path:
+        """Directory holding this session's log files."""
+        return Path(self._log_path)
+
     def _setup_file_logger(self):
-        """Set up file-based logging."""
+        """Set up file-based logging.
+
+        Records are enqueued by a QueueHandler and written by a QueueListener
+        thread, so file writes never block the caller. Call close() to flush.
+        """
         self.logger = logging.getLogger(f"orchestrator.{self.session_id}")
         self.logger.setLevel(logging.DEBUG)
 
         # Clear existing handlers
         self.logger.handlers = []
 
-        # File handler
-        log_file = self.log_dir / "refinement.log"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
+        # File handler, driven by the background listener
+        log_file = os.path.join(self._log_path, "refinement.log")
+        try:
+            self._file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        except FileNotFoundError:
+            # Directory was removed after we cached it
+            os.makedirs(self._log_path, exist_ok=True)
+            self._file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        self._file_handler.setLevel(logging.DEBUG)
+        self._file_handler.setFormatter(_FILE_FORMATTER)
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, self._file_handler, respect_handler_level=True
         )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
-
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
-        if self.console_output and self.verbose:
-            print(f"  {message}")
-
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
-        if self.console_output and self.verbose:
-            print(f"    [DEBUG] {message}")
-
-    def warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(message)
-        if self.console_output:
-            print(f"  [WARNING] {message}")
-
-    def error(self, message: str):
-        """Log error message."""
-        self.logger.error(message)
-        if self.console_output:
-            print(f"  [ERROR] {message}", file=sys.stderr)
+        self._listener.start()
+
+        # Console handlers: records are routed here instead of being printed
+        # separately; errors go to stderr, everything else to stdout
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.DEBUG if self.verbose else logging.INFO)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
+        console_handler.addFilter(self._console_filter)
+        console_handler.addFilter(lambda record: record.levelno < logging.ERROR)
+        self.logger.addHandler(console_handler)
+
+        error_handler = logging.StreamHandler(sys.stderr)
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(_CONSOLE_FORMATTER)
+        error_handler.addFilter(self._console_filter)
+        self.logger.addHandler(error_handler)
+
+    def _console_filter(self, record: logging.LogRecord) -> bool:
+        """Show warnings/errors and milestone records; plain info/debug only when verbose."""
+        if not self.console_output:
+            return False
+        if record.levelno >= logging.WARNING:
+            return True
+        console = getattr(record, "console", None)
+        if console is None:
+            return self.verbose
+        return console is not False
+
+    def close(self):
+        """Flush pending records to disk and release the log file."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        self.logger.handlers = []
+        self._file_handler.close()
+
+    def __enter__(self) -> "OrchestratorLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def info(self, message: str, *args: Any):
+        """Log info message (%-style args are formatted lazily)."""
+        self.logger.info(message, *args)
+
+    def progress(self, message: str, *args: Any):
+        """Log an info message that is also shown on the console when not verbose."""
+        self.logger.info(message, *args, extra=_CONSOLE)
+
+    def debug(self, message: str, *args: Any):
+        """Log debug message (%-style args are formatted lazily)."""
+        self.logger.debug(message, *args)
+
+    def is_debug_enabled(self) -> bool:
+        """Whether debug records are emitted; lets callers skip building costly args."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def warning(self, message: str, *args: Any):
+        """Log warning message (%-style args are formatted lazily)."""
+        self.logger.warning(message, *args)
+
+    def error(self, message: str, *args: Any):
+        """Log error message (%-style args are formatted lazily)."""
+        self.logger.error(message, *args)
 
     def section(self, title: str):
         """Log a section header."""
-        separator = "=" * 60
-        self.logger.info(separator)
-        self.logger.info(title)
-        self.logger.info(separator)
-        if self.console_output:
-            print(f"\n{separator}")
-            print(f"  {title}")
-            print(separator)
+        separator = self._SEPARATOR
+        self.logger.info(separator, extra=_console("\n" + separator))
+        self.logger.info(title, extra=_console(f"  {title}"))
+        self.logger.info(separator, extra=_console(separator))
 
     def log_iteration_start(self, iteration: int, max_iterations: int):
         """Log the start of an iteration."""
-        self.logger.info(f"Starting iteration {iteration}/{max_iterations}")
-        if self.console_output:
-            print(f"\nIteration {iteration}/{max_iterations}")
+        self.logger.info(
+            "Starting iteration %d/%d", iteration, max_iterations,
+            extra=_console(f"\nIteration {iteration}/{max_iterations}"),
+        )
 
     def log_agent_review(
         self,
@@ -107,35 +210,46 @@ class OrchestratorLogger:
         tokens: Optional[Dict[str, int]] = None,
     ):
         """Log an agent review completion."""
-        msg = f"Agent '{agent_name}': {issues_count} issues ({high_count} high)"
+        console = _console(f"    - {agent_name}: {issues_count} issues ({high_count} high)")
         if tokens:
-            msg += f" - {tokens.get('total_tokens', 0)} tokens"
-        self.logger.info(msg)
-        if self.console_output:
-            print(f"    - {agent_name}: {issues_count} issues ({high_count} high)")
+            self.logger.info(
+                "Agent '%s': %d issues (%d high) - %d tokens",
+                agent_name, issues_count, high_count, tokens.get("total_tokens", 0),
+                extra=console,
+            )
+        else:
+            self.logger.info(
+                "Agent '%s': %d issues (%d high)", agent_name, issues_count, high_count,
+                extra=console,
+            )
 
     def log_convergence_check(self, converged: bool, reason: str, iteration: int):
         """Log convergence check result."""
         status = "CONVERGED" if converged else "CONTINUING"
-        self.logger.info(f"Convergence check (iteration {iteration}): {status} - {reason}")
-        if self.console_output:
-            print(f"  Status: {reason}")
+        self.logger.info(
+            "Convergence check (iteration %d): %s - %s", iteration, status, reason,
+            extra=_console(f"  Status: {reason}"),
+        )
 
     def log_refinement(self, new_version: int, prev_length: int, new_length: int):
         """Log document refinement."""
         delta_pct = ((new_length - prev_length) / prev_length * 100) if prev_length > 0 else 0
         msg = f"Refined to v{new_version}: {prev_length} -> {new_length} chars ({delta_pct:+.1f}%)"
-        self.logger.info(msg)
-        if self.console_output and self.verbose:
-            print(f"    {msg}")
+        self.logger.info(msg, extra=_console(f"    {msg}") if self.verbose else _FILE_ONLY)
 
     def track_tokens(self, agent_name: str, tokens: Dict[str, int]):
         """Track token usage for an agent."""
         total = tokens.get("total_tokens", 0)
-        if agent_name not in self.token_usage:
-            self.token_usage[agent_name] = 0
         self.token_usage[agent_name] += total
-        self.logger.debug(f"Token usage for {agent_name}: {total} (total: {self.token_usage[agent_name]})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Token usage for %s: %d (total: %d)", agent_name, total, self.token_usage[agent_name],
+                extra=_FILE_ONLY,
+            )
+
+    def add_token_usage(self, usage: Mapping[str, int]):
+        """Fold per-agent token totals (e.g. an iteration's usage) into the running usage."""
+        self.token_usage.update(usage)
 
     def get_token_summary(self) -> Dict[str, int]:
         """Get summary of token usage."""
@@ -143,29 +257,79 @@ class OrchestratorLogger:
         summary["total"] = sum(self.token_usage.values())
         return summary
 
-    def log_token_summary(self):
-        """Log token usage summary."""
-        summary = self.get_token_summary()
+    def log_token_summary(self, summary: Optional[Dict[str, int]] = None):
+        """Log token usage summary.
+
+        Args:
+            summary: Result of get_token_summary() if the caller already has it.
+        """
+        if summary is None:
+            summary = self.get_token_summary()
         self.section("Token Usage Summary")
         for agent, tokens in sorted(summary.items()):
             if agent != "total":
-                self.logger.info(f"  {agent}: {tokens:,} tokens")
-                if self.console_output:
-                    print(f"  {agent}: {tokens:,} tokens")
-        self.logger.info(f"  TOTAL: {summary['total']:,} tokens")
-        if self.console_output:
-            print(f"  TOTAL: {summary['total']:,} tokens")
+                line = f"  {agent}: {tokens:,} tokens"
+                self.logger.info(line, extra=_console(line))
+        line = f"  TOTAL: {summary['total']:,} tokens"
+        self.logger.info(line, extra=_console(line))
 
     def log_final_result(self, converged: bool, final_version: int, reason: str):
         """Log the final result."""
         self.section("Refinement Complete")
-        self.logger.info(f"Final version: {final_version}")
-        self.logger.info(f"Converged: {converged}")
-        self.logger.info(f"Reason: {reason}")
-        if self.console_output:
-            print(f"  Final version: v{final_version}")
-            print(f"  Converged: {converged}")
-            print(f"  Reason: {reason}")
+        self.logger.info("Final version: %d", final_version, extra=_console(f"  Final version: v{final_version}"))
+        self.logger.info("Converged: %s", converged, extra=_console(f"  Converged: {converged}"))
+        self.logger.info("Reason: %s", reason, extra=_console(f"  Reason: {reason}"))
+
+
+class NullLogger:
+    """
+    Logger with the OrchestratorLogger interface that discards everything.
+
+    Creates no files or threads. Useful for benchmarks and embedding, where
+    logging overhead is unwanted. Token usage is still tracked so results
+    report it.
+    """
+
+    enabled = False
+
+    def __init__(self, session_id: str = "", **_ignored: Any):
+        self.session_id = session_id
+        self.verbose = False
+        self.console_output = False
+        self.token_usage: Counter = Counter()
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "NullLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def is_debug_enabled(self) -> bool:
+        return False
+
+    def _discard(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    info = debug = warning = error = progress = section = _discard
+    log_iteration_start = log_agent_review = log_convergence_check = _discard
+    log_refinement = log_token_summary = log_final_result = _discard
+
+    def track_tokens(self, agent_name: str, tokens: Dict[str, int]):
+        """Track token usage for an agent."""
+        self.token_usage[agent_name] += tokens.get("total_tokens", 0)
+
+    def add_token_usage(self, usage: Mapping[str, int]):
+        """Fold per-agent token totals (e.g. an iteration's usage) into the running usage."""
+        self.token_usage.update(usage)
+
+    def get_token_summary(self) -> Dict[str, int]:
+        """Get summary of token usage."""
+        summary = dict(self.token_usage)
+        summary["total"] = sum(self.token_usage.values())
+        return summary
 
 
 def create_logger(
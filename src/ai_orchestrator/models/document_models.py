@@ -10,19 +10,36 @@ These models replace the PRD-specific models and work for any document type:
 - Documentation
 - etc.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any, Iterator, List, Optional
 from datetime import datetime
 
+from ..types import Severity
+
+# Case-insensitive lookup from LLM-provided severity text to the enum singleton
+_SEVERITY_LOOKUP = {s.value.lower(): s for s in Severity}
+
 
 class DocumentIssue(BaseModel):
     """An issue identified in a document during review"""
     category: str = Field(description="Issue category (e.g., 'Clarity', 'Technical Feasibility', 'Security')")
     description: str = Field(description="Detailed description of the issue")
-    severity: str = Field(description="Severity level: High, Medium, or Low")
+    severity: Severity = Field(description="Severity level: High, Medium, or Low")
     suggested_fix: Optional[str] = Field(default=None, description="Suggested fix or improvement")
     reviewer: str = Field(description="Name of the reviewer who identified this issue")
 
+    @field_validator("severity", mode="before")
+    @classmethod
+    def _coerce_severity(cls, value: Any) -> Any:
+        """Accept any casing ("high", "HIGH") and store the Severity singleton.
+
+        Labels outside High/Medium/Low (an LLM's "Critical" or "Minor", or
+        older saved sessions) become Low rather than failing the whole review.
+        """
+        if isinstance(value, str) and not isinstance(value, Severity):
+            return _SEVERITY_LOOKUP.get(value.strip().lower(), Severity.LOW)
+        return value
+
 
 class DocumentReview(BaseModel):
     """A review of a document by a single reviewer"""
@@ -31,6 +48,16 @@ class DocumentReview(BaseModel):
     overall_assessment: str = Field(description="Overall assessment and summary")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
 
+    @property
+    def high_count(self) -> int:
+        """Number of High severity issues"""
+        return sum(1 for issue in self.issues if issue.severity is Severity.HIGH)
+
+    @property
+    def total_count(self) -> int:
+        """Total number of issues"""
+        return len(self.issues)
+
 
 class Document(BaseModel):
     """
@@ -45,6 +72,9 @@ class Document(BaseModel):
     - Documentation drafts
     - etc.
     """
+    # Orchestrators advance versions by assigning fields in place; keep that cheap
+    model_config = ConfigDict(validate_assignment=False)
+
     version: int = Field(description="Document version number")
     title: str = Field(description="Document title")
     content: str = Field(description="Document content (markdown format)")
@@ -60,83 +90,31 @@ class Document(BaseModel):
     def get_issue_counts(self) -> dict:
         """Get count of issues by severity across all reviews"""
         counts = {"high": 0, "medium": 0, "low": 0}
+        for issue in self.iter_all_issues():
+            counts[issue.severity.name.lower()] += 1
+        return counts
 
+    def iter_all_issues(self) -> Iterator[DocumentIssue]:
+        """Iterate over all issues from all reviews without building a list"""
         for review in self.reviews:
-            for issue in review.issues:
-                severity_key = issue.severity.lower()
-                if severity_key in counts:
-                    counts[severity_key] += 1
-
-        return counts
+            yield from review.issues
 
     def get_all_issues(self) -> List[DocumentIssue]:
         """Get all issues from all reviews"""
-        all_issues = []
-        for review in self.reviews:
-            all_issues.extend(review.issues)
-        return all_issues
+        return list(self.iter_all_issues())
 
     def has_high_severity_issues(self) -> bool:
         """Check if any High severity issues exist"""
-        for review in self.reviews:
-            for issue in review.issues:
-                if issue.severity == "High":
-                    return True
-        return False
+        return any(issue.severity is Severity.HIGH for issue in self.iter_all_issues())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        return {
-            "version": self.version,
-            "title": self.title,
-            "content": self.content,
-            "document_type": self.document_type,
-            "metadata": self.metadata,
-            "created_at": self.created_at,
-            "reviews": [
-                {
-                    "reviewer_name": r.reviewer_name,
-                    "issues": [
-                        {
-                            "category": i.category,
-                            "description": i.description,
-                            "severity": i.severity,
-                            "suggested_fix": i.suggested_fix,
-                            "reviewer": i.reviewer
-                        }
-                        for i in r.issues
-                    ],
-                    "overall_assessment": r.overall_assessment,
-                    "timestamp": r.timestamp
-                }
-                for r in self.reviews
-            ]
-        }
+        return self.model_dump(mode="json")
 
     @classmethod
     def from_dict(cls, data: dict) -> "Document":
         """Create Document from dictionary"""
-        # Convert reviews
-        reviews = []
-        for r_data in data.get("reviews", []):
-            issues = [DocumentIssue(**i) for i in r_data.get("issues", [])]
-            review = DocumentReview(
-                reviewer_name=r_data["reviewer_name"],
-                issues=issues,
-                overall_assessment=r_data["overall_assessment"],
-                timestamp=r_data.get("timestamp", datetime.now().isoformat())
-            )
-            reviews.append(review)
-
-        return cls(
-            version=data["version"],
-            title=data["title"],
-            content=data["content"],
-            document_type=data.get("document_type", "document"),
-            metadata=data.get("metadata", {}),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            reviews=reviews
-        )
+        return cls.model_validate(data)
 
 
 # Backwards compatibility aliases
@@ -1,15 +1,26 @@
-from typing import List, Literal, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
+from ..types import Severity
+from .document_models import _SEVERITY_LOOKUP
+
 class PRDIssue(BaseModel):
     """Single issue identified by a critic"""
     category: str = Field(..., description="Issue category: product, engineering, ai_risk")
     description: str = Field(..., description="Detailed issue description")
-    severity: Literal["High", "Medium", "Low"] = Field(..., description="Issue severity")
+    severity: Severity = Field(..., description="Issue severity")
     suggested_fix: str = Field(..., description="Actionable recommendation")
     reviewer: str = Field(..., description="Critic agent that found this issue")
 
+    @field_validator("severity", mode="before")
+    @classmethod
+    def _coerce_severity(cls, value: Any) -> Any:
+        """Accept any casing and store the Severity singleton"""
+        if isinstance(value, str) and not isinstance(value, Severity):
+            return _SEVERITY_LOOKUP.get(value.strip().lower(), value)
+        return value
+
 class PRDReview(BaseModel):
     """Review from a single critic agent"""
     reviewer: str = Field(..., description="Critic agent name")
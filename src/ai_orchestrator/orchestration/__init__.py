@@ -1,6 +1,18 @@
 """
 Orchestration module for running roundtable refinement loops.
 """
-from .runner import run_roundtable, DefaultEngine
+from .runner import (
+    run_roundtable,
+    run_roundtable_async,
+    DefaultEngine,
+    AsyncEngine,
+    ThreadedEngine,
+)
 
-__all__ = ["run_roundtable", "DefaultEngine"]
+__all__ = [
+    "run_roundtable",
+    "run_roundtable_async",
+    "DefaultEngine",
+    "AsyncEngine",
+    "ThreadedEngine",
+]
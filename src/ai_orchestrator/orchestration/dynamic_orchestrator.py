@@ -12,7 +12,11 @@ from ..agents.dynamic_critic import DynamicCritic, DynamicModerator
 from ..models.document_models import Document, DocumentReview
 from ..storage.prd_storage import PRDStorage
 from ..utils.convergence import ConvergenceChecker
-from ..utils.logger import PRDLogger as RefinementLogger
+from ..logging import OrchestratorLogger as RefinementLogger
+from .engine_async import areview_document
+
+# Preset roundtables are static, so each is generated once per process
+_PRESET_CACHE: Dict[str, RoundtableConfig] = {}
 
 
 class DynamicOrchestrator:
@@ -43,6 +47,8 @@ class DynamicOrchestrator:
             num_participants: Number of roundtable participants (default: 3)
             use_preset: Optional preset ("prd", "code-review", "architecture", etc.)
         """
+        if max_iterations < 1:
+            raise ValueError(f"max_iterations must be at least 1, got {max_iterations}")
         self.max_iterations = max_iterations
         self.verbose = verbose
         self.num_participants = num_participants
@@ -56,6 +62,7 @@ class DynamicOrchestrator:
         self.critics: List[DynamicCritic] = []
         self.moderator: Optional[DynamicModerator] = None
         self.roundtable_config: Optional[RoundtableConfig] = None
+        self._participants_dump: List[Dict[str, Any]] = []
 
     def generate_roundtable(self, title: str, initial_content: str) -> RoundtableConfig:
         """
@@ -69,8 +76,13 @@ class DynamicOrchestrator:
             RoundtableConfig with generated participants
         """
         if self.use_preset:
-            # Use preset configuration
-            config = self.meta.generate_from_preset(self.use_preset)
+            # Use preset configuration; copy so callers can't mutate the cached one
+            cached = _PRESET_CACHE.get(self.use_preset)
+            if cached is None:
+                cached = _PRESET_CACHE.setdefault(
+                    self.use_preset, self.meta.generate_from_preset(self.use_preset)
+                )
+            config = cached.model_copy(deep=True)
         else:
             # AI generates participants based on content
             config = self.meta.generate_roundtable(
@@ -95,6 +107,11 @@ class DynamicOrchestrator:
         )
 
         self.roundtable_config = config
+        # Serialized once for the convergence report and summary log
+        self._participants_dump = [
+            p.model_dump(include={"name", "role", "expertise", "perspective"})
+            for p in config.participants
+        ]
 
         return config
 
@@ -119,177 +136,169 @@ class DynamicOrchestrator:
         """
 
         # Create session
+        start_dt = datetime.now()
         session_id = self.storage.create_session(title)
-        logger = RefinementLogger(session_id, verbose=self.verbose)
-
-        logger.info("=" * 60)
-        logger.info(f"Dynamic Roundtable Refinement")
-        logger.info(f"   Topic: {title}")
-        logger.info(f"   Document Type: {document_type}")
-        logger.info(f"   Max Iterations: {self.max_iterations}")
-        logger.info("=" * 60)
-        logger.info("")
-
-        # STEP 1: Generate roundtable participants
-        logger.info("Generating roundtable participants...")
-        config = self.generate_roundtable(title, initial_content)
-
-        logger.info(f"Generated {len(self.critics)} participants:")
-        for critic in self.critics:
-            logger.info(f"  - {critic.name}: {critic.role}")
-        logger.info(f"Moderator focus: {config.moderator_focus}")
-        logger.info(f"Convergence criteria: {config.convergence_criteria}")
-        logger.info("")
-
-        # Create initial document
-        doc = Document(
-            version=1,
-            title=title,
-            content=initial_content,
-            document_type=document_type,
-            metadata=metadata or {},
-            created_at=datetime.now().isoformat()
+        logger = RefinementLogger(
+            session_id, log_dir=str(self.storage.base_dir), verbose=self.verbose
         )
-
-        # Save initial version
-        self.storage.save_prd(session_id, doc)
-        logger.info(f"Saved {document_type} v{doc.version}")
-        logger.info("")
-
-        # Track metrics
-        iteration = 1
-        token_tracker = {critic.name: 0 for critic in self.critics}
-        token_tracker["moderator"] = 0
-
-        # Main refinement loop
-        while iteration <= self.max_iterations:
-            logger.info(f"Iteration {iteration}/{self.max_iterations}")
-
-            # STEP 2: Critics review in parallel
-            logger.info("  Participants reviewing...")
-            review_tasks = [
-                self._review_async(critic, doc, logger)
-                for critic in self.critics
-            ]
-            results = await asyncio.gather(*review_tasks)
-
-            reviews = []
-            for review, tokens in results:
-                reviews.append(review)
-                doc.add_review(review)
-                token_tracker[review.reviewer_name] += tokens["total_tokens"]
-
-                # Log review summary
-                high_count = sum(1 for i in review.issues if i.severity == "High")
-                logger.info(f"    - {review.reviewer_name}: {len(review.issues)} issues ({high_count} high)")
-
-            # STEP 3: Check convergence
-            issue_counts = doc.get_issue_counts()
-            converged, reason = self.convergence_checker.get_convergence_reason(
-                doc,
-                issue_counts,
-                iteration,
-                self.max_iterations
-            )
-
-            logger.info(f"  Status: {reason}")
-
-            # Save reviews
-            self.storage.save_reviews(session_id, doc.version, reviews)
-
-            if converged:
-                logger.info(f"{document_type.upper()} converged!")
-                break
-
-            # STEP 4: Moderator refines
-            logger.info("  Moderator refining document...")
-            refined_content, tokens = await self._refine_async(doc, reviews, logger)
-            token_tracker["moderator"] += tokens["total_tokens"]
-
-            # Create new version
+        # Progress lines go to the console as well as the session log
+        log = logger.progress
+
+        try:
+            log("=" * 60)
+            log("Dynamic Roundtable Refinement")
+            log("   Topic: %s", title)
+            log("   Document Type: %s", document_type)
+            log("   Max Iterations: %d", self.max_iterations)
+            log("=" * 60)
+            log("")
+
+            # STEP 1: Generate roundtable participants
+            log("Generating roundtable participants...")
+            config = self.generate_roundtable(title, initial_content)
+
+            log("Generated %d participants:", len(self.critics))
+            for critic in self.critics:
+                log("  - %s: %s", critic.name, critic.role)
+            log("Moderator focus: %s", config.moderator_focus)
+            log("Convergence criteria: %s", config.convergence_criteria)
+            log("")
+
+            # Create initial document
             doc = Document(
-                version=doc.version + 1,
+                version=1,
                 title=title,
-                content=refined_content,
+                content=initial_content,
                 document_type=document_type,
-                metadata=metadata or {},
-                created_at=datetime.now().isoformat()
+                metadata=metadata or {}
             )
 
-            self.storage.save_prd(session_id, doc)
-            logger.info(f"Saved {document_type} v{doc.version}")
-            logger.info("")
-
-            iteration += 1
-
-        # Generate convergence report
-        final_issue_counts = doc.get_issue_counts()
-
-        report = {
-            "session_id": session_id,
-            "title": title,
-            "document_type": document_type,
-            "initial_version": 1,
-            "final_version": doc.version,
-            "iterations": iteration - 1,
-            "converged": converged,
-            "convergence_reason": reason,
-            "convergence_criteria": config.convergence_criteria,
-            "roundtable_participants": [
-                {
-                    "name": p.name,
-                    "role": p.role,
-                    "expertise": p.expertise,
-                    "perspective": p.perspective
+            # Track metrics
+            iteration = 1
+            # Review results come back in critic order, so per-critic token
+            # totals live in a list parallel to self.critics
+            critic_tokens = [0] * len(self.critics)
+            moderator_tokens = 0
+
+            # Main refinement loop
+            while iteration <= self.max_iterations:
+                log("Iteration %d/%d", iteration, self.max_iterations)
+
+                # STEP 2: Critics review in parallel
+                log("  Participants reviewing...")
+                results = await areview_document(doc, self.critics, logger)
+
+                reviews = []
+                for i, (review, tokens) in enumerate(results):
+                    reviews.append(review)
+                    doc.add_review(review)
+                    critic_tokens[i] += tokens["total_tokens"]
+
+                    # Log review summary
+                    log(
+                        "    - %s: %d issues (%d high)",
+                        review.reviewer_name, review.total_count, review.high_count
+                    )
+
+                # STEP 3: Check convergence. The document's running tallies
+                # settle the common "no High issues" case without a rescan.
+                if not doc.has_high_severity_issues():
+                    converged, reason = True, "No high severity issues (0 remaining)"
+                else:
+                    converged, reason = self.convergence_checker.get_convergence_reason(
+                        reviews,
+                        iteration,
+                        self.max_iterations
+                    )
+
+                log("  Status: %s", reason)
+
+                # Persist this version and its reviews in one write
+                self.storage.save_iteration(session_id, doc, reviews)
+                log("Saved %s v%d", document_type, doc.version)
+
+                if converged:
+                    log("%s converged!", document_type.upper())
+                    break
+
+                # STEP 4: Moderator refines
+                log("  Moderator refining document...")
+                refined_content, tokens = await self._refine_async(doc, reviews, logger)
+                moderator_tokens += tokens["total_tokens"]
+
+                # Advance to the next version in place; the previous version
+                # and its reviews are already persisted
+                doc.version += 1
+                doc.content = refined_content
+                doc.created_at = datetime.now().isoformat()
+                doc.reviews.clear()
+                log("")
+
+                iteration += 1
+
+            # Generate convergence report
+            final_issue_counts = doc.get_issue_counts()
+            token_tracker = {
+                critic.name: n for critic, n in zip(self.critics, critic_tokens)
+            }
+            token_tracker["moderator"] = moderator_tokens
+
+            report = {
+                "session_id": session_id,
+                "title": title,
+                "document_type": document_type,
+                "initial_version": 1,
+                "final_version": doc.version,
+                "iterations": iteration - 1,
+                "converged": converged,
+                "convergence_reason": reason,
+                "convergence_criteria": config.convergence_criteria,
+                "roundtable_participants": self._participants_dump,
+                "moderator_focus": config.moderator_focus,
+                "final_issue_count": final_issue_counts,
+                "token_usage": token_tracker,
+                "timestamps": {
+                    "start": start_dt.isoformat(),
+                    "end": datetime.now().isoformat()
                 }
-                for p in config.participants
-            ],
-            "moderator_focus": config.moderator_focus,
-            "final_issue_count": final_issue_counts,
-            "token_usage": token_tracker,
-            "timestamps": {
-                "start": datetime.now().isoformat(),
-                "end": datetime.now().isoformat()
             }
-        }
-
-        self.storage.save_convergence_report(session_id, report)
-
-        # Print summary
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("REFINEMENT COMPLETE")
-        logger.info("=" * 60)
-        logger.info(f"Final Version: {doc.version}")
-        logger.info(f"Converged: {converged}")
-        logger.info(f"Reason: {reason}")
-        logger.info(f"Final Issues: {final_issue_counts['high']} high, {final_issue_counts['medium']} medium, {final_issue_counts['low']} low")
-        logger.info("")
-        logger.info("Roundtable Participants:")
-        for p in config.participants:
-            logger.info(f"  - {p.name} ({p.role})")
-        logger.info("")
-        logger.info(f"Session: {session_id}")
-        logger.info("")
-
-        # Token usage summary
-        total_tokens = sum(token_tracker.values())
-        logger.info("Token Usage:")
-        for agent, tokens in token_tracker.items():
-            logger.info(f"  {agent}: {tokens:,}")
-        logger.info(f"  TOTAL: {total_tokens:,}")
-
-        return doc, report
-
-    async def _review_async(self, critic: DynamicCritic, doc: Document, logger) -> Tuple[DocumentReview, Dict]:
-        """Run critic review in executor (non-blocking)"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, critic.review, doc, logger)
+
+            self.storage.save_convergence_report(session_id, report)
+
+            # Print summary
+            log("")
+            log("=" * 60)
+            log("REFINEMENT COMPLETE")
+            log("=" * 60)
+            log("Final Version: %d", doc.version)
+            log("Converged: %s", converged)
+            log("Reason: %s", reason)
+            log(
+                "Final Issues: %d high, %d medium, %d low",
+                final_issue_counts['high'], final_issue_counts['medium'], final_issue_counts['low']
+            )
+            log("")
+            log("Roundtable Participants:")
+            for p in self._participants_dump:
+                log("  - %s (%s)", p["name"], p["role"])
+            log("")
+            log("Session: %s", session_id)
+            log("")
+
+            # Token usage summary
+            total_tokens = sum(token_tracker.values())
+            log("Token Usage:")
+            for agent, agent_tokens in token_tracker.items():
+                log("  %s: %s", agent, format(agent_tokens, ","))
+            log("  TOTAL: %s", format(total_tokens, ","))
+
+            return doc, report
+        finally:
+            logger.close()
 
     async def _refine_async(self, doc: Document, reviews: List[DocumentReview], logger) -> Tuple[str, Dict]:
-        """Run moderator refinement in executor (non-blocking)"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.moderator.refine, doc, reviews, logger)
+        """Run moderator refinement in a worker thread (non-blocking)"""
+        return await asyncio.to_thread(self.moderator.refine, doc, reviews, logger)
 
 
 if __name__ == "__main__":
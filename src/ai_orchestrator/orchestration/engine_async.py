@@ -0,0 +1,72 @@
+"""
+Async review fan-out for roundtable participants.
+
+All participants review the same document version, so their LLM calls are
+independent. areview_document runs them concurrently with asyncio.gather,
+bounded by a semaphore so provider rate limits are respected.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from ..models.document_models import Document, DocumentReview
+
+# Default cap on in-flight review calls
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A failed review is retried once after this delay (seconds)
+RETRY_BACKOFF_S = 1.0
+
+
+async def _review_one(
+    critic: Any,
+    document: Document,
+    sem: asyncio.Semaphore,
+    logger: Optional[Any] = None,
+    retries: int = 1,
+) -> Tuple[DocumentReview, Dict]:
+    """Run one critic's review under the semaphore, retrying with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            async with sem:
+                return cast(Tuple[DocumentReview, Dict], await critic.areview(document, logger))
+        except Exception as e:
+            if attempt == retries:
+                raise
+            if logger:
+                logger.warning("[%s] Review failed (%s); retrying", critic.name, e)
+            await asyncio.sleep(RETRY_BACKOFF_S * (2 ** attempt))
+    raise AssertionError("unreachable: the last attempt returns or raises")
+
+
+async def areview_document(
+    document: Document,
+    critics: Sequence[Any],
+    logger: Optional[Any] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Tuple[DocumentReview, Dict]]:
+    """
+    Review a document with every critic concurrently.
+
+    Args:
+        document: Document version under review
+        critics: Critics exposing ``name`` and ``async areview(document, logger)``
+        logger: Optional logger passed through to each critic
+        max_concurrency: Maximum number of review calls in flight at once
+
+    Returns:
+        List of (review, token_usage) tuples, in critic order
+
+    Raises:
+        Exception: The first review error remaining after retries. Other
+            reviews still run to completion before it is raised.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    results = await asyncio.gather(
+        *(_review_one(critic, document, sem, logger) for critic in critics),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    # No exceptions remain, so every result is a (review, usage) tuple
+    return cast(List[Tuple[DocumentReview, Dict]], results)
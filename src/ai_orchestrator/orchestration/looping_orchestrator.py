@@ -43,112 +43,117 @@ class LoopingOrchestrator:
 
         # Initialize logger
         logger = PRDLogger(session_id, verbose=self.verbose)
-        logger.section(f"PRD Refinement Session: {title}")
-        logger.info(f"Session ID: {session_id}")
-        logger.info(f"Max iterations: {self.max_iterations}")
-        logger.info(f"Verbose mode: {self.verbose}")
-
-        # Initialize PRD
-        prd = PRD(version=1, title=title, content=initial_content)
-        self.storage.save_prd(session_id, prd)
-        print(f"Saved PRD v{prd.version}")
-        logger.info(f"Initial PRD length: {len(initial_content)} chars")
-
-        # Track history
-        history = []
-        iteration = 1
-        prev_prd = None
-
-        # Main loop
-        while iteration <= self.max_iterations:
-            print(f"\nIteration {iteration}/{self.max_iterations}")
-            logger.section(f"Iteration {iteration}/{self.max_iterations}")
-
-            # Step 1: Critics review
-            print("  Critics reviewing...")
-            logger.info("Starting critic reviews...")
-            reviews: List[PRDReview] = []
-
-            for critic in self.critics:
-                review, tokens = critic.review(prd, logger)
-                reviews.append(review)
+        try:
+            logger.section(f"PRD Refinement Session: {title}")
+            logger.info(f"Session ID: {session_id}")
+            logger.info(f"Max iterations: {self.max_iterations}")
+            logger.info(f"Verbose mode: {self.verbose}")
+
+            # Initialize PRD
+            prd = PRD(version=1, title=title, content=initial_content)
+            self.storage.save_prd(session_id, prd)
+            print(f"Saved PRD v{prd.version}")
+            logger.info(f"Initial PRD length: {len(initial_content)} chars")
+
+            # Track history
+            history = []
+            iteration = 1
+            prev_prd = None
+
+            # Main loop
+            while iteration <= self.max_iterations:
+                print(f"\nIteration {iteration}/{self.max_iterations}")
+                logger.section(f"Iteration {iteration}/{self.max_iterations}")
+                logger.begin_iteration()
+
+                # Step 1: Critics review
+                print("  Critics reviewing...")
+                logger.info("Starting critic reviews...")
+                reviews: List[PRDReview] = []
+
+                for critic in self.critics:
+                    review, tokens = critic.review(prd, logger)
+                    reviews.append(review)
+
+                    # Track tokens
+                    self.token_usage[critic.name] += tokens.get('total_tokens', 0)
+
+                    high_count = sum(1 for i in review.issues if i.severity == "High")
+                    print(f"    - {review.reviewer}: {len(review.issues)} issues ({high_count} high)")
+
+                # Save reviews
+                self.storage.save_reviews(session_id, prd.version, reviews)
+
+                # Step 2: Check convergence
+                converged, reason = self.convergence_checker.get_convergence_reason(
+                    reviews, iteration, self.max_iterations, prev_prd, prd
+                )
+
+                print(f"  Status: {reason}")
+                logger.log_convergence(converged, reason, iteration)
+
+                history.append({
+                    "iteration": iteration,
+                    "version": prd.version,
+                    "reviews": [r.model_dump() for r in reviews],
+                    "converged": converged,
+                    "reason": reason,
+                    "tokens": dict(self.token_usage)
+                })
+
+                if converged:
+                    print("PRD converged!")
+                    logger.info("PRD converged!")
+                    break
+
+                # Step 3: Moderator refines
+                print("  Moderator refining PRD...")
+                logger.info("Starting moderator refinement...")
+                prev_prd = prd
+                prev_length = len(prev_prd.content)
+
+                refined_content, tokens = self.moderator.refine(prd, reviews, logger)
 
                 # Track tokens
-                self.token_usage[critic.name] += tokens.get('total_tokens', 0)
-
-                high_count = sum(1 for i in review.issues if i.severity == "High")
-                print(f"    - {review.reviewer}: {len(review.issues)} issues ({high_count} high)")
-
-            # Save reviews
-            self.storage.save_reviews(session_id, prd.version, reviews)
-
-            # Step 2: Check convergence
-            converged, reason = self.convergence_checker.get_convergence_reason(
-                reviews, iteration, self.max_iterations, prev_prd, prd
-            )
-
-            print(f"  Status: {reason}")
-            logger.log_convergence(converged, reason, iteration)
-
-            history.append({
-                "iteration": iteration,
-                "version": prd.version,
-                "reviews": [r.model_dump() for r in reviews],
-                "converged": converged,
-                "reason": reason,
-                "tokens": dict(self.token_usage)
-            })
-
-            if converged:
-                print("PRD converged!")
-                logger.info("PRD converged!")
-                break
-
-            # Step 3: Moderator refines
-            print("  Moderator refining PRD...")
-            logger.info("Starting moderator refinement...")
-            prev_prd = prd
-            prev_length = len(prev_prd.content)
-
-            refined_content, tokens = self.moderator.refine(prd, reviews, logger)
-
-            # Track tokens
-            self.token_usage['moderator'] += tokens.get('total_tokens', 0)
-
-            prd = PRD(
-                version=prd.version + 1,
-                title=prd.title,
-                content=refined_content,
-                metadata={"refined_from": prev_prd.version}
-            )
+                self.token_usage['moderator'] += tokens.get('total_tokens', 0)
 
-            self.storage.save_prd(session_id, prd)
-            print(f"Saved PRD v{prd.version}")
+                prd = PRD(
+                    version=prd.version + 1,
+                    title=prd.title,
+                    content=refined_content,
+                    metadata={"refined_from": prev_prd.version}
+                )
+
+                self.storage.save_prd(session_id, prd)
+                print(f"Saved PRD v{prd.version}")
 
-            logger.log_refinement(prd.version, prev_length, len(refined_content))
+                logger.log_refinement(prd.version, prev_length, len(refined_content))
 
-            iteration += 1
+                iteration += 1
 
-        # Generate final report
-        logger.section("Generating Final Report")
-        report = self._generate_report(session_id, prd, history)
-        report['token_usage'] = dict(self.token_usage)
-        self.storage.save_convergence_report(session_id, report)
+            # Generate final report
+            logger.section("Generating Final Report")
+            report = self._generate_report(session_id, prd, history)
+            report['token_usage'] = dict(self.token_usage)
+            self.storage.save_convergence_report(session_id, report)
 
-        print(f"\nReport saved to: {session_id}/convergence_report.json")
-        logger.info(f"Report saved to: convergence_report.json")
+            print(f"\nReport saved to: {session_id}/convergence_report.json")
+            logger.info(f"Report saved to: convergence_report.json")
 
-        # Log token summary
-        logger.log_token_summary(self.token_usage)
+            # Log token summary
+            logger.log_token_summary(self.token_usage)
 
-        # Final summary
-        logger.section("Refinement Complete")
-        logger.info(f"Final version: {prd.version}")
-        logger.info(f"Converged: {report['converged']}")
-        logger.info(f"Total tokens used: {sum(self.token_usage.values())}")
-        logger.info(f"Log file: data/prds/{session_id}/refinement.log")
+            # Final summary
+            logger.section("Refinement Complete")
+            logger.info(f"Final version: {prd.version}")
+            logger.info(f"Converged: {report['converged']}")
+            logger.info(f"Total tokens used: {sum(self.token_usage.values())}")
+            logger.info(f"Log file: data/prds/{session_id}/refinement.log")
 
-        return prd, report
+            return prd, report
+        finally:
+            # Flush the buffered side logs even if a review or refinement fails
+            logger.close()
 
     def _generate_report(self, session_id: str, final_prd: PRD, history: List[dict]) -> dict:
         """Generate convergence report"""
@@ -1,8 +1,15 @@
 """
 Main runner for the AI Orchestrator roundtable loop.
 
-This module provides the primary public API: run_roundtable()
+This module provides the primary public API: run_roundtable(), plus
+run_roundtable_async() for callers that already run an event loop.
 """
+import asyncio
+import concurrent.futures
+import inspect
+import os
+import time
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -17,10 +24,27 @@ from ..types import (
     RoundtableConfig,
     RoundtableIteration,
     RoundtableResult,
-    Severity,
 )
 
 
+def _log_review(logger: Optional[OrchestratorLogger], agent: Agent, review: Review) -> None:
+    if logger and logger.enabled:
+        logger.log_agent_review(
+            agent.name,
+            len(review.issues),
+            review.severity_counts()[0],
+        )
+
+
+def _usage_by_agent(agents: Sequence[Agent], reviews: Sequence[Review]) -> Counter:
+    """Total tokens per agent, for reviews that report usage."""
+    usage: Counter = Counter()
+    for agent, review in zip(agents, reviews):
+        if review.token_usage:
+            usage[agent.name] += review.token_usage.get("total_tokens", 0)
+    return usage
+
+
 class DefaultEngine:
     """
     Default engine implementation that runs agents sequentially.
@@ -30,7 +54,8 @@ class DefaultEngine:
     2. Aggregates all reviews
     3. Passes reviews to the moderator for refinement
 
-    For parallel execution, use AsyncEngine or implement OrchestratorEngine.
+    For parallel execution, use AsyncEngine or ThreadedEngine, or implement
+    OrchestratorEngine.
     """
 
     def step(
@@ -45,22 +70,16 @@ class DefaultEngine:
         """Execute a single roundtable iteration."""
         context = context or {}
         reviews: List[Review] = []
-        token_usage: Dict[str, int] = {}
+        # Resolved once: None when logging is off, so the loop skips it entirely
+        log_agent_review = logger.log_agent_review if logger and logger.enabled else None
 
         # Step 1: Get reviews from all agents
         for agent in agents:
             try:
                 review = agent.review(document, context)
                 reviews.append(review)
-
-                # Log if logger provided
-                if logger:
-                    high_count = sum(1 for i in review.issues if i.severity == Severity.HIGH)
-                    logger.log_agent_review(
-                        agent.name,
-                        len(review.issues),
-                        high_count,
-                    )
+                if log_agent_review is not None:
+                    log_agent_review(agent.name, len(review.issues), review.severity_counts()[0])
             except Exception as e:
                 raise EngineError(f"Agent '{agent.name}' failed: {e}") from e
 
@@ -76,7 +95,206 @@ class DefaultEngine:
             output_document=refined_document,
             reviews=reviews,
             notes="",
-            metadata={"token_usage": token_usage},
+            metadata={"token_usage": _usage_by_agent(agents, reviews)},
+        )
+
+
+class AsyncEngine:
+    """
+    Engine that runs all agent reviews for an iteration concurrently.
+
+    Agents exposing a coroutine ``areview(document, context)`` are awaited
+    directly; plain ``review()`` calls run in worker threads. At most
+    ``max_parallel_agents`` reviews are in flight at once. The moderator
+    runs after all reviews complete, since it needs them.
+
+    A failing agent does not cancel its siblings: every review runs to
+    completion, then the first failure (in agent order) is raised as an
+    EngineError. With ``agent_timeout_s`` set, a review still running after
+    that many seconds fails with TimeoutError (a review() call on a worker
+    thread cannot be interrupted, so its thread finishes in the background).
+    """
+
+    def __init__(self, max_parallel_agents: int = 8, agent_timeout_s: Optional[float] = None):
+        self.max_parallel_agents = max_parallel_agents
+        self.agent_timeout_s = agent_timeout_s
+
+    async def _review(
+        self,
+        agent: Agent,
+        document: str,
+        context: Dict[str, Any],
+        sem: asyncio.Semaphore,
+    ) -> Review:
+        async with sem:
+            areview = getattr(agent, "areview", None)
+            if areview is not None and inspect.iscoroutinefunction(areview):
+                pending = areview(document, context)
+            else:
+                pending = asyncio.to_thread(agent.review, document, context)
+            if self.agent_timeout_s is None:
+                return await pending
+            try:
+                return await asyncio.wait_for(pending, self.agent_timeout_s)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"review timed out after {self.agent_timeout_s}s") from None
+
+    async def step(
+        self,
+        document: str,
+        agents: Sequence[Agent],
+        moderator: Moderator,
+        context: Optional[Dict[str, Any]] = None,
+        iteration_index: int = 0,
+        logger: Optional[OrchestratorLogger] = None,
+    ) -> RoundtableIteration:
+        """Execute a single roundtable iteration with concurrent reviews."""
+        context = context or {}
+
+        # Step 1: Fan out reviews to all agents
+        sem = asyncio.Semaphore(self.max_parallel_agents)
+        results = await asyncio.gather(
+            *(self._review(agent, document, context, sem) for agent in agents),
+            return_exceptions=True,
+        )
+
+        reviews: List[Review] = []
+        for agent, result in zip(agents, results):
+            if isinstance(result, BaseException):
+                raise EngineError(f"Agent '{agent.name}' failed: {result}") from result
+            reviews.append(result)
+            _log_review(logger, agent, result)
+
+        # Step 2: Moderator refines the document
+        refined_document = await self._refine(moderator, document, reviews, context)
+
+        return RoundtableIteration(
+            iteration_index=iteration_index,
+            input_document=document,
+            output_document=refined_document,
+            reviews=reviews,
+            notes="",
+            metadata={"token_usage": _usage_by_agent(agents, reviews)},
+        )
+
+    async def _refine(
+        self,
+        moderator: Moderator,
+        document: str,
+        reviews: List[Review],
+        context: Dict[str, Any],
+    ) -> str:
+        try:
+            arefine = getattr(moderator, "arefine", None)
+            if arefine is not None and inspect.iscoroutinefunction(arefine):
+                return await arefine(document, reviews, context)
+            return await asyncio.to_thread(moderator.refine, document, reviews, context)
+        except Exception as e:
+            raise EngineError(f"Moderator failed: {e}") from e
+
+
+class ThreadedEngine:
+    """
+    Engine that runs agent reviews concurrently on a thread pool.
+
+    Suited to agents wrapping blocking SDK clients: their HTTP waits
+    overlap, so an iteration takes about as long as its slowest review.
+    The pool is created on the first step (sized to the agent count unless
+    max_workers is given) and reused across iterations; call close() or
+    use the engine as a context manager to release it.
+
+    Like AsyncEngine, every review runs to completion before the first
+    failure (in agent order) is raised as an EngineError. With
+    ``agent_timeout_s`` set, reviews unfinished that many seconds after the
+    step submits them fail with TimeoutError instead of being waited for.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, agent_timeout_s: Optional[float] = None):
+        self.max_workers = max_workers
+        self.agent_timeout_s = agent_timeout_s
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def _get_pool(self, num_agents: int) -> concurrent.futures.ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers or max(num_agents, 1),
+                thread_name_prefix="roundtable-agent",
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "ThreadedEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def step(
+        self,
+        document: str,
+        agents: Sequence[Agent],
+        moderator: Moderator,
+        context: Optional[Dict[str, Any]] = None,
+        iteration_index: int = 0,
+        logger: Optional[OrchestratorLogger] = None,
+    ) -> RoundtableIteration:
+        """Execute a single roundtable iteration with pooled reviews."""
+        context = context or {}
+
+        # Step 1: Submit all reviews, remembering each future's agent slot
+        pool = self._get_pool(len(agents))
+        futures = {
+            pool.submit(agent.review, document, context): index
+            for index, agent in enumerate(agents)
+        }
+        results: List[Any] = [None] * len(agents)
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=self.agent_timeout_s):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = e
+        except concurrent.futures.TimeoutError:
+            for future, index in futures.items():
+                if results[index] is not None:
+                    continue
+                if future.done():
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = e
+                else:
+                    future.cancel()  # only stops reviews still queued for a worker
+                    results[index] = TimeoutError(
+                        f"review timed out after {self.agent_timeout_s}s"
+                    )
+
+        reviews: List[Review] = []
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
+                raise EngineError(f"Agent '{agent.name}' failed: {result}") from result
+            reviews.append(result)
+            _log_review(logger, agent, result)
+
+        # Step 2: Moderator refines the document
+        try:
+            refined_document = moderator.refine(document, reviews, context)
+        except Exception as e:
+            raise EngineError(f"Moderator failed: {e}") from e
+
+        return RoundtableIteration(
+            iteration_index=iteration_index,
+            input_document=document,
+            output_document=refined_document,
+            reviews=reviews,
+            notes="",
+            metadata={"token_usage": _usage_by_agent(agents, reviews)},
         )
 
 
@@ -100,7 +318,10 @@ def run_roundtable(
         document: The initial document to refine (markdown content)
         agents: Sequence of agents that will review the document
         moderator: Moderator that refines the document based on reviews
-        engine: Optional engine for executing iterations (default: DefaultEngine)
+        engine: Optional engine for executing iterations (default: AsyncEngine,
+                so each iteration's reviews run concurrently, bounded by
+                config.max_parallel_agents; pass DefaultEngine() to run
+                agents one after another)
         config: Optional configuration (default: RoundtableConfig())
         context: Optional context dict passed to agents and moderator
         title: Title for the session
@@ -124,94 +345,164 @@ def run_roundtable(
         print(f"Final document:\\n{result.final_document}")
         print(f"Converged: {result.converged}")
     """
+    coro = run_roundtable_async(
+        document=document,
+        agents=agents,
+        moderator=moderator,
+        engine=engine,
+        config=config,
+        context=context,
+        title=title,
+        session_id=session_id,
+        logger=logger,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside a running event loop: drive the session on a
+    # separate thread rather than failing in asyncio.run
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def run_roundtable_async(
+    document: str,
+    agents: Sequence[Agent],
+    moderator: Moderator,
+    engine: Optional[Any] = None,
+    config: Optional[RoundtableConfig] = None,
+    context: Optional[Dict[str, Any]] = None,
+    title: str = "Untitled",
+    session_id: Optional[str] = None,
+    logger: Optional[OrchestratorLogger] = None,
+) -> RoundtableResult:
+    """
+    Async variant of run_roundtable().
+
+    Takes the same arguments. The engine defaults to AsyncEngine, so agent
+    reviews within each iteration run concurrently (bounded by
+    config.max_parallel_agents, each limited to config.agent_timeout_s).
+    Engines whose step() is synchronous, such as DefaultEngine, are also
+    accepted.
+    """
     # Apply defaults
     config = config or RoundtableConfig()
-    engine = engine or DefaultEngine()
+    engine = engine or AsyncEngine(
+        max_parallel_agents=config.max_parallel_agents,
+        agent_timeout_s=config.agent_timeout_s,
+    )
     context = context or {}
 
     # Generate session ID if not provided
     if not session_id:
-        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # pid + nanosecond clock: unique across processes and within a second
+        session_id = f"session_{os.getpid()}_{time.time_ns():x}"
 
-    # Create logger if not provided
-    if not logger:
+    # Create logger if not provided (and close it when done)
+    owns_logger = logger is None
+    if owns_logger:
         logger = create_logger(session_id, verbose=config.verbose)
 
-    logger.section(f"Roundtable Session: {title}")
-    logger.info(f"Session ID: {session_id}")
-    logger.info(f"Max iterations: {config.max_iterations}")
-    logger.info(f"Agents: {[a.name for a in agents]}")
-
-    # Track state
-    iterations: List[RoundtableIteration] = []
-    current_document = document
-    initial_document = document
-    start_time = datetime.now().isoformat()
-    total_issues = 0
-
-    # Main loop
-    for iteration_index in range(1, config.max_iterations + 1):
-        logger.log_iteration_start(iteration_index, config.max_iterations)
-
-        # Execute iteration
-        iteration = engine.step(
-            document=current_document,
-            agents=agents,
-            moderator=moderator,
-            context=context,
-            iteration_index=iteration_index,
-            logger=logger,
+    try:
+        log_enabled = logger.enabled
+        if log_enabled:
+            logger.section(f"Roundtable Session: {title}")
+            logger.info("Session ID: %s", session_id)
+            logger.info("Max iterations: %d", config.max_iterations)
+            logger.info("Agents: %s", [a.name for a in agents])
+
+        # Track state
+        iterations: List[RoundtableIteration] = []
+        current_document = document
+        initial_document = document
+        start_time = datetime.now().isoformat(timespec="seconds")
+        total_issues = 0
+        decision = None
+
+        # Bind per-iteration calls once, outside the loop
+        step = engine.step
+        log_iteration_start = logger.log_iteration_start
+        log_convergence_check = logger.log_convergence_check
+        log_refinement = logger.log_refinement
+        max_iterations = config.max_iterations
+
+        # Main loop
+        for iteration_index in range(1, max_iterations + 1):
+            if log_enabled:
+                log_iteration_start(iteration_index, max_iterations)
+
+            # Execute iteration
+            iteration = step(
+                document=current_document,
+                agents=agents,
+                moderator=moderator,
+                context=context,
+                iteration_index=iteration_index,
+                logger=logger,
+            )
+            if inspect.isawaitable(iteration):
+                iteration = await iteration
+            iterations.append(iteration)
+            total_issues += iteration.issue_count
+            usage = iteration.metadata.get("token_usage")
+            if usage:
+                logger.add_token_usage(usage)
+
+            # Check convergence
+            decision = decide_stop(config, iterations)
+            if log_enabled:
+                log_convergence_check(decision.should_stop, decision.reason, iteration_index)
+
+            if decision.should_stop:
+                if log_enabled:
+                    logger.info("Stopping: %s", decision.reason)
+                break
+
+            # Update document for next iteration
+            current_document = iteration.output_document
+            if log_enabled:
+                log_refinement(
+                    iteration_index + 1,
+                    len(iteration.input_document),
+                    len(iteration.output_document),
+                )
+
+        # Build final result
+        final_iteration = iterations[-1] if iterations else None
+        final_document = final_iteration.output_document if final_iteration else document
+        final_reviews = final_iteration.reviews if final_iteration else []
+
+        # Reuse the loop's last decision; only evaluate here if no iteration ran
+        final_decision = decision or decide_stop(config, iterations)
+
+        result = RoundtableResult(
+            session_id=session_id,
+            title=title,
+            initial_document=initial_document,
+            final_document=final_document,
+            initial_version=1,
+            final_version=len(iterations) + 1,
+            iterations=iterations,
+            converged=final_decision.should_stop,
+            convergence_reason=final_decision.reason,
+            stopped_by=final_decision.stopped_by,
+            total_issues_identified=total_issues,
+            final_issue_count=count_issues_by_severity(final_reviews),
+            token_usage=logger.get_token_summary(),
+            timestamps={
+                "start": start_time,
+                "end": datetime.now().isoformat(timespec="seconds"),
+            },
+            metadata=config.metadata,
         )
-        iterations.append(iteration)
-        total_issues += len(iteration.all_issues)
-
-        # Check convergence
-        decision = decide_stop(config, iterations)
-        logger.log_convergence_check(decision.should_stop, decision.reason, iteration_index)
-
-        if decision.should_stop:
-            logger.info(f"Stopping: {decision.reason}")
-            break
-
-        # Update document for next iteration
-        current_document = iteration.output_document
-        logger.log_refinement(
-            iteration_index + 1,
-            len(iteration.input_document),
-            len(iteration.output_document),
-        )
-
-    # Build final result
-    final_iteration = iterations[-1] if iterations else None
-    final_document = final_iteration.output_document if final_iteration else document
-    final_reviews = final_iteration.reviews if final_iteration else []
-
-    # Get final decision
-    final_decision = decide_stop(config, iterations)
-
-    result = RoundtableResult(
-        session_id=session_id,
-        title=title,
-        initial_document=initial_document,
-        final_document=final_document,
-        initial_version=1,
-        final_version=len(iterations) + 1,
-        iterations=iterations,
-        converged=final_decision.should_stop,
-        convergence_reason=final_decision.reason,
-        stopped_by=final_decision.stopped_by,
-        total_issues_identified=total_issues,
-        final_issue_count=count_issues_by_severity(final_reviews),
-        token_usage=logger.get_token_summary(),
-        timestamps={
-            "start": start_time,
-            "end": datetime.now().isoformat(),
-        },
-        metadata=config.metadata,
-    )
 
-    # Log final result
-    logger.log_final_result(result.converged, result.final_version, result.convergence_reason)
-    logger.log_token_summary()
+        # Log final result
+        if log_enabled:
+            logger.log_final_result(result.converged, result.final_version, result.convergence_reason)
+            logger.log_token_summary(result.token_usage)
 
-    return result
+        return result
+    finally:
+        if owns_logger:
+            logger.close()
@@ -6,6 +6,7 @@ Goal: keep orchestration logic pure and vendor-agnostic.
 Interfaces:
 - ModelProvider: LLM generation (OpenAI/Gemini/Claude) behind an interface
 - EmbeddingProvider: Text embedding generation
+- SharedPrefixProvider: Optional batch generation over a shared prompt prefix
 - Retriever: Retrieval backends (vector now; PageIndex later)
 - MemoryStore: Memory backends (local-first now; memU later)
 
@@ -26,8 +27,12 @@ Example usage:
 
     # Type checking works:
     provider: ModelProvider = MyProvider()
+
+    # Cached runtime check, equivalent to isinstance() for class-level members:
+    implements(MyProvider(), ModelProvider)  # True
 """
 
+from ._protocols import implements
 from .types import (
     ChatMessage,
     ModelResponse,
@@ -40,7 +45,14 @@ from .types import (
     Role,
 )
 
-from .model_provider import ModelProvider, EmbeddingProvider, ProviderError
+from .model_provider import (
+    ModelProvider,
+    EmbeddingProvider,
+    SharedPrefixProvider,
+    ProviderError,
+    generate_with_shared_prefix,
+    mark_cache_prefix,
+)
 from .retriever import Retriever, RetrieverError
 from .memory_store import MemoryStore, MemoryStoreError
 
@@ -58,11 +70,16 @@ __all__ = [
     # Model Provider
     "ModelProvider",
     "EmbeddingProvider",
+    "SharedPrefixProvider",
     "ProviderError",
+    "generate_with_shared_prefix",
+    "mark_cache_prefix",
     # Retriever
     "Retriever",
     "RetrieverError",
     # Memory Store
     "MemoryStore",
     "MemoryStoreError",
+    # Protocol checks
+    "implements",
 ]
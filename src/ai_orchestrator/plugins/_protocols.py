@@ -0,0 +1,37 @@
+"""
+Cached structural checks against the plugin protocols.
+
+isinstance() against a runtime_checkable Protocol looks up every protocol
+member on every call. Plugins define those members on their class, so the
+answer depends only on (class, protocol) and is computed once per pair.
+"""
+from functools import lru_cache
+from typing import Any, FrozenSet, Generic, Protocol, Set
+
+
+@lru_cache(maxsize=None)
+def _members(proto: type) -> FrozenSet[str]:
+    """Public members a protocol declares, including inherited ones."""
+    names: Set[str] = set()
+    for base in proto.__mro__:
+        if base in (object, Protocol, Generic):
+            continue
+        names.update(vars(base))
+        names.update(getattr(base, "__annotations__", {}))
+    return frozenset(name for name in names if not name.startswith("_"))
+
+
+@lru_cache(maxsize=256)
+def _implements(cls: type, proto: type) -> bool:
+    return all(getattr(cls, name, None) is not None for name in _members(proto))
+
+
+def implements(obj: Any, proto: type) -> bool:
+    """Whether obj's class provides every member of a plugin protocol.
+
+    Equivalent to isinstance(obj, proto) for plugins that define their
+    members on the class, but memoized per class. Attributes set only on
+    the instance are not seen; use isinstance() for those.
+    """
+    cls: type = type(obj)
+    return _implements(cls, proto)
@@ -6,8 +6,10 @@ The orchestration logic stays pure and vendor-agnostic.
 """
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, Protocol, Sequence, runtime_checkable
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Protocol, Sequence, cast, runtime_checkable
 
+from ._protocols import implements
 from .types import ChatMessage, ModelResponse
 
 
@@ -78,6 +80,73 @@ class ModelProvider(Protocol):
         ...
 
 
+# Prompt-caching hint for the last shared prefix message. Providers map it to
+# their native form (Anthropic cache_control blocks); OpenAI caches identical
+# prefixes automatically and can ignore it.
+CACHE_CONTROL_EPHEMERAL: Mapping[str, Any] = MappingProxyType({"type": "ephemeral"})
+
+
+@runtime_checkable
+class SharedPrefixProvider(Protocol):
+    """Optional batch API for N prompts that share a leading prefix.
+
+    Roundtables send the same document to every critic; a provider that
+    implements this can prefill/cache the prefix once instead of N times.
+    """
+
+    def generate_shared_prefix(
+        self,
+        prefix: Sequence[ChatMessage],
+        suffixes: Sequence[Sequence[ChatMessage]],
+        *,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> Sequence[ModelResponse]:
+        """Generate one response per suffix, each continuing `prefix`.
+
+        Returns:
+            ModelResponses aligned to `suffixes` order.
+
+        Raises:
+            ProviderError: On network, auth, or rate limit failures.
+        """
+        ...
+
+
+def mark_cache_prefix(prefix: Sequence[ChatMessage]) -> List[ChatMessage]:
+    """Return `prefix` with a cache_control hint on its last message."""
+    if not prefix:
+        return []
+    last = prefix[-1]
+    marked = ChatMessage(
+        role=last.role,
+        content=last.content,
+        name=last.name,
+        metadata={**last.metadata, "cache_control": CACHE_CONTROL_EPHEMERAL},
+    )
+    return [*prefix[:-1], marked]
+
+
+def generate_with_shared_prefix(
+    provider: ModelProvider,
+    prefix: Sequence[ChatMessage],
+    suffixes: Sequence[Sequence[ChatMessage]],
+    **kwargs: Any,
+) -> Sequence[ModelResponse]:
+    """Generate a response per suffix, sharing `prefix` where the provider can.
+
+    Uses SharedPrefixProvider.generate_shared_prefix() when available;
+    otherwise falls back to one generate() call per suffix, with the prefix
+    marked for prompt caching.
+    """
+    if implements(provider, SharedPrefixProvider):
+        return cast(SharedPrefixProvider, provider).generate_shared_prefix(prefix, suffixes, **kwargs)
+    shared = mark_cache_prefix(prefix)
+    return [provider.generate([*shared, *suffix], **kwargs) for suffix in suffixes]
+
+
 @runtime_checkable
 class EmbeddingProvider(Protocol):
     """Optional embedding provider (some ModelProviders may also implement this)."""
@@ -6,6 +6,7 @@ These are lightweight, dependency-free reference types used across plugin interf
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Literal, Mapping, MutableMapping, Optional, Sequence, Union
 
 
@@ -14,6 +15,15 @@ JsonValue = Union[JsonPrimitive, Sequence["JsonValue"], Mapping[str, "JsonValue"
 
 Role = Literal["system", "user", "assistant", "tool"]
 
+# Shared read-only default for metadata, so instances created without
+# metadata don't each allocate an empty dict. dataclasses rejects an
+# unhashable plain default, hence the factory returning the singleton.
+_EMPTY: Mapping[str, JsonValue] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, JsonValue]:
+    return _EMPTY
+
 
 @dataclass(frozen=True, slots=True)
 class ChatMessage:
@@ -21,7 +31,7 @@ class ChatMessage:
     role: Role
     content: str
     name: Optional[str] = None
-    metadata: Mapping[str, JsonValue] = field(default_factory=dict)
+    metadata: Mapping[str, JsonValue] = field(default_factory=_empty_metadata)
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,7 +51,7 @@ class ModelResponse:
     model: Optional[str] = None
     usage: Optional[ModelUsage] = None
     raw: Optional[Any] = None
-    metadata: Mapping[str, JsonValue] = field(default_factory=dict)
+    metadata: Mapping[str, JsonValue] = field(default_factory=_empty_metadata)
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,7 +59,7 @@ class DocumentChunk:
     """A chunk of a document for indexing/retrieval."""
     chunk_id: str
     text: str
-    metadata: Mapping[str, JsonValue] = field(default_factory=dict)
+    metadata: Mapping[str, JsonValue] = field(default_factory=_empty_metadata)
 
 
 @dataclass(frozen=True, slots=True)
@@ -57,7 +67,7 @@ class RetrievedChunk:
     """A retrieved chunk with relevance score."""
     chunk: DocumentChunk
     score: float
-    metadata: Mapping[str, JsonValue] = field(default_factory=dict)
+    metadata: Mapping[str, JsonValue] = field(default_factory=_empty_metadata)
 
 
 @dataclass(frozen=True, slots=True)
@@ -68,4 +78,4 @@ class MemoryItem:
     created_at_iso: str
     updated_at_iso: str
     score: Optional[float] = None
-    metadata: Mapping[str, JsonValue] = field(default_factory=dict)
+    metadata: Mapping[str, JsonValue] = field(default_factory=_empty_metadata)
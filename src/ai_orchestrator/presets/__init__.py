@@ -0,0 +1,31 @@
+"""
+Prebuilt roundtable configurations for MetaOrchestrator presets.
+
+Each ``<preset>.json`` file holds a serialized RoundtableConfig plus a
+``preset_version`` field. Files whose version does not match PRESET_VERSION
+are treated as missing so callers fall back to generating the config.
+"""
+import json
+from importlib import resources
+from typing import Any, Dict, Optional
+
+PRESET_VERSION = "1"
+
+
+def load_preset_data(preset: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the prebuilt config for a preset.
+
+    Args:
+        preset: Preset name (e.g., "prd", "code-review")
+
+    Returns:
+        Config dict, or None if no current prebuilt config ships for the preset
+    """
+    path = resources.files(__name__).joinpath(f"{preset}.json")
+    if not path.is_file():
+        return None
+    data = json.loads(path.read_bytes())
+    if data.get("preset_version") != PRESET_VERSION:
+        return None
+    return data
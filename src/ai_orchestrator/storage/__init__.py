@@ -21,10 +21,34 @@ Example:
     results = memory.search(namespace="agent1", query="dark mode", k=5)
 """
 
-from .memory_inmemory import InMemoryStore
-from .memory_sqlite import SQLiteMemoryStore
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .memory_inmemory import InMemoryStore
+    from .memory_sqlite import SQLiteMemoryStore
 
 __all__ = [
     "InMemoryStore",
     "SQLiteMemoryStore",
 ]
+
+# Backends are imported on first access (PEP 562), so using one store
+# does not pay for importing the others and their dependencies
+_BACKEND_MODULES = {
+    "InMemoryStore": ".memory_inmemory",
+    "SQLiteMemoryStore": ".memory_sqlite",
+}
+
+
+def __getattr__(name: str):
+    module = _BACKEND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
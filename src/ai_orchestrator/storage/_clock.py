@@ -0,0 +1,22 @@
+"""
+UTC timestamp strings for the memory stores.
+
+Formatting a timezone-aware datetime on every write is measurable in bulk
+puts, so the date-and-seconds prefix is formatted once per wall-clock
+second and only the microseconds are appended per call.
+"""
+import time
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS" for that second); replaced as a whole
+# so concurrent callers never see a mismatched pair
+_second = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as ISO 8601 with microseconds and +00:00."""
+    global _second
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached = _second
+    if cached[0] != sec:
+        cached = _second = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{frac // 1000:06d}+00:00"
@@ -6,29 +6,86 @@ Data is lost when the process exits.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Mapping, MutableMapping, Optional, Sequence
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from ai_orchestrator.plugins import MemoryItem, MemoryStore, MemoryStoreError
 from ai_orchestrator.plugins.types import JsonValue
+from ai_orchestrator.storage._clock import utc_now_iso as _now_iso
 
 
-def _now_iso() -> str:
-    """Return current UTC time in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+def _iter_text(value: JsonValue) -> Iterator[str]:
+    """Yield the searchable leaves of a JSON value: keys, strings and numbers."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (int, float)):  # includes bool
+        yield str(value)
+    elif isinstance(value, Mapping):
+        for k, v in value.items():
+            yield str(k)
+            yield from _iter_text(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _iter_text(v)
 
 
-def _stringify(value: Mapping[str, JsonValue]) -> str:
-    """Create a searchable text representation of a value (dependency-free)."""
-    parts: list[str] = []
-    for k, v in value.items():
-        parts.append(str(k))
-        parts.append(str(v))
-    return " ".join(parts).lower()
+def _field_text(k: str, v: JsonValue) -> str:
+    """Searchable text for a single top-level field of a value."""
+    if isinstance(v, str):
+        return f"{k} {v}".lower()
+    return " ".join((k, *_iter_text(v))).lower()
+
+
+def _with_score(item: MemoryItem, score: float) -> MemoryItem:
+    """Copy a stored item with its search score set.
+
+    Spelled out rather than dataclasses.replace(), which introspects fields
+    on every call and is about twice as slow for this slots dataclass.
+    """
+    return MemoryItem(
+        key=item.key,
+        value=item.value,
+        created_at_iso=item.created_at_iso,
+        updated_at_iso=item.updated_at_iso,
+        score=score,
+        metadata=item.metadata,
+    )
+
+
+# Okapi BM25 parameters: term-frequency saturation and length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Shared read-only default for lookups of a namespace that doesn't exist, so
+# reads don't allocate a throwaway dict per call
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split already-lowercased text into word tokens."""
+    return _TOKEN_RE.findall(text)
 
 
-@dataclass
 class InMemoryStore:
     """Dependency-free memory store.
 
@@ -41,7 +98,40 @@ class InMemoryStore:
         results = store.search(namespace="agent1", query="dark mode", k=5)
     """
 
-    _data: Dict[str, Dict[str, MemoryItem]] = field(default_factory=dict)
+    # A plain slotted class: the store is all hot attribute reads, and the
+    # dataclass-generated __eq__/__repr__ were never useful for it
+    __slots__ = (
+        "_data",
+        "_search_parts",
+        "_postings",
+        "_item_tokens",
+        "_item_len",
+        "_total_len",
+        "_expiry",
+        "_expires_at",
+    )
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Dict[str, MemoryItem]] = {}
+        # Search text per item, kept as per-field fragments so a merge update
+        # only re-stringifies the fields it touches
+        self._search_parts: Dict[str, Dict[str, Dict[str, str]]] = {}
+        # Inverted index: namespace -> token -> keys containing it, plus each
+        # item's term counts (so updates and deletes can retract old postings)
+        # and the namespace's total token count for BM25 length normalization.
+        # Each item's token count is kept too, so scoring never re-sums a Counter
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}
+        self._item_tokens: Dict[str, Dict[str, Counter]] = {}
+        self._item_len: Dict[str, Dict[str, int]] = {}
+        self._total_len: Dict[str, int] = {}
+        # TTL expiry: min-heap of (deadline, namespace, key) on the monotonic
+        # clock, pruned lazily on reads. _expires_at holds each item's current
+        # deadline so heap entries left behind by re-puts and deletes are skipped.
+        self._expiry: List[Tuple[float, str, str]] = []
+        self._expires_at: Dict[Tuple[str, str], float] = {}
+
+    def __repr__(self) -> str:
+        return f"InMemoryStore(namespaces={list(self._data)!r})"
 
     @property
     def backend_name(self) -> str:
@@ -54,34 +144,18 @@ class InMemoryStore:
         key: str,
         value: Mapping[str, JsonValue],
         ttl_seconds: Optional[int] = None,
+        now: Optional[str] = None,
     ) -> None:
-        """Insert or update a memory item."""
+        """Insert or update a memory item.
+
+        Args:
+            now: Precomputed ISO timestamp, for callers writing in a tight loop.
+                 Defaults to the current UTC time.
+        """
         try:
-            ns = self._data.setdefault(namespace, {})
-            now = _now_iso()
-            existing = ns.get(key)
-
-            if existing is None:
-                ns[key] = MemoryItem(
-                    key=key,
-                    value=dict(value),
-                    created_at_iso=now,
-                    updated_at_iso=now,
-                    score=None,
-                    metadata={"ttl_seconds": ttl_seconds, "_search_text": _stringify(value)},
-                )
-            else:
-                # Merge values (shallow) to preserve stable keys unless overwritten
-                new_value: MutableMapping[str, JsonValue] = dict(existing.value)
-                new_value.update(value)
-                ns[key] = MemoryItem(
-                    key=key,
-                    value=new_value,
-                    created_at_iso=existing.created_at_iso,
-                    updated_at_iso=now,
-                    score=None,
-                    metadata={"ttl_seconds": ttl_seconds, "_search_text": _stringify(new_value)},
-                )
+            # An expired item must not be merged into (or revived by) this write
+            self._prune_expired()
+            self._put(namespace, key, value, ttl_seconds, now or _now_iso())
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to put memory item",
@@ -89,17 +163,135 @@ class InMemoryStore:
                 cause=e,
             )
 
+    def put_many(
+        self,
+        *,
+        namespace: str,
+        items: Iterable[Tuple[str, Mapping[str, JsonValue]]],
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """Insert or update several (key, value) items with one shared timestamp."""
+        try:
+            self._prune_expired()
+            now = _now_iso()
+            for key, value in items:
+                self._put(namespace, key, value, ttl_seconds, now)
+        except Exception as e:
+            raise MemoryStoreError(
+                "Failed to put memory items",
+                backend=self.backend_name,
+                cause=e,
+            )
+
+    def _put(
+        self,
+        namespace: str,
+        key: str,
+        value: Mapping[str, JsonValue],
+        ttl_seconds: Optional[int],
+        now: str,
+    ) -> None:
+        """Insert or merge one item, stamped with the given timestamp."""
+        ns = self._data.setdefault(namespace, {})
+        existing = ns.get(key)
+
+        ns_parts = self._search_parts.setdefault(namespace, {})
+
+        if existing is None:
+            ns[key] = MemoryItem(
+                key=key,
+                value=dict(value),
+                created_at_iso=now,
+                updated_at_iso=now,
+                score=None,
+                metadata={"ttl_seconds": ttl_seconds},
+            )
+            parts = ns_parts[key] = {}
+        else:
+            # Merge values (shallow) to preserve stable keys unless overwritten
+            new_value: MutableMapping[str, JsonValue] = dict(existing.value)
+            new_value.update(value)
+            ns[key] = MemoryItem(
+                key=key,
+                value=new_value,
+                created_at_iso=existing.created_at_iso,
+                updated_at_iso=now,
+                score=None,
+                metadata={"ttl_seconds": ttl_seconds},
+            )
+            parts = ns_parts.setdefault(key, {})
+
+        # Only the fields in this write need re-stringifying
+        for k, v in value.items():
+            parts[k] = _field_text(k, v)
+        self._index_tokens(namespace, key, Counter(_tokenize(" ".join(parts.values()))))
+
+        if ttl_seconds is not None:
+            deadline = time.monotonic() + ttl_seconds
+            self._expires_at[(namespace, key)] = deadline
+            heapq.heappush(self._expiry, (deadline, namespace, key))
+        elif self._expires_at:
+            self._expires_at.pop((namespace, key), None)
+
+    def _remove(self, namespace: str, key: str) -> None:
+        """Drop an item and its search index entries."""
+        ns = self._data.get(namespace)
+        if ns is not None:
+            ns.pop(key, None)
+        parts = self._search_parts.get(namespace)
+        if parts is not None:
+            parts.pop(key, None)
+        self._index_tokens(namespace, key, Counter())
+
+    def _prune_expired(self) -> None:
+        """Remove items whose TTL has passed (O(log N) per expired item)."""
+        heap = self._expiry
+        if not heap:
+            return
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            deadline, namespace, key = heapq.heappop(heap)
+            if self._expires_at.get((namespace, key)) == deadline:
+                del self._expires_at[(namespace, key)]
+                self._remove(namespace, key)
+
+    def _index_tokens(self, namespace: str, key: str, tokens: Counter) -> None:
+        """Replace an item's postings with the given term counts (empty removes it)."""
+        postings = self._postings.setdefault(namespace, {})
+        item_tokens = self._item_tokens.setdefault(namespace, {})
+        item_len = self._item_len.setdefault(namespace, {})
+        old = item_tokens.get(key) or Counter()
+        for token in old.keys() - tokens.keys():
+            keys = postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del postings[token]
+        for token in tokens.keys() - old.keys():
+            postings.setdefault(token, set()).add(key)
+        length = sum(tokens.values())
+        self._total_len[namespace] = (
+            self._total_len.get(namespace, 0) + length - item_len.get(key, 0)
+        )
+        if tokens:
+            item_tokens[key] = tokens
+            item_len[key] = length
+        else:
+            item_tokens.pop(key, None)
+            item_len.pop(key, None)
+
     def get(self, *, namespace: str, key: str) -> Optional[MemoryItem]:
         """Get a memory item by key."""
-        return self._data.get(namespace, {}).get(key)
+        self._prune_expired()
+        return self._data.get(namespace, _EMPTY).get(key)
 
     def delete(self, *, namespace: str, key: str) -> None:
         """Delete a memory item."""
         try:
-            ns = self._data.get(namespace)
-            if not ns:
+            if not self._data.get(namespace):
                 return
-            ns.pop(key, None)
+            self._remove(namespace, key)
+            self._expires_at.pop((namespace, key), None)
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to delete memory item",
@@ -107,6 +299,21 @@ class InMemoryStore:
                 cause=e,
             )
 
+    def delete_many(self, *, namespace: str, keys: Iterable[str]) -> None:
+        """Delete several memory items."""
+        try:
+            if not self._data.get(namespace):
+                return
+            for key in keys:
+                self._remove(namespace, key)
+                self._expires_at.pop((namespace, key), None)
+        except Exception as e:
+            raise MemoryStoreError(
+                "Failed to delete memory items",
+                backend=self.backend_name,
+                cause=e,
+            )
+
     def search(
         self,
         *,
@@ -114,44 +321,47 @@ class InMemoryStore:
         query: str,
         k: int = 10,
     ) -> Sequence[MemoryItem]:
-        """Return top-k relevant memory items using naive term matching."""
+        """Return top-k relevant memory items, ranked by Okapi BM25."""
+        self._prune_expired()
         q = (query or "").lower().strip()
-        ns = self._data.get(namespace, {})
+        ns = self._data.get(namespace, _EMPTY)
 
         if not q:
             # Return newest items by updated_at
-            items = sorted(ns.values(), key=lambda x: x.updated_at_iso, reverse=True)
-            return items[:k]
-
-        scored: list[tuple[float, MemoryItem]] = []
-        for item in ns.values():
-            hay = str(item.metadata.get("_search_text", ""))
-            # Naive term-hit scoring (fast + dependency-free)
-            score = 0.0
-            for term in q.split():
-                if term in hay:
-                    score += 1.0
-            if score > 0:
-                scored.append((score, item))
-
-        scored.sort(key=lambda t: t[0], reverse=True)
-        out: list[MemoryItem] = []
-        for s, item in scored[:k]:
-            out.append(
-                MemoryItem(
-                    key=item.key,
-                    value=item.value,
-                    created_at_iso=item.created_at_iso,
-                    updated_at_iso=item.updated_at_iso,
-                    score=s,
-                    metadata=item.metadata,
-                )
-            )
-        return out
+            return heapq.nlargest(k, ns.values(), key=lambda x: x.updated_at_iso)
+
+        # BM25 over the postings: only items sharing a query token are scored
+        postings = self._postings.get(namespace, _EMPTY)
+        item_tokens = self._item_tokens.get(namespace, _EMPTY)
+        item_len = self._item_len.get(namespace, _EMPTY)
+        n_docs = len(item_tokens)
+        if not n_docs:
+            return []
+        # The length norm is k1 * (1 - b + b * len / avg_len); its constant
+        # parts are folded once here rather than per (term, item) pair
+        norm_base = BM25_K1 * (1.0 - BM25_B)
+        norm_per_len = BM25_K1 * BM25_B * n_docs / self._total_len[namespace]
+        scores: Dict[str, float] = {}
+        get_score = scores.get
+        for term in _tokenize(q):
+            keys = postings.get(term)
+            if not keys:
+                continue
+            df = len(keys)
+            weight = math.log((n_docs - df + 0.5) / (df + 0.5) + 1.0) * (BM25_K1 + 1.0)
+            for key in keys:
+                tf = item_tokens[key][term]
+                norm = norm_base + norm_per_len * item_len[key]
+                scores[key] = get_score(key, 0.0) + weight * tf / (tf + norm)
+
+        # Highest score first; ties broken by key for a stable order
+        top = heapq.nsmallest(k, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [_with_score(ns[key], s) for key, s in top]
 
     def compact(self, *, namespace: str) -> Mapping[str, Any]:
         """Return statistics about the namespace."""
-        ns = self._data.get(namespace, {})
+        self._prune_expired()
+        ns = self._data.get(namespace, _EMPTY)
         return {
             "namespace": namespace,
             "count": len(ns),
@@ -167,8 +377,26 @@ class InMemoryStore:
         """
         if namespace is None:
             self._data.clear()
+            self._search_parts.clear()
+            self._postings.clear()
+            self._item_tokens.clear()
+            self._item_len.clear()
+            self._total_len.clear()
+            self._expiry.clear()
+            self._expires_at.clear()
         elif namespace in self._data:
             del self._data[namespace]
+            self._search_parts.pop(namespace, None)
+            self._postings.pop(namespace, None)
+            self._item_tokens.pop(namespace, None)
+            self._item_len.pop(namespace, None)
+            self._total_len.pop(namespace, None)
+            # Orphaned heap entries are skipped once their deadline passes
+            self._expires_at = {
+                ns_key: deadline
+                for ns_key, deadline in self._expires_at.items()
+                if ns_key[0] != namespace
+            }
 
     def list_namespaces(self) -> Sequence[str]:
         """List all namespaces."""
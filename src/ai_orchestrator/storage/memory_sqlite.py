@@ -6,29 +6,304 @@ Data persists across process restarts.
 """
 from __future__ import annotations
 
-import json
+import atexit
+import os
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from ai_orchestrator.plugins import MemoryItem, MemoryStore, MemoryStoreError
 from ai_orchestrator.plugins.types import JsonValue
-
-
-def _now_iso() -> str:
-    """Return current UTC time in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+from ai_orchestrator.storage._clock import utc_now_iso as _now_iso
+from ai_orchestrator.utils.json_parsing import dumps, loads
+
+# Applied to every connection; busy_timeout waits out other writers'
+# locks (e.g. a second store on the same file) instead of failing
+_BASE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=5000",
+)
+_FAST_PRAGMAS = _BASE_PRAGMAS + (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+_DURABLE_PRAGMAS = _BASE_PRAGMAS + ("PRAGMA synchronous=FULL",)
+
+# Connections of closed stores, already tuned and with the SQL functions
+# registered, parked under (resolved path, fast) for the next store opened
+# on that file. Each entry remembers the file's (st_dev, st_ino) so a
+# connection to a since-replaced file is never handed out. Live stores
+# never share a connection.
+_IDLE: Dict[Tuple[str, bool], Tuple[sqlite3.Connection, Tuple[int, int]]] = {}
+_IDLE_LOCK = threading.Lock()
+
+
+def _file_id(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _take_idle(key: Tuple[str, bool]) -> Optional[sqlite3.Connection]:
+    """Pop the parked connection for key, if it still points at the file."""
+    with _IDLE_LOCK:
+        entry = _IDLE.pop(key, None)
+    if entry is None:
+        return None
+    conn, file_id = entry
+    if file_id != _file_id(key[0]):
+        conn.close()
+        return None
+    return conn
+
+
+def _release(key: Optional[Tuple[str, bool]], conn: sqlite3.Connection) -> None:
+    """Store finalizer: park the connection for reuse, or close it."""
+    if key is not None:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        file_id = _file_id(key[0])
+        with _IDLE_LOCK:
+            if file_id is not None and key not in _IDLE:
+                _IDLE[key] = (conn, file_id)
+                return
+    conn.close()
+
+
+# Registered before any store's weakref.finalize, so it runs after those
+# (atexit is last-in, first-out) and closes what they parked
+@atexit.register
+def _close_idle() -> None:
+    with _IDLE_LOCK:
+        entries = list(_IDLE.values())
+        _IDLE.clear()
+    for conn, _ in entries:
+        conn.close()
+
+
+def _collect_text(value: JsonValue, out: List[str]) -> None:
+    """Append the searchable leaves of a JSON value: keys, strings and numbers.
+
+    Nested containers are walked rather than repr()'d, so brackets, quotes
+    and nulls don't end up in the search text. Leaves go into one list
+    (string values without a recursive call) instead of through nested
+    generators.
+    """
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, (int, float)):  # includes bool
+        out.append(str(value))
+    elif isinstance(value, Mapping):
+        for k, v in value.items():
+            out.append(str(k))
+            if type(v) is str:
+                out.append(v)
+            else:
+                _collect_text(v, out)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _collect_text(v, out)
 
 
 def _stringify(value: Mapping[str, JsonValue]) -> str:
     """Create a searchable text representation of a value."""
-    parts: list[str] = []
-    for k, v in value.items():
-        parts.append(str(k))
-        parts.append(str(v))
-    return " ".join(parts).lower()
+    out: List[str] = []
+    _collect_text(value, out)
+    return " ".join(out).lower()
+
+
+# Bump when _SCHEMA_SQL changes; stored in PRAGMA user_version
+_SCHEMA_VERSION = 2
+
+# {search} is _FTS_SQL, or _LIKE_INDEX_SQL when FTS5 trigram is unavailable.
+# idx_memory_cover serves the newest-first listing (empty-query search) with
+# every column it reads, so it needs no base-table lookups.
+_SCHEMA_SQL = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS memory_items (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value_json TEXT NOT NULL,
+        search_text TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        ttl_seconds INTEGER NULL,
+        PRIMARY KEY(namespace, key)
+    );
+    DROP INDEX IF EXISTS idx_memory_ns_updated;
+    CREATE INDEX IF NOT EXISTS idx_memory_cover
+        ON memory_items(namespace, updated_at DESC, key, value_json, created_at, ttl_seconds);
+    {search}
+    PRAGMA user_version = %d;
+    COMMIT;
+""" % _SCHEMA_VERSION
+
+# Trigram full-text index over memory_items.search_text, kept in sync by
+# triggers. It is an external-content table: the index reads the text from
+# memory_items instead of storing a second copy of it. Older layouts
+# (schema 1 kept its own copy) are dropped and rebuilt from memory_items.
+_FTS_SQL = """
+    DROP TRIGGER IF EXISTS memory_fts_ai;
+    DROP TRIGGER IF EXISTS memory_fts_ad;
+    DROP TRIGGER IF EXISTS memory_fts_au;
+    DROP TABLE IF EXISTS memory_fts;
+    CREATE VIRTUAL TABLE memory_fts USING fts5(
+        search_text, content='memory_items', content_rowid='rowid', tokenize='trigram'
+    );
+    INSERT INTO memory_fts(memory_fts) VALUES ('rebuild');
+    CREATE TRIGGER memory_fts_ai AFTER INSERT ON memory_items BEGIN
+        INSERT INTO memory_fts(rowid, search_text) VALUES (new.rowid, new.search_text);
+    END;
+    CREATE TRIGGER memory_fts_ad AFTER DELETE ON memory_items BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, search_text)
+            VALUES ('delete', old.rowid, old.search_text);
+    END;
+    CREATE TRIGGER memory_fts_au AFTER UPDATE OF search_text ON memory_items BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, search_text)
+            VALUES ('delete', old.rowid, old.search_text);
+        INSERT INTO memory_fts(rowid, search_text) VALUES (new.rowid, new.search_text);
+    END;
+    DROP INDEX IF EXISTS idx_memory_ns_search;
+"""
+
+_LIKE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_memory_ns_search ON memory_items(namespace, search_text);
+"""
+
+# Columns read back into a MemoryItem (all covered by idx_memory_cover)
+_ITEM_COLUMNS = "key, value_json, created_at, updated_at, ttl_seconds"
+
+# Statements are built once so every call passes the same text and hits the
+# connection's prepared-statement cache instead of re-parsing
+_GET_SQL = f"SELECT {_ITEM_COLUMNS} FROM memory_items WHERE namespace = ? AND key = ?"
+_DELETE_SQL = "DELETE FROM memory_items WHERE namespace = ? AND key = ?"
+_SEARCH_RECENT_SQL = f"""
+    SELECT {_ITEM_COLUMNS} FROM memory_items
+    WHERE namespace = ?
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+_SEARCH_FTS_SQL = """
+    SELECT m.key, m.value_json, m.created_at, m.updated_at, m.ttl_seconds
+    FROM memory_fts f
+    JOIN memory_items m ON m.rowid = f.rowid
+    WHERE f.search_text MATCH ?
+      AND m.namespace = ?
+    ORDER BY m.updated_at DESC
+    LIMIT ?
+"""
+_SEARCH_LIKE_SQL = f"""
+    SELECT {_ITEM_COLUMNS} FROM memory_items
+    WHERE namespace = ?
+      AND search_text LIKE ?
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+_COUNT_SQL = "SELECT COUNT(*) AS cnt FROM memory_items WHERE namespace = ?"
+_CLEAR_SQL = "DELETE FROM memory_items WHERE namespace = ?"
+_CLEAR_ALL_SQL = "DELETE FROM memory_items"
+# Skip-scan over the primary key: each step seeks the next namespace past
+# the previous one, so the cost grows with the number of namespaces rather
+# than with the number of rows (SELECT DISTINCT reads every index entry)
+_LIST_NAMESPACES_SQL = """
+    WITH RECURSIVE ns(name) AS (
+        SELECT MIN(namespace) FROM memory_items
+        UNION ALL
+        SELECT (SELECT MIN(namespace) FROM memory_items WHERE namespace > ns.name)
+        FROM ns WHERE ns.name IS NOT NULL
+    )
+    SELECT name FROM ns WHERE name IS NOT NULL
+"""
+
+# Single-statement upsert; {merge} combines the stored and incoming JSON and
+# {search} recomputes search_text
+_UPSERT_SQL = """
+    INSERT INTO memory_items
+    (namespace, key, value_json, search_text, created_at, updated_at, ttl_seconds)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(namespace, key) DO UPDATE SET
+        value_json = {merge},
+        search_text = {search},
+        updated_at = excluded.updated_at,
+        ttl_seconds = excluded.ttl_seconds
+"""
+# A merge that only adds new top-level keys appends their text to the stored
+# search_text (merged keys keep their order, new ones go last), so the full
+# value is only re-walked when an existing key is overwritten
+_INCREMENTAL_SEARCH_SQL = """CASE
+            WHEN EXISTS (
+                SELECT 1 FROM json_each(memory_items.value_json) AS old
+                JOIN json_each(excluded.value_json) AS new ON old.key = new.key
+            ) THEN memory_search_text({merge})
+            WHEN excluded.search_text = '' THEN memory_items.search_text
+            WHEN memory_items.search_text = '' THEN excluded.search_text
+            ELSE memory_items.search_text || ' ' || excluded.search_text
+        END"""
+
+
+def _upsert_sql(merge: str, incremental: bool = True) -> str:
+    search = _INCREMENTAL_SEARCH_SQL if incremental else "memory_search_text({merge})"
+    return _UPSERT_SQL.format(merge=merge, search=search.format(merge=merge))
+
+
+# json_patch (RFC 7396) equals a shallow merge unless the patch holds nulls
+# (which it deletes) or objects (which it merges recursively)
+_UPSERT_PATCH_SQL = _upsert_sql("json_patch(memory_items.value_json, excluded.value_json)")
+_UPSERT_MERGE_SQL = _upsert_sql("memory_merge(memory_items.value_json, excluded.value_json)")
+# Without JSON1 there is neither json_patch nor json_each
+_UPSERT_NO_JSON1_SQL = _upsert_sql(
+    "memory_merge(memory_items.value_json, excluded.value_json)", incremental=False
+)
+
+
+def _merge_json(existing_json: str, value_json: str) -> str:
+    """Shallow-merge value_json over existing_json (SQL function memory_merge)."""
+    existing = loads(existing_json)
+    value = loads(value_json)
+    if isinstance(existing, dict):
+        existing.update(value)
+        return dumps(existing)
+    return value_json
+
+
+def _search_text_json(value_json: str) -> str:
+    """SQL function memory_search_text: the search text of a stored value."""
+    return _stringify(loads(value_json))
+
+
+def _item_row(cursor: sqlite3.Cursor, row: tuple) -> MemoryItem:
+    """Row factory for _ITEM_COLUMNS queries: build the MemoryItem by position."""
+    key, value_json, created_at, updated_at, ttl_seconds = row
+    return MemoryItem(
+        key=key,
+        value=loads(value_json),
+        created_at_iso=created_at,
+        updated_at_iso=updated_at,
+        score=None,
+        metadata={"ttl_seconds": ttl_seconds},
+    )
+
+
+def _patch_safe(value: Mapping[str, JsonValue]) -> bool:
+    """Whether json_patch would merge value exactly as a shallow dict update.
+
+    Other values go through memory_merge, still inside the one upsert
+    statement: RFC 7396 would drop their null keys and deep-merge their
+    nested objects.
+    """
+    return not any(v is None or isinstance(v, Mapping) for v in value.values())
 
 
 @dataclass
@@ -44,12 +319,24 @@ class SQLiteMemoryStore:
         updated_at TEXT
         ttl_seconds INTEGER NULL
 
-    Search is a naive LIKE scan over search_text.
+    Search is a substring match over search_text. When SQLite has FTS5
+    with the trigram tokenizer (3.34+), a memory_fts index kept in sync by
+    triggers answers it; otherwise, and for queries shorter than three
+    characters, it falls back to a LIKE scan.
     For production-grade recall, you can replace this with:
-        - SQLite FTS5 (if available)
         - a vector store
         - memU (later)
 
+    One connection is opened per store and shared by all calls (serialized
+    by a lock); call close() or use the store as a context manager to
+    release it early, otherwise it is released when the store is collected
+    or at interpreter exit. A released connection is kept, already tuned,
+    for the next store opened on the same file with the same ``fast``
+    setting, and closed at interpreter exit.
+
+    Each call commits on its own; wrap a burst of calls in transaction()
+    (or use put_many/delete_many) to commit them together.
+
     Example:
         store = SQLiteMemoryStore(path="./memory.db")
         store.put(namespace="agent1", key="fact_1", value={"content": "User prefers dark mode"})
@@ -58,36 +345,33 @@ class SQLiteMemoryStore:
     """
 
     path: str = ".ai_orchestrator_memory.sqlite3"
+    # synchronous=NORMAL plus a larger cache/mmap. In WAL mode NORMAL never
+    # corrupts the database but may lose the last commits on power loss;
+    # pass fast=False for synchronous=FULL (an fsync on every commit)
+    fast: bool = True
 
     def __post_init__(self) -> None:
         """Initialize the database schema."""
         try:
             db_path = Path(self.path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
-            with self._conn() as conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS memory_items (
-                        namespace TEXT NOT NULL,
-                        key TEXT NOT NULL,
-                        value_json TEXT NOT NULL,
-                        search_text TEXT NOT NULL,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        ttl_seconds INTEGER NULL,
-                        PRIMARY KEY(namespace, key)
-                    );
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_memory_ns_updated "
-                    "ON memory_items(namespace, updated_at);"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_memory_ns_search "
-                    "ON memory_items(namespace, search_text);"
-                )
-                conn.commit()
+            self._lock = threading.RLock()
+            # Nesting depth of transaction() blocks held by the lock owner
+            self._txn_depth = 0
+            # In-memory databases are private to their connection
+            key = None if self.path in ("", ":memory:") else (os.path.realpath(self.path), self.fast)
+            conn = _take_idle(key) if key is not None else None
+            if conn is None:
+                conn = self._open()
+            self._connection = conn
+            self._finalizer = weakref.finalize(self, _release, key, conn)
+            try:
+                conn.execute("SELECT json_patch('{}', '{}')")
+                self._json_patch = True
+            except sqlite3.OperationalError:
+                self._json_patch = False  # built without JSON1
+            with self._lock:
+                self._fts = self._init_schema(self._connection)
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to initialize SQLiteMemoryStore",
@@ -99,12 +383,111 @@ class SQLiteMemoryStore:
     def backend_name(self) -> str:
         return "sqlite"
 
-    def _conn(self) -> sqlite3.Connection:
-        """Create a new database connection."""
-        conn = sqlite3.connect(self.path)
-        conn.row_factory = sqlite3.Row
+    def _open(self) -> sqlite3.Connection:
+        """Open and tune a new connection to self.path."""
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
+        try:
+            conn.create_function("memory_merge", 2, _merge_json, deterministic=True)
+            conn.create_function(
+                "memory_search_text", 1, _search_text_json, deterministic=True
+            )
+            # Connection-level settings, applied once: WAL lets readers run
+            # alongside a writer, and the larger cache/mmap stay warm
+            # because the connection is reused
+            for pragma in _FAST_PRAGMAS if self.fast else _DURABLE_PRAGMAS:
+                conn.execute(pragma)
+        except BaseException:
+            conn.close()
+            raise
         return conn
 
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> bool:
+        """Create or upgrade the schema, returning whether FTS5 search is active.
+
+        Each variant runs as one script inside a single transaction and
+        stamps PRAGMA user_version, so later opens only read the catalog.
+        Builds without FTS5 or the trigram tokenizer get the LIKE index.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            try:
+                conn.executescript(_SCHEMA_SQL.format(search=_FTS_SQL))
+            except sqlite3.OperationalError:
+                conn.rollback()
+                conn.executescript(_SCHEMA_SQL.format(search=_LIKE_INDEX_SQL))
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+        ).fetchone() is not None
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared connection for one transaction (commit, or roll back on error).
+
+        Inside transaction() the enclosing block owns the commit instead.
+        """
+        with self._lock:
+            if self._txn_depth:
+                yield self._connection
+                return
+            with self._connection:
+                yield self._connection
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteMemoryStore"]:
+        """Run several store calls in one transaction (one commit, one fsync).
+
+        Writes made inside the block are committed together when it exits,
+        or all rolled back if it raises. The store's lock is held for the
+        whole block, so other threads wait. Nested blocks join the
+        outermost one.
+
+        Example:
+            with store.transaction():
+                store.put(namespace="agent1", key="fact_1", value={"content": "..."})
+                store.delete(namespace="agent1", key="fact_0")
+        """
+        with self._lock:
+            if self._txn_depth:
+                self._txn_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._txn_depth -= 1
+                return
+
+            try:
+                self._connection.execute("BEGIN IMMEDIATE")
+            except Exception as e:
+                raise MemoryStoreError(
+                    "Failed to begin transaction",
+                    backend=self.backend_name,
+                    cause=e,
+                )
+            self._txn_depth = 1
+            try:
+                with self._connection:
+                    yield self
+            finally:
+                self._txn_depth = 0
+
+    @staticmethod
+    def _items(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """Cursor whose rows come back as MemoryItems (for _ITEM_COLUMNS queries)."""
+        cur = conn.cursor()
+        cur.row_factory = _item_row
+        return cur
+
+    def close(self) -> None:
+        """Release the database connection. Safe to call more than once."""
+        self._finalizer()
+
+    def __enter__(self) -> "SQLiteMemoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def put(
         self,
         *,
@@ -115,51 +498,7 @@ class SQLiteMemoryStore:
     ) -> None:
         """Insert or update a memory item."""
         try:
-            now = _now_iso()
-            value_json = json.dumps(value, ensure_ascii=False)
-            search_text = _stringify(value)
-
-            with self._conn() as conn:
-                row = conn.execute(
-                    "SELECT created_at, value_json FROM memory_items "
-                    "WHERE namespace = ? AND key = ?",
-                    (namespace, key),
-                ).fetchone()
-
-                if row is None:
-                    conn.execute(
-                        """
-                        INSERT INTO memory_items
-                        (namespace, key, value_json, search_text, created_at, updated_at, ttl_seconds)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (namespace, key, value_json, search_text, now, now, ttl_seconds),
-                    )
-                else:
-                    # Merge values (shallow) to preserve stable keys unless overwritten
-                    existing = json.loads(row["value_json"])
-                    if isinstance(existing, dict):
-                        merged = dict(existing)
-                        merged.update(value)
-                    else:
-                        merged = dict(value)
-
-                    conn.execute(
-                        """
-                        UPDATE memory_items
-                        SET value_json = ?, search_text = ?, updated_at = ?, ttl_seconds = ?
-                        WHERE namespace = ? AND key = ?
-                        """,
-                        (
-                            json.dumps(merged, ensure_ascii=False),
-                            _stringify(merged),
-                            now,
-                            ttl_seconds,
-                            namespace,
-                            key,
-                        ),
-                    )
-                conn.commit()
+            self._write(namespace, ((key, value),), ttl_seconds)
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to put memory item",
@@ -167,26 +506,64 @@ class SQLiteMemoryStore:
                 cause=e,
             )
 
+    def put_many(
+        self,
+        *,
+        namespace: str,
+        items: Iterable[Tuple[str, Mapping[str, JsonValue]]],
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """Insert or update several (key, value) items in one transaction.
+
+        The whole batch costs a single commit (one fsync), and small rows
+        already share B-tree leaf pages, so there is no need to pack tiny
+        values into one row: each item keeps its own key, index and FTS entry.
+        """
+        try:
+            self._write(namespace, items, ttl_seconds)
+        except Exception as e:
+            raise MemoryStoreError(
+                "Failed to put memory items",
+                backend=self.backend_name,
+                cause=e,
+            )
+
+    def _write(
+        self,
+        namespace: str,
+        items: Iterable[Tuple[str, Mapping[str, JsonValue]]],
+        ttl_seconds: Optional[int],
+    ) -> None:
+        """Upsert items under one timestamp and one IMMEDIATE transaction."""
+        now = _now_iso()
+        rows = []
+        for key, value in items:
+            # Existing values are merged (shallow) inside SQLite so stable
+            # keys survive unless overwritten
+            if not self._json_patch:
+                sql = _UPSERT_NO_JSON1_SQL
+            elif _patch_safe(value):
+                sql = _UPSERT_PATCH_SQL
+            else:
+                sql = _UPSERT_MERGE_SQL
+            rows.append(
+                (sql, (namespace, key, dumps(value), _stringify(value), now, now, ttl_seconds))
+            )
+        if not rows:
+            return
+
+        with self._conn() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            # Consecutive runs share a statement, so order is preserved
+            for sql, run in groupby(rows, key=lambda row: row[0]):
+                conn.executemany(sql, [params for _, params in run])
+
     def get(self, *, namespace: str, key: str) -> Optional[MemoryItem]:
         """Get a memory item by key."""
         try:
             with self._conn() as conn:
-                row = conn.execute(
-                    "SELECT * FROM memory_items WHERE namespace = ? AND key = ?",
-                    (namespace, key),
-                ).fetchone()
-
-            if row is None:
-                return None
-
-            return MemoryItem(
-                key=row["key"],
-                value=json.loads(row["value_json"]),
-                created_at_iso=row["created_at"],
-                updated_at_iso=row["updated_at"],
-                score=None,
-                metadata={"ttl_seconds": row["ttl_seconds"]},
-            )
+                return self._items(conn).execute(_GET_SQL, (namespace, key)).fetchone()
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to get memory item",
@@ -198,11 +575,7 @@ class SQLiteMemoryStore:
         """Delete a memory item."""
         try:
             with self._conn() as conn:
-                conn.execute(
-                    "DELETE FROM memory_items WHERE namespace = ? AND key = ?",
-                    (namespace, key),
-                )
-                conn.commit()
+                conn.execute(_DELETE_SQL, (namespace, key))
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to delete memory item",
@@ -210,6 +583,23 @@ class SQLiteMemoryStore:
                 cause=e,
             )
 
+    def delete_many(self, *, namespace: str, keys: Iterable[str]) -> None:
+        """Delete several memory items in one transaction."""
+        try:
+            params = [(namespace, key) for key in keys]
+            if not params:
+                return
+            with self._conn() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(_DELETE_SQL, params)
+        except Exception as e:
+            raise MemoryStoreError(
+                "Failed to delete memory items",
+                backend=self.backend_name,
+                cause=e,
+            )
+
     def search(
         self,
         *,
@@ -217,48 +607,22 @@ class SQLiteMemoryStore:
         query: str,
         k: int = 10,
     ) -> Sequence[MemoryItem]:
-        """Return top-k relevant memory items using LIKE-based search."""
+        """Return top-k items whose search text contains the query, newest first."""
         try:
             q = (query or "").lower().strip()
 
             with self._conn() as conn:
+                cur = self._items(conn)
                 if not q:
-                    rows = conn.execute(
-                        """
-                        SELECT * FROM memory_items
-                        WHERE namespace = ?
-                        ORDER BY updated_at DESC
-                        LIMIT ?
-                        """,
-                        (namespace, k),
-                    ).fetchall()
+                    return cur.execute(_SEARCH_RECENT_SQL, (namespace, k)).fetchall()
+                elif self._fts and len(q) >= 3:
+                    # Trigram phrase query: substring match served by the index
+                    phrase = '"' + q.replace('"', '""') + '"'
+                    return cur.execute(_SEARCH_FTS_SQL, (phrase, namespace, k)).fetchall()
                 else:
-                    # Naive LIKE scan. Good enough for local-first MVP.
+                    # Naive LIKE scan (no FTS5, or query too short for trigrams)
                     like = f"%{q}%"
-                    rows = conn.execute(
-                        """
-                        SELECT * FROM memory_items
-                        WHERE namespace = ?
-                          AND search_text LIKE ?
-                        ORDER BY updated_at DESC
-                        LIMIT ?
-                        """,
-                        (namespace, like, k),
-                    ).fetchall()
-
-            out: list[MemoryItem] = []
-            for row in rows:
-                out.append(
-                    MemoryItem(
-                        key=row["key"],
-                        value=json.loads(row["value_json"]),
-                        created_at_iso=row["created_at"],
-                        updated_at_iso=row["updated_at"],
-                        score=None,
-                        metadata={"ttl_seconds": row["ttl_seconds"]},
-                    )
-                )
-            return out
+                    return cur.execute(_SEARCH_LIKE_SQL, (namespace, like, k)).fetchall()
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to search memory",
@@ -270,14 +634,11 @@ class SQLiteMemoryStore:
         """Return statistics about the namespace."""
         try:
             with self._conn() as conn:
-                row = conn.execute(
-                    "SELECT COUNT(*) AS cnt FROM memory_items WHERE namespace = ?",
-                    (namespace,),
-                ).fetchone()
+                row = conn.execute(_COUNT_SQL, (namespace,)).fetchone()
 
             return {
                 "namespace": namespace,
-                "count": int(row["cnt"]),
+                "count": int(row[0]),
                 "backend": self.backend_name,
             }
         except Exception as e:
@@ -297,13 +658,9 @@ class SQLiteMemoryStore:
         try:
             with self._conn() as conn:
                 if namespace is None:
-                    conn.execute("DELETE FROM memory_items")
+                    conn.execute(_CLEAR_ALL_SQL)
                 else:
-                    conn.execute(
-                        "DELETE FROM memory_items WHERE namespace = ?",
-                        (namespace,),
-                    )
-                conn.commit()
+                    conn.execute(_CLEAR_SQL, (namespace,))
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to clear memory",
@@ -315,10 +672,8 @@ class SQLiteMemoryStore:
         """List all namespaces."""
         try:
             with self._conn() as conn:
-                rows = conn.execute(
-                    "SELECT DISTINCT namespace FROM memory_items ORDER BY namespace"
-                ).fetchall()
-            return [row["namespace"] for row in rows]
+                rows = conn.execute(_LIST_NAMESPACES_SQL).fetchall()
+            return [row[0] for row in rows]
         except Exception as e:
             raise MemoryStoreError(
                 "Failed to list namespaces",
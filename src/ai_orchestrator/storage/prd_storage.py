@@ -1,24 +1,117 @@
-import json
 import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Optional, List, Tuple, Union
 from ..models.prd_models import PRD, PRDReview
 from ..models.document_models import Document, DocumentReview
+from ..utils.json_parsing import dump_bytes, loads
+
+# Set to 1/true/yes to indent document and review files for reading by hand
+PRETTY_JSON_ENV = "AI_ORCHESTRATOR_PRETTY_JSON"
+
+# Shared by all PRDStorage instances for flush_session; created on first use
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+# Exclusive create, as mkstemp does, but with open()'s default mode so the
+# kernel applies the umask
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write data to a sibling temp file, then os.replace it over path.
+
+    Readers see either the old file or the new one, never a partial write.
+    The file ends up with the same permissions a plain open() would give it.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp, _TMP_FLAGS, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    global _IO_POOL
+    with _IO_POOL_LOCK:
+        if _IO_POOL is None:
+            _IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prd-io")
+        return _IO_POOL
+
 
 class PRDStorage:
     """Handle PRD versioning and persistence"""
 
-    def __init__(self, base_dir: str = "data/prds"):
+    def __init__(self, base_dir: str = "data/prds", pretty: Optional[bool] = None):
         self.base_dir = Path(base_dir)
+        if pretty is None:
+            pretty = os.environ.get(PRETTY_JSON_ENV, "").lower() in ("1", "true", "yes")
+        # Document and review files are compact unless pretty: indenting
+        # roughly doubles their size and encode time
+        self.pretty = pretty
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.base_dir / "prd_index.json"
+        self._index: dict = {"sessions": []}
+        self._session_by_id: dict = {}
+        self._index_stamp = None
         self._ensure_index()
 
     def _ensure_index(self):
         """Create index file if it doesn't exist"""
         if not self.index_file.exists():
-            self.index_file.write_text(json.dumps({"sessions": []}, indent=2), encoding='utf-8')
+            self._flush_index()
+
+    def _sessions_index(self) -> dict:
+        """Return the parsed index, re-reading it only if the file changed.
+
+        The file's (mtime, size) is checked on every call so writes from
+        another PRDStorage or process are still picked up.
+        """
+        st = self.index_file.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._index_stamp:
+            self._index = loads(self.index_file.read_bytes())
+            # Reversed so the first entry wins for duplicate ids, as before
+            self._session_by_id = {
+                s["session_id"]: s for s in reversed(self._index.get("sessions", []))
+            }
+            self._index_stamp = stamp
+        return self._index
+
+    def _flush_index(self):
+        """Write the cached index atomically (temp file + os.replace)"""
+        _atomic_write_bytes(self.index_file, dump_bytes(self._index, indent=True))
+        st = self.index_file.stat()
+        self._index_stamp = (st.st_mtime_ns, st.st_size)
+
+    def _add_to_index(self, session_id: str, title: str, session_dir: Path):
+        index_data = self._sessions_index()
+        entry = {
+            "session_id": session_id,
+            "title": title,
+            "created_at": datetime.now().isoformat(),
+            "directory": str(session_dir),
+            "latest_version": 0,
+        }
+        index_data.setdefault("sessions", []).append(entry)
+        self._session_by_id.setdefault(session_id, entry)
+        self._flush_index()
+
+    def _record_version(self, session_id: str, version: int):
+        """Raise the indexed latest_version of a session, flushing on change"""
+        self._sessions_index()
+        entry = self._session_by_id.get(session_id)
+        if entry is not None and "latest_version" in entry and version > entry["latest_version"]:
+            entry["latest_version"] = version
+            self._flush_index()
 
     def create_session(self, title: str) -> str:
         """Create new PRD session and return session ID"""
@@ -27,16 +120,7 @@ class PRDStorage:
         session_dir = self.base_dir / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
-        # Update index
-        index_data = json.loads(self.index_file.read_text(encoding='utf-8'))
-        index_data["sessions"].append({
-            "session_id": session_id,
-            "title": title,
-            "created_at": datetime.now().isoformat(),
-            "directory": str(session_dir)
-        })
-        self.index_file.write_text(json.dumps(index_data, indent=2), encoding='utf-8')
-
+        self._add_to_index(session_id, title, session_dir)
         return session_id
 
     def create_session_with_id(self, session_id: str, title: str) -> str:
@@ -44,80 +128,160 @@ class PRDStorage:
         session_dir = self.base_dir / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
-        # Update index
-        index_data = json.loads(self.index_file.read_text(encoding='utf-8'))
-        index_data["sessions"].append({
-            "session_id": session_id,
-            "title": title,
-            "created_at": datetime.now().isoformat(),
-            "directory": str(session_dir)
-        })
-        self.index_file.write_text(json.dumps(index_data, indent=2), encoding='utf-8')
-
+        self._add_to_index(session_id, title, session_dir)
         return session_id
 
+    def _prd_payload(self, session_id: str, prd: Union[PRD, Document]) -> Tuple[Path, bytes]:
+        prd_file = self.base_dir / session_id / f"prd_v{prd.version}.json"
+        return prd_file, dump_bytes(prd.model_dump(mode="json"), indent=self.pretty)
+
+    def _reviews_payload(
+        self, session_id: str, version: int, reviews: List[Union[PRDReview, DocumentReview]]
+    ) -> Tuple[Path, bytes]:
+        reviews_file = self.base_dir / session_id / f"reviews_v{version}.json"
+        reviews_data = [r.model_dump(mode="json") for r in reviews]
+        return reviews_file, dump_bytes(reviews_data, indent=self.pretty)
+
     def save_prd(self, session_id: str, prd: Union[PRD, Document]):
         """Save PRD/Document version to session directory"""
-        session_dir = self.base_dir / session_id
-        prd_file = session_dir / f"prd_v{prd.version}.json"
-        prd_file.write_text(prd.model_dump_json(indent=2), encoding='utf-8')
+        prd_file, data = self._prd_payload(session_id, prd)
+        _atomic_write_bytes(prd_file, data)
+        self._record_version(session_id, prd.version)
 
     def save_reviews(self, session_id: str, version: int, reviews: List[Union[PRDReview, DocumentReview]]):
         """Save reviews for a PRD/Document version"""
+        reviews_file, data = self._reviews_payload(session_id, version, reviews)
+        _atomic_write_bytes(reviews_file, data)
+
+    def flush_session(
+        self,
+        session_id: str,
+        prd: Optional[Union[PRD, Document]] = None,
+        reviews: Optional[List[Union[PRDReview, DocumentReview]]] = None,
+        config: Optional[dict] = None,
+        report: Optional[dict] = None,
+        version: Optional[int] = None,
+    ):
+        """Write any of a session's document, reviews, config and report together.
+
+        Equivalent to the matching save_* calls, but the files are written
+        concurrently on a shared I/O thread pool. Serialization stays on the
+        calling thread (it holds the GIL); only the writes overlap. Reviews
+        are saved under ``version``, defaulting to ``prd.version``.
+        """
+        payloads = []
+        if prd is not None:
+            payloads.append(self._prd_payload(session_id, prd))
+        if reviews is not None:
+            if version is None:
+                if prd is None:
+                    raise ValueError("flush_session needs a version or a prd to save reviews")
+                version = prd.version
+            payloads.append(self._reviews_payload(session_id, version, reviews))
         session_dir = self.base_dir / session_id
-        reviews_file = session_dir / f"reviews_v{version}.json"
-        reviews_data = [r.model_dump() for r in reviews]
-        reviews_file.write_text(json.dumps(reviews_data, indent=2), encoding='utf-8')
+        if config is not None:
+            payloads.append((session_dir / "roundtable_config.json", dump_bytes(config, indent=True)))
+        if report is not None:
+            payloads.append((session_dir / "convergence_report.json", dump_bytes(report, indent=True)))
+
+        pool = _io_pool()
+        futures = [pool.submit(_atomic_write_bytes, path, data) for path, data in payloads]
+        for future in futures:
+            future.result()
+        if prd is not None:
+            self._record_version(session_id, prd.version)
+
+    def save_iteration(self, session_id: str, doc: Document, reviews: List[DocumentReview]):
+        """Append one iteration (document version plus its reviews) to the session log.
+
+        The session log is newline-delimited JSON (iterations.jsonl), so each
+        iteration costs a single append instead of separate document and
+        review files. load_prd/load_reviews fall back to it.
+        """
+        record = {
+            "version": doc.version,
+            "doc": doc.model_dump(mode="json", exclude={"reviews"}),
+            "reviews": [r.model_dump(mode="json") for r in reviews],
+        }
+        iterations_file = self.base_dir / session_id / "iterations.jsonl"
+        with open(iterations_file, "ab") as f:
+            f.write(dump_bytes(record) + b"\n")
+        self._record_version(session_id, doc.version)
+
+    def _load_iteration(self, session_id: str, version: int) -> Optional[dict]:
+        """Return the latest session-log record for a version, if any"""
+        iterations_file = self.base_dir / session_id / "iterations.jsonl"
+        if not iterations_file.exists():
+            return None
+        found = None
+        with open(iterations_file, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = loads(line)
+                    if record["version"] == version:
+                        found = record
+        return found
 
     def save_roundtable_config(self, session_id: str, config: dict):
         """Save roundtable configuration (participants)"""
         session_dir = self.base_dir / session_id
         config_file = session_dir / "roundtable_config.json"
-        config_file.write_text(json.dumps(config, indent=2), encoding='utf-8')
+        _atomic_write_bytes(config_file, dump_bytes(config, indent=True))
 
     def load_roundtable_config(self, session_id: str) -> Optional[dict]:
         """Load roundtable configuration"""
         session_dir = self.base_dir / session_id
         config_file = session_dir / "roundtable_config.json"
         if config_file.exists():
-            return json.loads(config_file.read_text(encoding='utf-8'))
+            return loads(config_file.read_bytes())
         return None
 
     def load_prd(self, session_id: str, version: int) -> PRD:
         """Load specific PRD version"""
         session_dir = self.base_dir / session_id
         prd_file = session_dir / f"prd_v{version}.json"
-        prd_data = json.loads(prd_file.read_text(encoding='utf-8'))
+        if not prd_file.exists():
+            record = self._load_iteration(session_id, version)
+            if record is not None:
+                return PRD(**record["doc"])
+        prd_data = loads(prd_file.read_bytes())
         return PRD(**prd_data)
 
     def get_latest_version(self, session_id: str) -> int:
         """Get latest PRD version number for session"""
+        self._sessions_index()
+        entry = self._session_by_id.get(session_id)
+        if entry is not None and "latest_version" in entry:
+            return entry["latest_version"]
+
+        # Sessions indexed before latest_version existed: scan the files
         session_dir = self.base_dir / session_id
-        prd_files = list(session_dir.glob("prd_v*.json"))
-        if not prd_files:
-            return 0
-        versions = [int(f.stem.split("_v")[1]) for f in prd_files]
-        return max(versions)
+        versions = [int(f.stem.split("_v")[1]) for f in session_dir.glob("prd_v*.json")]
+        iterations_file = session_dir / "iterations.jsonl"
+        if iterations_file.exists():
+            with open(iterations_file, encoding="utf-8") as f:
+                versions.extend(loads(line)["version"] for line in f if line.strip())
+        return max(versions, default=0)
 
     def save_convergence_report(self, session_id: str, report: dict):
         """Save convergence report"""
         session_dir = self.base_dir / session_id
         report_file = session_dir / "convergence_report.json"
-        report_file.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        _atomic_write_bytes(report_file, dump_bytes(report, indent=True))
 
     def list_sessions(self, limit: int = 50) -> List[dict]:
         """List all sessions with metadata"""
-        index_data = json.loads(self.index_file.read_text(encoding='utf-8'))
-        sessions = index_data.get("sessions", [])
-        return sorted(sessions, key=lambda x: x["created_at"], reverse=True)[:limit]
+        sessions = self._sessions_index().get("sessions", [])
+        newest = sorted(sessions, key=lambda x: x["created_at"], reverse=True)[:limit]
+        return [dict(s) for s in newest]
 
     def get_session_metadata(self, session_id: str) -> dict:
         """Get session metadata"""
-        index_data = json.loads(self.index_file.read_text(encoding='utf-8'))
-        for session in index_data.get("sessions", []):
-            if session["session_id"] == session_id:
-                return session
-        raise ValueError(f"Session {session_id} not found")
+        self._sessions_index()
+        session = self._session_by_id.get(session_id)
+        if session is None:
+            raise ValueError(f"Session {session_id} not found")
+        return dict(session)
 
     def session_exists(self, session_id: str) -> bool:
         """Check if session exists"""
@@ -129,7 +293,7 @@ class PRDStorage:
         session_dir = self.base_dir / session_id
         report_file = session_dir / "convergence_report.json"
         if report_file.exists():
-            return json.loads(report_file.read_text(encoding='utf-8'))
+            return loads(report_file.read_bytes())
         return None
 
     def load_reviews(self, session_id: str, version: int) -> List[dict]:
@@ -137,7 +301,10 @@ class PRDStorage:
         session_dir = self.base_dir / session_id
         reviews_file = session_dir / f"reviews_v{version}.json"
         if reviews_file.exists():
-            return json.loads(reviews_file.read_text(encoding='utf-8'))
+            return loads(reviews_file.read_bytes())
+        record = self._load_iteration(session_id, version)
+        if record is not None:
+            return record["reviews"]
         return []
 
     def delete_session(self, session_id: str) -> bool:
@@ -150,13 +317,13 @@ class PRDStorage:
             shutil.rmtree(session_dir)
 
         # Remove from index
-        index_file = self.base_dir / "sessions_index.json"
-        if index_file.exists():
-            index_data = json.loads(index_file.read_text(encoding='utf-8'))
+        index_data = self._sessions_index()
+        if session_id in self._session_by_id:
             index_data["sessions"] = [
                 s for s in index_data.get("sessions", [])
                 if s["session_id"] != session_id
             ]
-            index_file.write_text(json.dumps(index_data, indent=2), encoding='utf-8')
+            del self._session_by_id[session_id]
+            self._flush_index()
 
         return True
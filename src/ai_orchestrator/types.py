@@ -3,10 +3,12 @@ Core types for the AI Orchestrator library.
 
 These types define the public API contract for the library.
 """
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
 
 
 class Severity(str, Enum):
@@ -15,8 +17,14 @@ class Severity(str, Enum):
     MEDIUM = "Medium"
     LOW = "Low"
 
+    # Severities are interpolated into moderator prompts and log lines, which
+    # must read "High" as they did when severity was a plain string; the
+    # default Enum __str__/format would send "Severity.HIGH" to the model
+    def __str__(self) -> str:
+        return self.value
 
-@dataclass
+
+@dataclass(slots=True)
 class Issue:
     """An issue identified during document review."""
     category: str
@@ -48,13 +56,36 @@ class Issue:
         )
 
 
-@dataclass
+_severity_of = attrgetter("severity")
+
+
+@dataclass(slots=True)
 class Review:
     """A review from a single agent."""
     reviewer_name: str
     issues: List[Issue]
     overall_assessment: str
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Model usage for this review if the agent reports it
+    # (e.g. {"prompt_tokens": ..., "completion_tokens": ..., "total_tokens": ...})
+    token_usage: Dict[str, int] = field(default_factory=dict)
+
+    def severity_counts(self) -> Tuple[int, int, int]:
+        """Return (high, medium, low) issue counts.
+
+        Counted on every call: issues are mutable, and one C-level Counter
+        pass is cheaper than any tag that could prove a memo still valid.
+        """
+        issues = self.issues
+        # Anything not High or Medium counts as Low
+        counts = Counter(map(_severity_of, issues))
+        high, medium = counts[Severity.HIGH], counts[Severity.MEDIUM]
+        return high, medium, len(issues) - high - medium
+
+    @property
+    def has_high(self) -> bool:
+        """Whether any issue is high severity."""
+        return self.severity_counts()[0] > 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -62,6 +93,7 @@ class Review:
             "issues": [i.to_dict() for i in self.issues],
             "overall_assessment": self.overall_assessment,
             "timestamp": self.timestamp,
+            "token_usage": self.token_usage,
         }
 
     @classmethod
@@ -72,10 +104,11 @@ class Review:
             issues=issues,
             overall_assessment=data.get("overall_assessment", ""),
             timestamp=data.get("timestamp", datetime.now().isoformat()),
+            token_usage=data.get("token_usage", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundtableIteration:
     """Result from a single iteration of the roundtable."""
     iteration_index: int
@@ -84,22 +117,26 @@ class RoundtableIteration:
     reviews: List[Review]
     notes: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # (output_document, word Counter, word total), filled by convergence.decide_stop
+    _word_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def all_issues(self) -> List[Issue]:
-        """Get all issues from all reviews."""
-        issues = []
-        for review in self.reviews:
-            issues.extend(review.issues)
-        return issues
+        """Get all issues from all reviews (a new list on each access)."""
+        return [issue for review in self.reviews for issue in review.issues]
+
+    @property
+    def issue_count(self) -> int:
+        """Number of issues across all reviews (without flattening them)."""
+        return sum(len(review.issues) for review in self.reviews)
 
     @property
     def high_severity_count(self) -> int:
         """Count of high severity issues."""
-        return sum(1 for i in self.all_issues if i.severity == Severity.HIGH)
+        return sum(review.severity_counts()[0] for review in self.reviews)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StopDecision:
     """Decision about whether to stop the roundtable loop."""
     should_stop: bool
@@ -111,16 +148,19 @@ class StopDecision:
 class RoundtableConfig:
     """Configuration for running a roundtable session."""
     max_iterations: int = 3
+    min_iterations: int = 1  # Don't converge early (no high issues / delta) before this
     delta_threshold: float = 0.05  # Stop if document change < 5%
     stop_on_no_high_issues: bool = True
     verbose: bool = False
+    max_parallel_agents: int = 8  # Concurrent reviews per iteration (AsyncEngine)
+    agent_timeout_s: Optional[float] = None  # Fail a review that runs longer (None: no limit)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     # Optional custom stop condition
     custom_stop_condition: Optional[Callable[[List[RoundtableIteration]], StopDecision]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundtableResult:
     """Final result from a roundtable session."""
     session_id: str
@@ -158,7 +198,7 @@ class RoundtableResult:
             "history": [
                 {
                     "iteration": it.iteration_index,
-                    "issues_count": len(it.all_issues),
+                    "issues_count": it.issue_count,
                     "high_count": it.high_severity_count,
                     "notes": it.notes,
                 }
@@ -1,5 +1,7 @@
 from typing import List, Tuple, Union
-import difflib
+
+from ..convergence import calculate_document_delta
+from ..types import Severity
 
 # Support both old and new models
 try:
@@ -21,21 +23,14 @@ class ConvergenceChecker:
     @staticmethod
     def has_converged(reviews: List[Union['PRDReview', 'DocumentReview']]) -> bool:
         """Check if no High severity issues remain"""
-        for review in reviews:
-            for issue in review.issues:
-                if issue.severity == "High":
-                    return False
-        return True
+        # Both review models store the Severity singleton, so identity suffices
+        high = Severity.HIGH
+        return not any(i.severity is high for r in reviews for i in r.issues)
 
     @staticmethod
     def calculate_delta(prev_doc: Union['PRD', 'Document'], current_doc: Union['PRD', 'Document']) -> float:
         """Calculate similarity between document versions (0.0 = identical, 1.0 = completely different)"""
-        prev_content = prev_doc.content
-        current_content = current_doc.content
-
-        matcher = difflib.SequenceMatcher(None, prev_content, current_content)
-        similarity = matcher.ratio()  # 0.0 to 1.0
-        return 1.0 - similarity  # Convert to delta
+        return calculate_document_delta(prev_doc.content, current_doc.content)
 
     @staticmethod
     def get_convergence_reason(
@@ -46,29 +41,23 @@ class ConvergenceChecker:
         current_doc: Union['PRD', 'Document'] = None
     ) -> Tuple[bool, str]:
         """Determine if converged and why"""
+        # One pass over the issues serves every branch
+        high = Severity.HIGH
+        high_count = sum(1 for r in reviews for i in r.issues if i.severity is high)
 
         # Check 1: No high severity issues
-        if ConvergenceChecker.has_converged(reviews):
-            high_count = sum(
-                1 for r in reviews for i in r.issues if i.severity == "High"
-            )
+        if high_count == 0:
             return True, f"No high severity issues (0 remaining)"
 
         # Check 2: Max iterations
         if iteration >= max_iterations:
-            high_count = sum(
-                1 for r in reviews for i in r.issues if i.severity == "High"
-            )
             return True, f"Max iterations reached ({max_iterations}). {high_count} high severity issues remain."
 
-        # Check 3: Stable document (delta < 5%)
+        # Check 3: Stable document (delta < 5%), the costliest check, last
         if prev_doc and current_doc:
             delta = ConvergenceChecker.calculate_delta(prev_doc, current_doc)
             if delta < 0.05:
                 return True, f"Document stable (delta: {delta:.2%})"
 
         # Not converged
-        high_count = sum(
-            1 for r in reviews for i in r.issues if i.severity == "High"
-        )
         return False, f"{high_count} high severity issues remain"
@@ -0,0 +1,103 @@
+"""
+Fast JSON parsing for LLM responses.
+
+Strips markdown code fences, decodes with orjson when it is installed
+(falling back to the stdlib json module), repairs common LLM formatting
+slips (trailing commas, smart quotes), and validates straight into a
+Pydantic model through its core validator. dumps() is the matching
+encoder used by the storage layer.
+"""
+import json
+import re
+from typing import TYPE_CHECKING, Any, Type, TypeVar, Union
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+T = TypeVar("T", bound="BaseModel")
+
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"'})
+
+
+def strip_fences(text: str) -> str:
+    """Remove a surrounding ```json ... ``` fence from an LLM response."""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text
+
+
+def repair_json(text: str) -> str:
+    """Fix trailing commas and smart double quotes in near-valid JSON."""
+    return _TRAILING_COMMA_RE.sub(r"\1", text.translate(_SMART_QUOTES))
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """Decode JSON text or UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _orjson_dumps(obj: Any, indent: bool) -> bytes:
+    option = orjson.OPT_INDENT_2 if indent else 0
+    try:
+        return orjson.dumps(obj, option=option)
+    except TypeError:
+        # Non-string dict keys (e.g. ints): coerce them like the stdlib does.
+        # Retried rather than always set, as the option slows the common case
+        return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode obj as JSON text (2-space indented if requested), using orjson when available."""
+    if orjson is not None:
+        return _orjson_dumps(obj, indent).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dump_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, for writing to files without a re-encode."""
+    if orjson is not None:
+        return _orjson_dumps(obj, indent)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads_lenient(text: str) -> Any:
+    """
+    Decode JSON text, retrying once after repair_json on failure.
+
+    Raises:
+        ValueError: The original decode error, if the repaired text also fails
+    """
+    try:
+        return loads(text)
+    except ValueError as e:
+        try:
+            return loads(repair_json(text))
+        except ValueError:
+            raise e
+
+
+def fast_parse(text: str, cls: Type[T]) -> T:
+    """
+    Parse an LLM response into an instance of ``cls``.
+
+    Args:
+        text: Raw response content, optionally wrapped in a markdown fence
+        cls: Pydantic model class to validate into
+
+    Returns:
+        Validated ``cls`` instance
+
+    Raises:
+        ValueError: If the text is not valid JSON
+        pydantic.ValidationError: If the data does not match ``cls``
+    """
+    data = loads_lenient(strip_fences(text))
+    return cls.__pydantic_validator__.validate_python(data)
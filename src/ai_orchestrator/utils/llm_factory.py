@@ -2,8 +2,45 @@
 """
 LLM Factory: Create LLM instances for different providers (OpenAI, Google Gemini)
 """
+import asyncio
+import importlib.util
 import os
-from typing import Optional
+import re
+import weakref
+from functools import cache, lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict, cast
+
+# Connection pool limits for the shared OpenAI HTTP clients
+_HTTP_LIMITS = {"max_connections": 64, "max_keepalive_connections": 32}
+
+# (model-name prefix, provider), checked in order; anything else is OpenAI.
+# Only providers create_llm can build belong here.
+_PROVIDER_PREFIXES: Tuple[Tuple[str, str], ...] = (("gemini", "google"),)
+_DEFAULT_PROVIDER = "openai"
+# One anchored alternation over the prefixes, tried in table order like the
+# startswith loop it replaces
+_PROVIDER_RE = re.compile("|".join(re.escape(prefix) for prefix, _ in _PROVIDER_PREFIXES))
+_PROVIDER_BY_PREFIX: Dict[str, str] = dict(reversed(_PROVIDER_PREFIXES))
+
+# LLM class -> attribute holding its model name (None: use the class name)
+_MODEL_ATTR_CACHE: Dict[type, Optional[str]] = {}
+
+# Set to "memory" or "sqlite" to cache identical LLM calls process-wide
+# (LangChain's global LLM cache); see configure_llm_cache
+LLM_CACHE_ENV = "AI_ORCHESTRATOR_LLM_CACHE"
+# SQLite database used when LLM_CACHE_ENV is "sqlite"
+LLM_CACHE_PATH_ENV = "AI_ORCHESTRATOR_LLM_CACHE_PATH"
+DEFAULT_LLM_CACHE_PATH = ".ai_orchestrator_llm_cache.db"
+
+_shared_http_clients: Dict[str, object] = {}
+# httpx.AsyncClient connections are bound to the loop that opened them, so
+# async clients are shared per event loop, never process-wide
+_loop_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, object]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_llms: Dict[Tuple[str, float], object] = {}
 
 
 def create_llm(model: str, temperature: float = 0.2, json_mode: bool = True, **kwargs):
@@ -21,20 +58,121 @@ def create_llm(model: str, temperature: float = 0.2, json_mode: bool = True, **k
         **kwargs: Additional model-specific arguments
 
     Returns:
-        LLM instance (ChatOpenAI or ChatGoogleGenerativeAI)
+        LLM instance (ChatOpenAI or ChatGoogleGenerativeAI). Calls with the
+        same arguments (and API key) return the same cached instance; kwargs
+        with unhashable values always get a fresh one. Identical prompts are
+        answered from a cache when LLM_CACHE_ENV is set.
     """
+    configure_llm_cache()
+    api_key = _google_key() if get_model_provider(model) == "google" else _openai_key()
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        # Unhashable kwargs (e.g. a callbacks list): build directly
+        return _build_llm(model, temperature, json_mode, **kwargs)
+    return _cached_llm(model, temperature, json_mode, api_key, kwargs_items)
+
+
+@lru_cache(maxsize=32)
+def _cached_llm(model: str, temperature: float, json_mode: bool, api_key, kwargs_items: tuple):
+    """Build one client per distinct create_llm call; api_key only keys the cache."""
+    return _build_llm(model, temperature, json_mode, **dict(kwargs_items))
+
 
+def _build_llm(model: str, temperature: float, json_mode: bool, **kwargs):
     # Detect provider based on model name
-    if model.startswith("gemini"):
+    if get_model_provider(model) == "google":
         return _create_gemini_llm(model, temperature, **kwargs)
     else:
         return _create_openai_llm(model, temperature, json_mode=json_mode, **kwargs)
 
 
-def _create_openai_llm(model: str, temperature: float, json_mode: bool = True, **kwargs):
-    """Create OpenAI LLM instance"""
+@cache
+def configure_llm_cache() -> Optional[str]:
+    """
+    Install LangChain's global LLM cache from LLM_CACHE_ENV, once.
+
+    "memory" caches responses for the life of the process, "sqlite" persists
+    them to LLM_CACHE_PATH_ENV (requires langchain-community). Repeated
+    prompts then skip the API round-trip. Unset leaves caching off.
+
+    Returns:
+        The cache mode installed, or None
+
+    Raises:
+        ValueError: If LLM_CACHE_ENV names an unknown mode
+    """
+    mode = os.getenv(LLM_CACHE_ENV, "").strip().lower()
+    if not mode:
+        return None
+
+    from langchain_core.globals import set_llm_cache
+
+    if mode == "memory":
+        from langchain_core.caches import InMemoryCache
+
+        set_llm_cache(InMemoryCache())
+    elif mode == "sqlite":
+        try:
+            from langchain_community.cache import SQLiteCache
+        except ImportError as e:
+            raise ImportError(
+                f"{LLM_CACHE_ENV}=sqlite requires langchain-community. "
+                "Install with: pip install langchain-community"
+            ) from e
+        set_llm_cache(SQLiteCache(database_path=os.getenv(LLM_CACHE_PATH_ENV, DEFAULT_LLM_CACHE_PATH)))
+    else:
+        raise ValueError(f"Unknown {LLM_CACHE_ENV} value {mode!r}; expected 'memory' or 'sqlite'")
+    return mode
+
+
+@cache
+def _openai_key() -> Optional[str]:
+    """OPENAI_API_KEY, read once; see refresh_env."""
+    return os.getenv("OPENAI_API_KEY")
+
+
+@cache
+def _google_key() -> Optional[str]:
+    """GOOGLE_API_KEY (or GEMINI_API_KEY), read once; see refresh_env."""
+    return os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+
+
+def refresh_env() -> None:
+    """Re-read provider API keys from the environment on the next call.
+
+    Keys and the LLM cache setting are snapshotted on first use; call this
+    after changing them at runtime (e.g. in tests). Clients built with the old key stay cached
+    under it and are not reused for the new one.
+    """
+    _openai_key.cache_clear()
+    _google_key.cache_clear()
+    configure_llm_cache.cache_clear()
+
+
+@cache
+def _openai_cls():
+    """Import ChatOpenAI on first use only (the SDK import is slow)."""
     from langchain_openai import ChatOpenAI
+    return ChatOpenAI
+
+
+@cache
+def _gemini_cls():
+    """Import ChatGoogleGenerativeAI on first use only."""
+    try:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+    except ImportError:
+        raise ImportError(
+            "langchain-google-genai is required for Gemini models. "
+            "Install with: pip install langchain-google-genai"
+        )
+    return ChatGoogleGenerativeAI
+
 
+def _create_openai_llm(model: str, temperature: float, json_mode: bool = True, **kwargs):
+    """Create OpenAI LLM instance"""
     model_kwargs = {}
     if json_mode:
         model_kwargs["response_format"] = {"type": "json_object"}
@@ -47,28 +185,142 @@ def _create_openai_llm(model: str, temperature: float, json_mode: bool = True, *
     }
 
     # Only pass api_key if explicitly set (let library use env var otherwise)
-    api_key = os.environ.get("OPENAI_API_KEY")
+    api_key = _openai_key()
     if api_key:
         params["openai_api_key"] = api_key
 
+    # Reuse the pooled sync HTTP client so TLS sessions are shared across
+    # agents. No async client is injected: instances are cached across
+    # asyncio.run() calls, and an AsyncClient cannot outlive its loop.
+    params["http_client"] = get_http_client()
+
     # Filter out None values from kwargs
     filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
     params.update(filtered_kwargs)
 
-    return ChatOpenAI(**params)
+    return _openai_cls()(**params)
+
+
+def get_http_client(async_client: bool = False):
+    """
+    Get a pooled httpx client for OpenAI requests.
+
+    The sync client is process-wide. The async client is shared only within
+    the running event loop (its connections cannot be reused from another
+    loop) and is dropped along with that loop. HTTP/2 is enabled when the
+    optional ``h2`` package is installed.
+
+    Args:
+        async_client: Return the running loop's httpx.AsyncClient instead
+            of the shared httpx.Client
+
+    Returns:
+        Shared httpx.Client or per-loop httpx.AsyncClient instance
+
+    Raises:
+        RuntimeError: If async_client is requested outside a running loop
+    """
+    if async_client:
+        loop = asyncio.get_running_loop()
+        client = _loop_http_clients.get(loop)
+        if client is None:
+            client = _loop_http_clients[loop] = _new_http_client(async_client=True)
+        return client
+    client = _shared_http_clients.get("sync")
+    if client is None:
+        client = _shared_http_clients["sync"] = _new_http_client(async_client=False)
+    return client
+
+
+def _new_http_client(async_client: bool):
+    import httpx
+
+    client_cls = httpx.AsyncClient if async_client else httpx.Client
+    return client_cls(
+        limits=httpx.Limits(**_HTTP_LIMITS),
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
+def get_shared_client(model: str, temperature: float = 0.2):
+    """
+    Get a cached ChatOpenAI instance for ``(model, temperature)``.
+
+    Instances share the pooled sync HTTP client from get_http_client, so agents
+    created across iterations reuse open connections instead of each paying
+    for a fresh TLS handshake.
+
+    Args:
+        model: OpenAI model identifier
+        temperature: Sampling temperature
+
+    Returns:
+        Shared ChatOpenAI instance
+    """
+    key = (model, temperature)
+    llm = _shared_llms.get(key)
+    if llm is None:
+        llm = _create_openai_llm(model, temperature, json_mode=False, stream_usage=True)
+        _shared_llms[key] = llm
+    return llm
+
+
+async def arun_reviewers(
+    llms: Sequence[Any],
+    prompts: Sequence[Any],
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """
+    Invoke several LLMs concurrently, one prompt each.
+
+    Reviewer calls are independent, so the batch takes about as long as the
+    slowest call instead of the sum of all of them.
+
+    Args:
+        llms: LLM instances (e.g. from create_llm) exposing ``ainvoke``
+        prompts: One prompt (string or message list) per LLM
+        max_concurrency: Optional cap on calls in flight at once
+
+    Returns:
+        Responses, in the same order as ``llms``
+
+    Raises:
+        ValueError: If llms and prompts differ in length
+    """
+    if len(llms) != len(prompts):
+        raise ValueError(f"Got {len(llms)} LLMs but {len(prompts)} prompts")
+    if max_concurrency is None:
+        return list(await asyncio.gather(*(llm.ainvoke(p) for llm, p in zip(llms, prompts))))
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def invoke(llm, prompt):
+        async with sem:
+            return await llm.ainvoke(prompt)
+
+    return list(await asyncio.gather(*(invoke(llm, p) for llm, p in zip(llms, prompts))))
+
+
+def run_reviewers(
+    llms: Sequence[Any],
+    prompts: Sequence[Any],
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """
+    Synchronous wrapper around arun_reviewers for callers without an event loop.
+
+    Raises:
+        RuntimeError: If called from a running event loop (await
+            arun_reviewers there instead)
+    """
+    return asyncio.run(arun_reviewers(llms, prompts, max_concurrency))
 
 
 def _create_gemini_llm(model: str, temperature: float, **kwargs):
     """Create Google Gemini LLM instance"""
-    try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-    except ImportError:
-        raise ImportError(
-            "langchain-google-genai is required for Gemini models. "
-            "Install with: pip install langchain-google-genai"
-        )
+    chat_cls = _gemini_cls()
 
-    google_api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+    google_api_key = _google_key()
     if not google_api_key:
         raise ValueError(
             "GOOGLE_API_KEY or GEMINI_API_KEY environment variable is required for Gemini models"
@@ -87,33 +339,35 @@ def _create_gemini_llm(model: str, temperature: float, **kwargs):
 
     # Note: Gemini doesn't natively support system messages
     # The library handles this automatically in newer versions
-    return ChatGoogleGenerativeAI(**params)
+    return chat_cls(**params)
 
 
+@lru_cache(maxsize=256)
 def get_model_provider(model: str) -> str:
     """
     Get the provider name for a given model.
 
+    Resolved once per model name from _PROVIDER_PREFIXES (via _PROVIDER_RE)
+    and memoized.
+
     Args:
         model: Model identifier
 
     Returns:
         Provider name ("openai" or "google")
     """
-    if model.startswith("gemini"):
-        return "google"
-    else:
-        return "openai"
+    match = _PROVIDER_RE.match(model)
+    return _PROVIDER_BY_PREFIX[match.group()] if match else _DEFAULT_PROVIDER
 
 
 def is_gemini_model(model: str) -> bool:
     """Check if a model is a Gemini model"""
-    return model.startswith("gemini")
+    return get_model_provider(model) == "google"
 
 
 def is_openai_model(model: str) -> bool:
     """Check if a model is an OpenAI model"""
-    return not model.startswith("gemini")
+    return get_model_provider(model) == "openai"
 
 
 def get_model_name(llm) -> str:
@@ -126,17 +380,71 @@ def get_model_name(llm) -> str:
     Returns:
         Model name string
     """
-    # Try different attribute names used by different providers
-    if hasattr(llm, 'model_name'):
-        return llm.model_name
-    elif hasattr(llm, 'model'):
-        return llm.model
-    else:
+    cls = type(llm)
+    try:
+        attr = _MODEL_ATTR_CACHE[cls]
+    except KeyError:
+        # Probe once per class: providers name the attribute differently
+        if hasattr(llm, 'model_name'):
+            attr = 'model_name'
+        elif hasattr(llm, 'model'):
+            attr = 'model'
+        else:
+            attr = None
+        _MODEL_ATTR_CACHE[cls] = attr
+    if attr is None:
         # Fallback: return class name if no model attribute found
-        return llm.__class__.__name__
+        return cls.__name__
+    return getattr(llm, attr)
+
+
+class TokenUsage(TypedDict):
+    """Normalized token counts for one LLM response."""
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+_get_usage = itemgetter("prompt_tokens", "completion_tokens", "total_tokens")
+_get_message_usage = itemgetter("input_tokens", "output_tokens", "total_tokens")
+# Returned when a response reports no usage: shared and read-only, so the
+# common empty case allocates nothing. Copy it before mutating or JSON-encoding.
+_ZERO_USAGE = MappingProxyType({"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+
 
+def _counts(usage: dict, getter: itemgetter, prompt_key: str, completion_key: str) -> Tuple[int, int, int]:
+    """(prompt, completion, total) in one C-level call.
 
-def extract_token_usage(response) -> dict:
+    Missing counts default to 0, and a missing total to prompt + completion.
+    """
+    try:
+        return getter(usage)
+    except KeyError:
+        prompt = usage.get(prompt_key, 0)
+        completion = usage.get(completion_key, 0)
+        return prompt, completion, usage.get("total_tokens", prompt + completion)
+
+
+def _openai_usage(usage: dict) -> TokenUsage:
+    prompt, completion, total = _counts(usage, _get_usage, "prompt_tokens", "completion_tokens")
+    return {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": total}
+
+
+def _gemini_usage(usage: dict) -> TokenUsage:
+    prompt = usage.get("prompt_token_count", 0)
+    completion = usage.get("candidates_token_count", 0)
+    return {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": prompt + completion}
+
+
+# response_metadata key -> usage extractor, checked in order:
+# OpenAI reports token_usage, Gemini usage_metadata
+_METADATA_USAGE = (
+    ("token_usage", _openai_usage),
+    ("usage_metadata", _gemini_usage),
+)
+
+
+def extract_token_usage(response) -> TokenUsage:
     """
     Extract token usage from LLM response, handling different providers.
 
@@ -144,33 +452,23 @@ def extract_token_usage(response) -> dict:
         response: LLM response object
 
     Returns:
-        Dictionary with prompt_tokens, completion_tokens, and total_tokens
-    """
-    metadata = getattr(response, 'response_metadata', {})
-
-    # OpenAI format: response_metadata.token_usage
-    if 'token_usage' in metadata:
-        token_usage = metadata['token_usage']
-        return {
-            "prompt_tokens": token_usage.get("prompt_tokens", 0),
-            "completion_tokens": token_usage.get("completion_tokens", 0),
-            "total_tokens": token_usage.get("total_tokens", 0)
-        }
-
-    # Gemini format: response_metadata.usage_metadata
-    if 'usage_metadata' in metadata:
-        usage = metadata['usage_metadata']
-        prompt_tokens = usage.get('prompt_token_count', 0)
-        completion_tokens = usage.get('candidates_token_count', 0)
-        return {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": prompt_tokens + completion_tokens
-        }
-
-    # Fallback: return zeros if no token info found
-    return {
-        "prompt_tokens": 0,
-        "completion_tokens": 0,
-        "total_tokens": 0
-    }
+        TokenUsage with prompt_tokens, completion_tokens, and total_tokens
+        (a missing total is prompt + completion). A fresh dict when usage
+        was reported, else a shared read-only mapping of zeros (copy with
+        dict() before mutating it).
+    """
+    metadata = getattr(response, 'response_metadata', None)
+    if metadata:
+        for key, extract in _METADATA_USAGE:
+            usage = metadata.get(key)
+            if usage is not None:
+                return extract(usage)
+
+    # Streamed responses: usage arrives on the message's usage_metadata
+    usage = getattr(response, 'usage_metadata', None)
+    if usage:
+        prompt, completion, total = _counts(usage, _get_message_usage, "input_tokens", "output_tokens")
+        return {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": total}
+
+    # Fallback: shared zeros if no token info found
+    return cast(TokenUsage, _ZERO_USAGE)
@@ -1,20 +1,74 @@
 import logging
 import sys
-from typing import Optional
+import weakref
+from typing import Dict, Optional, TextIO
 from datetime import datetime
 from pathlib import Path
 
+
+def _close_files(files: Dict[str, TextIO]):
+    for f in files.values():
+        f.close()
+    files.clear()
+
+
 class PRDLogger:
     """Enhanced logging for PRD refinement process"""
 
+    _SEPARATOR = "=" * 60
+    _WIDE_SEPARATOR = "=" * 80
+
     def __init__(self, session_id: str, log_dir: str = "data/prds", verbose: bool = False):
         self.session_id = session_id
         self.verbose = verbose
         self.log_dir = Path(log_dir) / session_id
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set up file logger
-        self.file_logger = self._setup_file_logger()
+        # The directory and log file are created on first write, so a
+        # session that never logs costs no mkdir or open
+        self._dir_ready = False
+        self._file_logger: Optional[logging.Logger] = None
+        # Per-reviewer response and moderator output files stay open (and
+        # buffered) for the session instead of being reopened per entry;
+        # close() or collecting the logger flushes them
+        self._side_files: Dict[str, TextIO] = {}
+        weakref.finalize(self, _close_files, self._side_files)
+        # Timestamp shared by the side-file entries of the current iteration
+        self._iter_ts: Optional[str] = None
+
+    def _ensure_log_dir(self) -> Path:
+        """Create the session's log directory once, returning it"""
+        if not self._dir_ready:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        return self.log_dir
+
+    def begin_iteration(self):
+        """Flush the previous iteration's side-file entries and stamp the
+        ones written from now on with the current time"""
+        self.flush()
+        self._iter_ts = datetime.now().isoformat()
+
+    def flush(self):
+        """Write buffered side-file entries through to disk"""
+        for f in self._side_files.values():
+            f.flush()
+
+    def _timestamp(self) -> str:
+        return self._iter_ts or datetime.now().isoformat()
+
+    def _side_file(self, name: str) -> TextIO:
+        """Open (once) a file in the session's log directory for appending"""
+        f = self._side_files.get(name)
+        if f is None:
+            f = open(self._ensure_log_dir() / name, "a", encoding="utf-8", buffering=8192)
+            self._side_files[name] = f
+        return f
+
+    @property
+    def file_logger(self) -> logging.Logger:
+        """The session's file logger, set up on first use"""
+        if self._file_logger is None:
+            self._file_logger = self._setup_file_logger()
+        return self._file_logger
 
     def _setup_file_logger(self) -> logging.Logger:
         """Set up file logger for detailed logs"""
@@ -25,7 +79,7 @@ class PRDLogger:
         logger.handlers = []
 
         # File handler for detailed logs
-        log_file = self.log_dir / "refinement.log"
+        log_file = self._ensure_log_dir() / "refinement.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
 
@@ -39,50 +93,66 @@ class PRDLogger:
 
         return logger
 
-    def info(self, message: str, console: bool = True):
-        """Log info message"""
-        self.file_logger.info(message)
+    def close(self):
+        """Flush and release the log file handlers and side files"""
+        _close_files(self._side_files)
+        if self._file_logger is None:
+            return
+        for handler in list(self._file_logger.handlers):
+            handler.close()
+            self._file_logger.removeHandler(handler)
+
+    def info(self, message: str, *args, console: bool = True):
+        """Log info message (%-style args are formatted lazily)"""
+        self.file_logger.info(message, *args)
         if console:
-            print(message)
+            print(message % args if args else message)
 
-    def debug(self, message: str, console: bool = False):
-        """Log debug message"""
-        self.file_logger.debug(message)
+    def debug(self, message: str, *args, console: bool = False):
+        """Log debug message (%-style args are formatted lazily)"""
+        self.file_logger.debug(message, *args)
         if console and self.verbose:
-            print(f"[DEBUG] {message}")
+            print(f"[DEBUG] {message % args if args else message}")
+
+    def is_debug_enabled(self) -> bool:
+        """Whether debug records are emitted; lets callers skip building costly args"""
+        return self.file_logger.isEnabledFor(logging.DEBUG)
 
-    def warning(self, message: str, console: bool = True):
-        """Log warning message"""
-        self.file_logger.warning(message)
+    def warning(self, message: str, *args, console: bool = True):
+        """Log warning message (%-style args are formatted lazily)"""
+        self.file_logger.warning(message, *args)
         if console:
-            print(f"[WARNING] {message}")
+            print(f"[WARNING] {message % args if args else message}")
 
-    def error(self, message: str, console: bool = True):
-        """Log error message"""
-        self.file_logger.error(message)
+    def error(self, message: str, *args, console: bool = True):
+        """Log error message (%-style args are formatted lazily)"""
+        self.file_logger.error(message, *args)
         if console:
-            print(f"[ERROR] {message}")
+            print(f"[ERROR] {message % args if args else message}")
 
     def section(self, title: str, console: bool = True):
         """Log section header"""
-        separator = "=" * 60
+        separator = self._SEPARATOR
         self.file_logger.info(separator)
         self.file_logger.info(title)
         self.file_logger.info(separator)
         if console:
-            print(f"\n{separator}")
-            print(title)
-            print(separator)
+            # Multi-line console output goes out in one write per event
+            sys.stdout.write(f"\n{separator}\n{title}\n{separator}\n")
 
     def log_llm_request(self, agent: str, prompt_preview: str, max_length: int = 200):
         """Log LLM request"""
-        preview = prompt_preview[:max_length] + "..." if len(prompt_preview) > max_length else prompt_preview
-        self.file_logger.debug(f"[{agent}] Request prompt preview: {preview}")
-        self.debug(f"[{agent}] Sending request to LLM...", console=True)
+        if self.is_debug_enabled():
+            preview = prompt_preview[:max_length] + "..." if len(prompt_preview) > max_length else prompt_preview
+            self.file_logger.debug("[%s] Request prompt preview: %s", agent, preview)
+        self.debug("[%s] Sending request to LLM...", agent, console=True)
 
     def log_llm_response(self, agent: str, response: str, token_usage: Optional[dict] = None):
         """Log LLM response"""
-        self.file_logger.debug(f"[{agent}] Response: {response}")
+        # Responses can run to hundreds of KB; skip the record entirely
+        # when debug output is off
+        if self.is_debug_enabled():
+            self.file_logger.debug("[%s] Response: %s", agent, response)
 
         if token_usage:
             prompt_tokens = token_usage.get('prompt_tokens', 0)
@@ -90,7 +160,8 @@ class PRDLogger:
             total_tokens = token_usage.get('total_tokens', 0)
 
             self.file_logger.info(
-                f"[{agent}] Token usage: {prompt_tokens} prompt + {completion_tokens} completion = {total_tokens} total"
+                "[%s] Token usage: %s prompt + %s completion = %s total",
+                agent, prompt_tokens, completion_tokens, total_tokens,
             )
 
             if self.verbose:
@@ -98,73 +169,73 @@ class PRDLogger:
 
     def log_review_summary(self, reviewer: str, issues_count: int, high_count: int, response_preview: str):
         """Log review summary with preview"""
-        self.file_logger.info(f"[{reviewer}] Found {issues_count} issues ({high_count} high)")
+        self.file_logger.info("[%s] Found %s issues (%s high)", reviewer, issues_count, high_count)
 
         # Save full response to separate file
-        response_file = self.log_dir / f"{reviewer}_responses.log"
-        with open(response_file, 'a', encoding='utf-8') as f:
-            timestamp = datetime.now().isoformat()
-            f.write(f"\n{'='*60}\n")
-            f.write(f"Timestamp: {timestamp}\n")
-            f.write(f"{'='*60}\n")
-            f.write(response_preview)
-            f.write(f"\n\n")
+        separator = self._SEPARATOR
+        self._side_file(f"{reviewer}_responses.log").write(
+            f"\n{separator}\nTimestamp: {self._timestamp()}\n{separator}\n"
+            f"{response_preview}\n\n"
+        )
 
         if self.verbose:
             preview = response_preview[:300] + "..." if len(response_preview) > 300 else response_preview
-            print(f"\n  [{reviewer}] Overall Assessment Preview:")
-            print(f"  {preview}\n")
+            sys.stdout.write(f"\n  [{reviewer}] Overall Assessment Preview:\n  {preview}\n\n")
 
     def log_issues(self, reviewer: str, issues: list):
-        """Log detailed issues"""
+        """Log detailed issues (issue models, or their dumped dicts)"""
         if not issues:
             return
 
-        self.file_logger.info(f"[{reviewer}] Issues breakdown:")
+        self.file_logger.info("[%s] Issues breakdown:", reviewer)
+        lines = []
         for i, issue in enumerate(issues, 1):
-            severity = issue.get('severity', 'Unknown')
-            description = issue.get('description', 'No description')
-            fix = issue.get('suggested_fix', 'No fix suggested')
+            if isinstance(issue, dict):
+                severity = issue.get('severity', 'Unknown')
+                description = issue.get('description', 'No description')
+                fix = issue.get('suggested_fix', 'No fix suggested')
+            else:
+                severity, description, fix = issue.severity, issue.description, issue.suggested_fix
 
-            self.file_logger.info(f"  Issue {i} [{severity}]: {description}")
-            self.file_logger.info(f"    Fix: {fix}")
+            self.file_logger.info("  Issue %d [%s]: %s", i, severity, description)
+            self.file_logger.info("    Fix: %s", fix)
 
             if self.verbose:
-                print(f"  Issue {i} [{severity}]: {description[:100]}...")
+                lines.append(f"  Issue {i} [{severity}]: {description[:100]}...\n")
+
+        if lines:
+            sys.stdout.writelines(lines)
 
     def log_refinement(self, version: int, prev_length: int, new_length: int):
         """Log refinement details"""
         change_pct = ((new_length - prev_length) / prev_length * 100) if prev_length > 0 else 0
 
-        self.file_logger.info(f"Refinement v{version-1} -> v{version}:")
-        self.file_logger.info(f"  Content length: {prev_length} -> {new_length} chars ({change_pct:+.1f}%)")
+        self.file_logger.info("Refinement v%d -> v%d:", version - 1, version)
+        self.file_logger.info("  Content length: %d -> %d chars (%+.1f%%)", prev_length, new_length, change_pct)
 
         if self.verbose:
             print(f"  Refinement: {prev_length} -> {new_length} chars ({change_pct:+.1f}%)")
 
     def log_moderator_output(self, refined_content: str):
         """Log moderator's refined output"""
-        self.file_logger.debug(f"Moderator refined content:\n{refined_content}")
+        if self.is_debug_enabled():
+            self.file_logger.debug("Moderator refined content:\n%s", refined_content)
 
         # Save to separate file
-        moderator_file = self.log_dir / "moderator_outputs.log"
-        with open(moderator_file, 'a', encoding='utf-8') as f:
-            timestamp = datetime.now().isoformat()
-            f.write(f"\n{'='*80}\n")
-            f.write(f"Timestamp: {timestamp}\n")
-            f.write(f"{'='*80}\n")
-            f.write(refined_content)
-            f.write(f"\n\n")
+        separator = self._WIDE_SEPARATOR
+        self._side_file("moderator_outputs.log").write(
+            f"\n{separator}\nTimestamp: {self._timestamp()}\n{separator}\n"
+            f"{refined_content}\n\n"
+        )
 
         if self.verbose:
             preview = refined_content[:500] + "..." if len(refined_content) > 500 else refined_content
-            print(f"\n  [Moderator] Refined PRD Preview:")
-            print(f"  {preview}\n")
+            sys.stdout.write(f"\n  [Moderator] Refined PRD Preview:\n  {preview}\n\n")
 
     def log_convergence(self, converged: bool, reason: str, iteration: int):
         """Log convergence status"""
         status = "CONVERGED" if converged else "CONTINUING"
-        self.file_logger.info(f"[Iteration {iteration}] {status}: {reason}")
+        self.file_logger.info("[Iteration %s] %s: %s", iteration, status, reason)
 
         if self.verbose or converged:
             print(f"  Status: {reason}")
@@ -174,13 +245,13 @@ class PRDLogger:
         self.section("Token Usage Summary", console=False)
 
         for agent, tokens in total_tokens.items():
-            self.file_logger.info(f"{agent}: {tokens} tokens")
+            self.file_logger.info("%s: %s tokens", agent, tokens)
 
         total = sum(total_tokens.values())
-        self.file_logger.info(f"TOTAL: {total} tokens")
+        self.file_logger.info("TOTAL: %s tokens", total)
 
         if self.verbose:
-            print("\nToken Usage Summary:")
-            for agent, tokens in total_tokens.items():
-                print(f"  {agent}: {tokens:,} tokens")
-            print(f"  TOTAL: {total:,} tokens")
+            lines = ["\nToken Usage Summary:\n"]
+            lines.extend(f"  {agent}: {tokens:,} tokens\n" for agent, tokens in total_tokens.items())
+            lines.append(f"  TOTAL: {total:,} tokens\n")
+            sys.stdout.writelines(lines)
@@ -5,23 +5,37 @@ Test script for PRD Refinement API
 import requests
 import json
 import time
+from functools import cache
 from pathlib import Path
 
+from ai_orchestrator.utils.json_parsing import dump_bytes, loads
+
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection for every call in the suite
+SESSION = requests.Session()
+
+@cache
+def _prd_content():
+    """Read the test PRD once; None if it is missing"""
+    prd_file = Path("test_api_prd.md")
+    if not prd_file.exists():
+        return None
+    return prd_file.read_text(encoding="utf-8")
+
 def test_health():
     """Test health endpoint"""
     print("Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     assert response.status_code == 200
-    print(f"✓ Health check: {response.json()}")
+    print(f"✓ Health check: {loads(response.content)}")
 
 def test_list_sessions():
     """Test list sessions"""
     print("\nTesting list sessions...")
-    response = requests.get(f"{BASE_URL}/api/sessions/")
+    response = SESSION.get(f"{BASE_URL}/api/sessions/")
     assert response.status_code == 200
-    data = response.json()
+    data = loads(response.content)
     print(f"✓ Found {data['total']} sessions")
     return data['sessions']
 
@@ -30,25 +44,25 @@ def test_start_refinement():
     print("\nTesting start refinement...")
 
     # Read test PRD
-    prd_file = Path("test_api_prd.md")
-    if not prd_file.exists():
+    content = _prd_content()
+    if content is None:
         print("✗ test_api_prd.md not found")
         return None
 
-    content = prd_file.read_text()
-
     # Start refinement
-    response = requests.post(
+    # Encoded with orjson when installed; the PRD content can be tens of KB
+    response = SESSION.post(
         f"{BASE_URL}/api/refinement/start",
-        json={
+        data=dump_bytes({
             "title": "User Profile Management",
             "content": content,
             "max_iterations": 2  # Use 2 for faster testing
-        }
+        }),
+        headers={"Content-Type": "application/json"},
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = loads(response.content)
     print(f"✓ Refinement started: {data['session_id']}")
     return data['session_id']
 
@@ -56,12 +70,13 @@ def test_get_status(session_id):
     """Test getting refinement status"""
     print(f"\nTesting status for {session_id}...")
 
-    # Poll status
-    max_attempts = 60  # Wait up to 5 minutes
-    for i in range(max_attempts):
-        response = requests.get(f"{BASE_URL}/api/refinement/status/{session_id}")
+    # Poll status with exponential backoff
+    deadline = time.monotonic() + 300  # Wait up to 5 minutes
+    delay = 0.5
+    while True:
+        response = SESSION.get(f"{BASE_URL}/api/refinement/status/{session_id}")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
 
         print(f"  Iteration {data['current_iteration']}/{data['max_iterations']} - Status: {data['status']}")
 
@@ -75,7 +90,11 @@ def test_get_status(session_id):
             print(f"✗ Refinement failed: {data.get('convergence_reason', 'Unknown error')}")
             return None
 
-        time.sleep(5)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, 30)
 
     print("✗ Timeout waiting for completion")
     return None
@@ -83,9 +102,9 @@ def test_get_status(session_id):
 def test_get_final_prd(session_id, version):
     """Test getting final PRD"""
     print(f"\nTesting get PRD v{version}...")
-    response = requests.get(f"{BASE_URL}/api/sessions/{session_id}/prd/{version}")
+    response = SESSION.get(f"{BASE_URL}/api/sessions/{session_id}/prd/{version}")
     assert response.status_code == 200
-    data = response.json()
+    data = loads(response.content)
     print(f"✓ PRD retrieved: {len(data['content'])} characters")
     print(f"\nFirst 500 chars of refined PRD:")
     print("-" * 60)
@@ -96,9 +115,9 @@ def test_get_final_prd(session_id, version):
 def test_get_report(session_id):
     """Test getting convergence report"""
     print(f"\nTesting convergence report...")
-    response = requests.get(f"{BASE_URL}/api/sessions/{session_id}/report")
+    response = SESSION.get(f"{BASE_URL}/api/sessions/{session_id}/report")
     assert response.status_code == 200
-    data = response.json()
+    data = loads(response.content)
     print(f"✓ Report retrieved")
     print(f"  Iterations: {data['iterations']}")
     print(f"  Converged: {data['converged']}")
@@ -57,6 +57,18 @@ def make_iteration(
     )
 
 
+@pytest.fixture(scope="module")
+def reviews_no_high() -> tuple[Review, ...]:
+    """Shared read-only reviews with a single low issue (do not mutate)."""
+    return (make_review([("low", Severity.LOW)]),)
+
+
+@pytest.fixture(scope="module")
+def reviews_with_high() -> tuple[Review, ...]:
+    """Shared read-only reviews with a single high issue (do not mutate)."""
+    return (make_review([("high", Severity.HIGH)]),)
+
+
 class TestHasHighSeverityIssues:
     """Tests for has_high_severity_issues function."""
 
@@ -116,6 +128,28 @@ class TestCalculateDocumentDelta:
         # But the function handles None/empty specially
         assert delta == 1.0 or delta == 0.0  # depends on implementation
 
+    def test_large_document_small_edit(self):
+        """A one-word edit on a large document is well under the default threshold."""
+        doc = " ".join(f"word{i}" for i in range(10000))
+        edited = doc.replace("word5000", "changed", 1)
+        assert 0.0 < calculate_document_delta(doc, edited) < 0.001
+
+    def test_threshold_short_circuits_only_above_it(self):
+        """A length-based bound is returned only when it already meets the threshold."""
+        short = "alpha beta"
+        grown = short + " gamma delta epsilon zeta"
+        exact = calculate_document_delta(short, grown)
+        assert calculate_document_delta(short, grown, threshold=0.05) == pytest.approx(0.5)
+        assert exact == pytest.approx(0.5)
+
+        edited = "alpha beta gamma delta", "alpha beta gamma omega"
+        assert calculate_document_delta(*edited, threshold=0.05) == calculate_document_delta(*edited)
+
+    def test_word_counts_matter(self):
+        """Repeated words count per occurrence; word order does not."""
+        assert calculate_document_delta("a b", "b a") == 0.0
+        assert calculate_document_delta("a a b", "a b") == pytest.approx(0.2)
+
 
 class TestCountIssuesBySeverity:
     """Tests for count_issues_by_severity function."""
@@ -152,10 +186,10 @@ class TestDecideStop:
         decision = decide_stop(config, [])
         assert decision.should_stop is False
 
-    def test_stop_on_no_high_issues(self):
+    def test_stop_on_no_high_issues(self, reviews_no_high):
         """Stop when no high severity issues remain."""
         config = RoundtableConfig(max_iterations=3, stop_on_no_high_issues=True)
-        reviews = [make_review([("low", Severity.LOW)])]
+        reviews = reviews_no_high
         iterations = [make_iteration(1, reviews)]
 
         decision = decide_stop(config, iterations)
@@ -163,10 +197,10 @@ class TestDecideStop:
         assert decision.stopped_by == "no_high_issues"
         assert "0 remaining" in decision.reason
 
-    def test_stop_on_max_iterations(self):
+    def test_stop_on_max_iterations(self, reviews_with_high):
         """Stop when max iterations reached."""
         config = RoundtableConfig(max_iterations=2)
-        reviews = [make_review([("high", Severity.HIGH)])]
+        reviews = reviews_with_high
         iterations = [
             make_iteration(1, reviews),
             make_iteration(2, reviews),
@@ -177,10 +211,10 @@ class TestDecideStop:
         assert decision.stopped_by == "max_iterations"
         assert "Max iterations reached" in decision.reason
 
-    def test_stop_on_delta_threshold(self):
+    def test_stop_on_delta_threshold(self, reviews_with_high):
         """Stop when document delta is below threshold."""
         config = RoundtableConfig(max_iterations=10, delta_threshold=0.1)
-        reviews = [make_review([("high", Severity.HIGH)])]
+        reviews = reviews_with_high
 
         # Create iterations with nearly identical documents
         iterations = [
@@ -192,17 +226,30 @@ class TestDecideStop:
         assert decision.should_stop is True
         assert decision.stopped_by == "delta_threshold"
 
-    def test_continue_when_high_issues_remain(self):
+    def test_min_iterations_defers_early_convergence(self, reviews_no_high):
+        """No-high and delta stops wait until min_iterations have run."""
+        config = RoundtableConfig(max_iterations=5, min_iterations=2)
+        reviews = reviews_no_high
+
+        first = [make_iteration(1, reviews, "doc", "doc")]
+        decision = decide_stop(config, first)
+        assert decision.should_stop is False
+        assert decision.reason == "0 high severity issues remain"
+
+        both = first + [make_iteration(2, reviews, "doc", "doc")]
+        assert decide_stop(config, both).stopped_by == "no_high_issues"
+
+    def test_continue_when_high_issues_remain(self, reviews_with_high):
         """Continue when high issues remain and not at max iterations."""
         config = RoundtableConfig(max_iterations=5)
-        reviews = [make_review([("high", Severity.HIGH)])]
+        reviews = reviews_with_high
         iterations = [make_iteration(1, reviews)]
 
         decision = decide_stop(config, iterations)
         assert decision.should_stop is False
         assert "high severity issues remain" in decision.reason
 
-    def test_custom_stop_condition(self):
+    def test_custom_stop_condition(self, reviews_with_high):
         """Custom stop condition takes precedence."""
         def custom_stop(iterations: list) -> StopDecision:
             if len(iterations) >= 2:
@@ -221,7 +268,7 @@ class TestDecideStop:
             max_iterations=10,
             custom_stop_condition=custom_stop,
         )
-        reviews = [make_review([("high", Severity.HIGH)])]
+        reviews = reviews_with_high
         iterations = [
             make_iteration(1, reviews),
             make_iteration(2, reviews),
@@ -232,17 +279,39 @@ class TestDecideStop:
         assert decision.stopped_by == "custom"
 
 
+    def test_iteration_word_counts_are_reused(self, reviews_with_high):
+        """Each iteration's output is tokenized once across decide_stop calls."""
+        from ai_orchestrator.convergence import _iteration_delta
+
+        config = RoundtableConfig(max_iterations=10, delta_threshold=0.01)
+        first = make_iteration(1, reviews_with_high, "a", "alpha beta gamma")
+        second = make_iteration(2, reviews_with_high, "b", "alpha beta delta")
+        decide_stop(config, [first, second])
+        cached = first._word_cache
+        assert cached is not None
+
+        third = make_iteration(3, reviews_with_high, "c", "alpha beta delta epsilon")
+        decide_stop(config, [first, second, third])
+        assert first._word_cache is cached
+        assert _iteration_delta(second, third) == pytest.approx(
+            calculate_document_delta(second.output_document, third.output_document)
+        )
+
+        second.output_document = "alpha beta delta epsilon"
+        assert _iteration_delta(second, third) == 0.0
+        third.output_document = "zeta"
+        assert _iteration_delta(second, third) == 1.0
+
+
 class TestConvergenceCheckerBackwardsCompatibility:
     """Tests for ConvergenceChecker class (backwards compatibility)."""
 
-    def test_has_converged(self):
+    def test_has_converged(self, reviews_no_high, reviews_with_high):
         """Test has_converged static method."""
         # No high issues
-        reviews_no_high = [make_review([("low", Severity.LOW)])]
         assert ConvergenceChecker.has_converged(reviews_no_high) is True
 
         # Has high issues
-        reviews_with_high = [make_review([("high", Severity.HIGH)])]
         assert ConvergenceChecker.has_converged(reviews_with_high) is False
 
     def test_calculate_delta(self):
@@ -253,9 +322,9 @@ class TestConvergenceCheckerBackwardsCompatibility:
         delta = ConvergenceChecker.calculate_delta("aaa", "bbb")
         assert delta > 0.5
 
-    def test_get_convergence_reason(self):
+    def test_get_convergence_reason(self, reviews_no_high):
         """Test get_convergence_reason static method."""
-        reviews = [make_review([("low", Severity.LOW)])]
+        reviews = reviews_no_high
 
         converged, reason = ConvergenceChecker.get_convergence_reason(
             reviews=reviews,
@@ -264,3 +333,126 @@ class TestConvergenceCheckerBackwardsCompatibility:
         )
         assert converged is True
         assert "0 remaining" in reason
+
+
+class TestSeverityScanCache:
+    """Tests for memoized per-review severity scans."""
+
+    def test_repeated_counts_are_stable(self):
+        """Repeated scans of the same reviews return identical counts."""
+        reviews = [make_review([("h", Severity.HIGH), ("l", Severity.LOW)])]
+        first = count_issues_by_severity(reviews)
+        assert count_issues_by_severity(reviews) == first
+        assert has_high_severity_issues(reviews) is True
+
+    def test_cache_invalidated_when_issues_change(self):
+        """Appending issues to a cached review is picked up."""
+        review = make_review([("l", Severity.LOW)])
+        assert has_high_severity_issues([review]) is False
+        review.issues.append(
+            Issue(category="test", description="new", severity=Severity.HIGH)
+        )
+        assert has_high_severity_issues([review]) is True
+        assert count_issues_by_severity([review]) == {"high": 1, "medium": 0, "low": 1}
+
+    def test_counts_follow_issue_edits(self):
+        """Replacing the issue list or editing any issue is reflected."""
+        review = make_review([("a", Severity.HIGH), ("b", Severity.HIGH), ("c", Severity.HIGH)])
+        assert review.severity_counts() == (3, 0, 0)
+        review.issues[1].severity = Severity.LOW
+        assert review.severity_counts() == (2, 0, 1)
+        review.issues = [Issue(category="test", description="l", severity=Severity.LOW)]
+        assert review.has_high is False
+        assert review.severity_counts() == (0, 0, 1)
+
+
+class TestLegacyDocumentConvergenceChecker:
+    """Tests for utils.convergence.ConvergenceChecker on document models."""
+
+    @staticmethod
+    def _review(*severities: str):
+        from ai_orchestrator.models.document_models import DocumentIssue, DocumentReview
+
+        return DocumentReview(
+            reviewer_name="Critic",
+            issues=[
+                DocumentIssue(category="General", description="x", severity=s, reviewer="Critic")
+                for s in severities
+            ],
+            overall_assessment="ok",
+        )
+
+    def test_reasons_in_priority_order(self):
+        from ai_orchestrator.models.document_models import Document
+        from ai_orchestrator.utils.convergence import ConvergenceChecker as DocChecker
+
+        high = [self._review("High", "Low"), self._review("High")]
+        same = Document(version=1, title="t", content="same text")
+
+        assert DocChecker.has_converged([self._review("Low")]) is True
+        assert DocChecker.has_converged(high) is False
+        assert DocChecker.get_convergence_reason([self._review("Medium")], 1, 3) == (
+            True, "No high severity issues (0 remaining)"
+        )
+        converged, reason = DocChecker.get_convergence_reason(high, 3, 3, same, same)
+        assert converged and reason.startswith("Max iterations reached (3). 2 high")
+        converged, reason = DocChecker.get_convergence_reason(high, 1, 3, same, same)
+        assert converged and reason.startswith("Document stable")
+        assert DocChecker.get_convergence_reason(high, 1, 3) == (
+            False, "2 high severity issues remain"
+        )
+
+    def test_prd_reviews_normalize_severity(self):
+        from ai_orchestrator.models.prd_models import PRDIssue, PRDReview
+        from ai_orchestrator.utils.convergence import ConvergenceChecker as DocChecker
+
+        issue = PRDIssue(
+            category="product", description="x", severity="high",
+            suggested_fix="y", reviewer="Critic",
+        )
+        assert issue.severity is Severity.HIGH
+        assert issue.severity == "High"
+        assert issue.model_dump(mode="json")["severity"] == "High"
+
+        review = PRDReview(reviewer="Critic", issues=[issue], overall_assessment="ok")
+        assert DocChecker.has_converged([review]) is False
+        assert DocChecker.get_convergence_reason([review], 1, 3)[1] == "1 high severity issues remain"
+
+
+class TestCoreTypeLayout:
+    """Hot core types are slotted; stop decisions are immutable values."""
+
+    def test_slotted_types_have_no_instance_dict(self):
+        review = make_review([("high", Severity.HIGH)])
+        iteration = make_iteration(0, [review])
+        for obj in (review, review.issues[0], iteration):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            review.issues[0].extra = 1
+
+    def test_stop_decision_is_frozen_and_hashable(self):
+        decision = StopDecision(should_stop=True, reason="r", stopped_by="custom")
+        assert decision == StopDecision(should_stop=True, reason="r", stopped_by="custom")
+        assert len({decision, StopDecision(True, "r", "custom")}) == 1
+        with pytest.raises(AttributeError):
+            decision.should_stop = False
+
+    def test_iteration_issue_stats_follow_review_changes(self):
+        review = make_review([("high", Severity.HIGH), ("low", Severity.LOW)])
+        iteration = make_iteration(0, [review])
+
+        first = iteration.all_issues
+        assert iteration.all_issues is not first
+        assert iteration.high_severity_count == 1
+
+        review.issues[0] = Issue(category="t", description="d", severity=Severity.LOW)
+        assert iteration.high_severity_count == 0
+        review.issues[0] = Issue(category="t", description="d", severity=Severity.HIGH)
+
+        review.issues.append(Issue(category="t", description="d", severity=Severity.HIGH))
+        assert len(iteration.all_issues) == 3
+        assert iteration.high_severity_count == 2
+
+        iteration.reviews = []
+        assert iteration.all_issues == []
+        assert iteration.high_severity_count == 0
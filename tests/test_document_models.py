@@ -0,0 +1,185 @@
+"""
+Tests for the generic document models.
+"""
+import pytest
+from pydantic import ValidationError
+
+from ai_orchestrator import Severity
+from ai_orchestrator.models.document_models import Document, DocumentIssue, DocumentReview
+
+
+def make_review(*severities: str, reviewer: str = "Critic") -> DocumentReview:
+    """Helper to create a DocumentReview with one issue per severity."""
+    return DocumentReview(
+        reviewer_name=reviewer,
+        issues=[
+            DocumentIssue(
+                category="General",
+                description=f"Issue {i}",
+                severity=severity,
+                reviewer=reviewer,
+            )
+            for i, severity in enumerate(severities)
+        ],
+        overall_assessment="ok",
+    )
+
+
+def make_document(**kwargs) -> Document:
+    return Document(version=1, title="Doc", content="Body", **kwargs)
+
+
+class TestIssueTallies:
+    """Severity counts always reflect the current reviews."""
+
+    def test_empty_document(self):
+        doc = make_document()
+        assert doc.get_issue_counts() == {"high": 0, "medium": 0, "low": 0}
+        assert doc.has_high_severity_issues() is False
+        assert doc.get_all_issues() == []
+
+    def test_add_review_updates_counts(self):
+        doc = make_document()
+        doc.add_review(make_review("Medium", "Low"))
+        assert doc.has_high_severity_issues() is False
+
+        doc.add_review(make_review("High", "Low"))
+        assert doc.get_issue_counts() == {"high": 1, "medium": 1, "low": 2}
+        assert doc.has_high_severity_issues() is True
+        assert len(doc.get_all_issues()) == 4
+
+    def test_reviews_passed_to_constructor_are_counted(self):
+        doc = make_document(reviews=[make_review("High"), make_review("Low")])
+        assert doc.get_issue_counts() == {"high": 1, "medium": 0, "low": 1}
+        assert doc.has_high_severity_issues() is True
+
+    def test_direct_append_is_picked_up(self):
+        doc = make_document()
+        doc.add_review(make_review("Low"))
+        doc.reviews.append(make_review("High"))
+        assert doc.get_issue_counts() == {"high": 1, "medium": 0, "low": 1}
+        assert doc.has_high_severity_issues() is True
+
+    def test_cleared_reviews_reset_counts(self):
+        doc = make_document(reviews=[make_review("High")])
+        assert doc.has_high_severity_issues() is True
+        doc.reviews.clear()
+        assert doc.get_issue_counts() == {"high": 0, "medium": 0, "low": 0}
+        assert doc.has_high_severity_issues() is False
+
+    def test_iter_all_issues_is_lazy_and_ordered(self):
+        doc = make_document(reviews=[make_review("High", "Low"), make_review("Medium")])
+        issues = doc.iter_all_issues()
+        assert next(issues).severity == "High"
+        assert [i.severity for i in doc.get_all_issues()] == ["High", "Low", "Medium"]
+
+    def test_returned_counts_are_a_copy(self):
+        doc = make_document(reviews=[make_review("High")])
+        doc.get_issue_counts()["high"] = 99
+        assert doc.get_issue_counts()["high"] == 1
+
+    def test_in_place_version_bump_resets_tallies(self):
+        doc = make_document(reviews=[make_review("High")])
+        assert doc.has_high_severity_issues() is True
+        doc.version += 1
+        doc.reviews.clear()
+        doc.add_review(make_review("Low"))
+        assert doc.get_issue_counts() == {"high": 0, "medium": 0, "low": 1}
+        assert doc.has_high_severity_issues() is False
+
+    def test_replaced_reviews_are_recounted(self):
+        doc = make_document(reviews=[make_review("High")])
+        assert doc.has_high_severity_issues() is True
+        doc.reviews[0] = make_review("Low")
+        assert doc.has_high_severity_issues() is False
+        doc.reviews.clear()
+        doc.reviews.append(make_review("Medium"))
+        assert doc.get_issue_counts() == {"high": 0, "medium": 1, "low": 0}
+
+
+class TestSerialization:
+    """to_dict/from_dict round-trip through pydantic."""
+
+    def test_to_dict_shape(self):
+        doc = make_document(reviews=[make_review("High")])
+        data = doc.to_dict()
+        assert set(data) == {
+            "version", "title", "content", "document_type", "metadata", "created_at", "reviews"
+        }
+        issue = data["reviews"][0]["issues"][0]
+        assert issue == {
+            "category": "General",
+            "description": "Issue 0",
+            "severity": "High",
+            "suggested_fix": None,
+            "reviewer": "Critic",
+        }
+
+    def test_round_trip(self):
+        doc = make_document(reviews=[make_review("High", "Low")], metadata={"k": 1})
+        restored = Document.from_dict(doc.to_dict())
+        assert restored == doc
+        assert restored.get_issue_counts() == {"high": 1, "medium": 0, "low": 1}
+
+    def test_from_dict_fills_defaults(self):
+        restored = Document.from_dict({"version": 2, "title": "T", "content": "C"})
+        assert restored.document_type == "document"
+        assert restored.metadata == {}
+        assert restored.reviews == []
+
+
+class TestReviewCounts:
+    """DocumentReview exposes issue counts computed from its issues."""
+
+    def test_counts(self):
+        review = make_review("High", "Low", "High")
+        assert review.high_count == 2
+        assert review.total_count == 3
+
+    def test_counts_follow_issue_edits(self):
+        review = make_review("High", "Low", "High")
+        assert review.high_count == 2
+        review.issues[0].severity = Severity.LOW
+        review.issues.pop()
+        assert review.high_count == 0
+        assert review.total_count == 2
+
+    def test_counts_are_not_serialized(self):
+        review = make_review("High")
+        assert review.high_count == 1
+        assert "high_count" not in review.model_dump()
+        assert review == make_review("High").model_copy(update={"timestamp": review.timestamp})
+
+
+class TestSeverityCoercion:
+    """DocumentIssue.severity is stored as the Severity enum singleton."""
+
+    def test_strings_coerce_case_insensitively(self):
+        for text in ("High", "high", " HIGH "):
+            issue = DocumentIssue(category="c", description="d", severity=text, reviewer="r")
+            assert issue.severity is Severity.HIGH
+
+    def test_serializes_as_plain_string(self):
+        issue = DocumentIssue(category="c", description="d", severity="medium", reviewer="r")
+        assert issue.model_dump(mode="json")["severity"] == "Medium"
+        assert f"[{issue.severity}]" == "[Medium]"
+
+    def test_unknown_severity_falls_back_to_low(self):
+        for text in ("Critical", "Minor", ""):
+            issue = DocumentIssue(category="c", description="d", severity=text, reviewer="r")
+            assert issue.severity is Severity.LOW
+
+    def test_review_with_unknown_severity_still_loads(self):
+        review = DocumentReview.model_validate({
+            "reviewer_name": "Critic",
+            "overall_assessment": "ok",
+            "issues": [
+                {"category": "c", "description": "d", "severity": "Critical", "reviewer": "r"},
+                {"category": "c", "description": "d", "severity": "High", "reviewer": "r"},
+            ],
+        })
+        assert [i.severity for i in review.issues] == [Severity.LOW, Severity.HIGH]
+
+    def test_non_string_severity_rejected(self):
+        with pytest.raises(ValidationError):
+            DocumentIssue(category="c", description="d", severity=3, reviewer="r")
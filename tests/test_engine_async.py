@@ -0,0 +1,72 @@
+"""
+Tests for concurrent participant reviews.
+"""
+import asyncio
+
+import pytest
+
+from ai_orchestrator.models.document_models import Document, DocumentReview
+from ai_orchestrator.orchestration import engine_async
+from ai_orchestrator.orchestration.engine_async import areview_document
+
+
+class SlowCritic:
+    """Critic whose review takes a fixed time and records peak concurrency."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, delay: float = 0.05, failures: int = 0):
+        self.name = name
+        self.delay = delay
+        self.failures = failures
+
+    async def areview(self, document, logger=None):
+        SlowCritic.active += 1
+        SlowCritic.peak = max(SlowCritic.peak, SlowCritic.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("transient")
+            review = DocumentReview(reviewer_name=self.name, overall_assessment="ok")
+            return review, {"total_tokens": 1}
+        finally:
+            SlowCritic.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_critics(monkeypatch):
+    SlowCritic.active = 0
+    SlowCritic.peak = 0
+    monkeypatch.setattr(engine_async, "RETRY_BACKOFF_S", 0)
+
+
+@pytest.fixture
+def document():
+    return Document(version=1, title="Test", content="content")
+
+
+class TestAreviewDocument:
+    """Tests for areview_document."""
+
+    async def test_reviews_run_concurrently_in_order(self, document):
+        """All critics run at once and results keep critic order."""
+        critics = [SlowCritic(f"critic_{i}") for i in range(4)]
+        results = await areview_document(document, critics)
+        assert [r.reviewer_name for r, _ in results] == [c.name for c in critics]
+        assert SlowCritic.peak == 4
+
+    async def test_concurrency_is_bounded(self, document):
+        """The semaphore caps in-flight reviews."""
+        critics = [SlowCritic(f"critic_{i}") for i in range(5)]
+        await areview_document(document, critics, max_concurrency=2)
+        assert SlowCritic.peak == 2
+
+    async def test_failed_review_is_retried_once(self, document):
+        """A transient failure is retried; a persistent one is raised."""
+        results = await areview_document(document, [SlowCritic("flaky", failures=1)])
+        assert results[0][0].reviewer_name == "flaky"
+
+        with pytest.raises(RuntimeError):
+            await areview_document(document, [SlowCritic("broken", failures=2)])
@@ -0,0 +1,70 @@
+"""
+Tests for fast LLM response parsing.
+"""
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from ai_orchestrator.utils.json_parsing import dump_bytes, dumps, fast_parse, loads, strip_fences
+
+
+class Sample(BaseModel):
+    name: str
+    count: int
+
+
+class TestFastParse:
+    """Tests for fast_parse and strip_fences."""
+
+    def test_plain_json(self):
+        """Bare JSON validates into the model."""
+        result = fast_parse('{"name": "a", "count": 2}', Sample)
+        assert isinstance(result, Sample)
+        assert result.count == 2
+
+    def test_fenced_json(self):
+        """Markdown fences are stripped before decoding."""
+        text = '```json\n{"name": "a", "count": 2}\n```'
+        assert strip_fences(text) == '{"name": "a", "count": 2}'
+        assert fast_parse(text, Sample).name == "a"
+
+    def test_invalid_json_raises(self):
+        """Malformed JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            fast_parse("not json", Sample)
+
+    def test_schema_mismatch_raises(self):
+        """Data not matching the model raises ValidationError."""
+        with pytest.raises(ValidationError):
+            fast_parse('{"name": "a"}', Sample)
+
+    def test_repairs_trailing_commas_and_smart_quotes(self):
+        """Near-valid JSON is repaired before validation."""
+        text = '```json\n{“name”: "a", "count": 2,}\n```'
+        assert fast_parse(text, Sample).count == 2
+
+
+class TestDumps:
+    """dumps() round-trips through loads() in both layouts."""
+
+    def test_compact_is_single_line(self):
+        text = dumps({"a": [1, 2], "b": "é"})
+        assert "\n" not in text
+        assert loads(text) == {"a": [1, 2], "b": "é"}
+
+    def test_indented(self):
+        text = dumps({"a": {"b": 1}}, indent=True)
+        assert text.splitlines()[1].startswith('  "a"')
+        assert loads(text) == {"a": {"b": 1}}
+
+    def test_bytes_are_utf8_and_decode_directly(self):
+        data = dump_bytes({"b": "é"})
+        assert data == dumps({"b": "é"}).encode("utf-8")
+        assert "é".encode("utf-8") in data
+        assert loads(data) == {"b": "é"}
+
+    def test_non_string_keys_are_coerced_like_stdlib(self):
+        import json
+
+        value = {"a": {1: "x", None: "z"}}
+        assert loads(dumps(value)) == json.loads(json.dumps(value))
+        assert loads(dump_bytes(value, indent=True)) == {"a": {"1": "x", "null": "z"}}
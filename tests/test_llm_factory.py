@@ -0,0 +1,231 @@
+"""
+Tests for LLM client construction and caching.
+"""
+import asyncio
+
+import pytest
+
+from ai_orchestrator.utils import llm_factory
+
+
+@pytest.fixture
+def built(monkeypatch):
+    """Record client constructions instead of creating real clients."""
+    calls = []
+
+    def fake_openai(model, temperature, json_mode=True, **kwargs):
+        calls.append((model, temperature, json_mode, kwargs))
+        return object()
+
+    monkeypatch.setattr(llm_factory, "_create_openai_llm", fake_openai)
+    monkeypatch.setenv("OPENAI_API_KEY", "key-1")
+    llm_factory.refresh_env()
+    llm_factory._cached_llm.cache_clear()
+    yield calls
+    llm_factory.refresh_env()
+    llm_factory._cached_llm.cache_clear()
+
+
+class TestCreateLLMCache:
+    """create_llm returns one shared client per distinct configuration."""
+
+    def test_same_arguments_share_a_client(self, built):
+        a = llm_factory.create_llm("gpt-4o", temperature=0.2, max_tokens=100)
+        b = llm_factory.create_llm("gpt-4o", max_tokens=100, temperature=0.2)
+        assert a is b
+        assert len(built) == 1
+
+    def test_different_arguments_get_distinct_clients(self, built):
+        a = llm_factory.create_llm("gpt-4o")
+        assert llm_factory.create_llm("gpt-4o", json_mode=False) is not a
+        assert llm_factory.create_llm("gpt-4o", temperature=0.7) is not a
+        assert len(built) == 3
+
+    def test_api_key_change_builds_a_new_client(self, built, monkeypatch):
+        a = llm_factory.create_llm("gpt-4o")
+        monkeypatch.setenv("OPENAI_API_KEY", "key-2")
+        # Keys are snapshotted until refresh_env()
+        assert llm_factory.create_llm("gpt-4o") is a
+        llm_factory.refresh_env()
+        assert llm_factory.create_llm("gpt-4o") is not a
+
+    def test_unhashable_kwargs_are_not_cached(self, built):
+        a = llm_factory.create_llm("gpt-4o", callbacks=[])
+        b = llm_factory.create_llm("gpt-4o", callbacks=[])
+        assert a is not b
+        assert built[0][3] == {"callbacks": []}
+
+
+class TestProviderClasses:
+    """Provider SDK classes are resolved once and reused."""
+
+    def test_openai_class_is_cached(self):
+        cls = llm_factory._openai_cls()
+        assert cls is llm_factory._openai_cls()
+        assert cls.__name__ == "ChatOpenAI"
+
+
+class TestProviderDispatch:
+    """Model names map to providers through one memoized prefix lookup."""
+
+    @pytest.mark.parametrize(
+        "model, provider",
+        [
+            ("gemini-2.0-flash", "google"),
+            ("gpt-4o", "openai"),
+            ("o3-mini", "openai"),
+            ("ft:gemini-like", "openai"),  # prefixes are anchored
+        ],
+    )
+    def test_provider_helpers_agree(self, model, provider):
+        assert llm_factory.get_model_provider(model) == provider
+        assert llm_factory.is_gemini_model(model) is (provider == "google")
+        assert llm_factory.is_openai_model(model) is (provider == "openai")
+
+    def test_gemini_models_use_the_gemini_builder(self, built, monkeypatch):
+        seen = []
+        monkeypatch.setattr(
+            llm_factory, "_create_gemini_llm", lambda model, temperature, **kw: seen.append(model)
+        )
+        llm_factory.create_llm("gemini-1.5-pro")
+        assert seen == ["gemini-1.5-pro"]
+        assert built == []
+
+
+class TestGetModelName:
+    """get_model_name reads the right attribute per LLM class."""
+
+    def test_attribute_per_class(self):
+        class Named:
+            model_name = "gpt-4o"
+
+        class Modeled:
+            def __init__(self, model):
+                self.model = model
+
+        class Anonymous:
+            pass
+
+        assert llm_factory.get_model_name(Named()) == "gpt-4o"
+        assert llm_factory.get_model_name(Modeled("gemini-a")) == "gemini-a"
+        assert llm_factory.get_model_name(Modeled("gemini-b")) == "gemini-b"
+        assert llm_factory.get_model_name(Anonymous()) == "Anonymous"
+        assert llm_factory._MODEL_ATTR_CACHE[Modeled] == "model"
+
+
+class TestExtractTokenUsage:
+    """Token usage is normalized across provider response shapes."""
+
+    @pytest.mark.parametrize(
+        "response_metadata, usage_metadata, expected",
+        [
+            ({"token_usage": {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": 7}}, None, (3, 4, 7)),
+            ({"token_usage": {"prompt_tokens": 3}}, None, (3, 0, 3)),
+            ({"usage_metadata": {"prompt_token_count": 2, "candidates_token_count": 5}}, None, (2, 5, 7)),
+            ({}, {"input_tokens": 1, "output_tokens": 2, "total_tokens": 3}, (1, 2, 3)),
+            ({}, None, (0, 0, 0)),
+        ],
+    )
+    def test_shapes(self, response_metadata, usage_metadata, expected):
+        class Response:
+            pass
+
+        response = Response()
+        response.response_metadata = response_metadata
+        response.usage_metadata = usage_metadata
+        usage = llm_factory.extract_token_usage(response)
+        assert (usage["prompt_tokens"], usage["completion_tokens"], usage["total_tokens"]) == expected
+
+    def test_missing_usage_returns_shared_zeros(self):
+        class Response:
+            response_metadata = {}
+
+        first = llm_factory.extract_token_usage(Response())
+        assert first is llm_factory.extract_token_usage(object())
+        assert dict(first) == {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        with pytest.raises(TypeError):
+            first["total_tokens"] = 1
+
+
+class TestRunReviewers:
+    """Reviewer prompts are invoked concurrently and returned in order."""
+
+    class SlowLLM:
+        def __init__(self, name, delay, log):
+            self.name, self.delay, self.log = name, delay, log
+
+        async def ainvoke(self, prompt):
+            self.log.append(("start", self.name))
+            await asyncio.sleep(self.delay)
+            self.log.append(("end", self.name))
+            return f"{self.name}:{prompt}"
+
+    def test_calls_overlap_and_keep_order(self):
+        log = []
+        llms = [self.SlowLLM("a", 0.02, log), self.SlowLLM("b", 0.0, log)]
+        assert llm_factory.run_reviewers(llms, ["x", "y"]) == ["a:x", "b:y"]
+        assert log[:2] == [("start", "a"), ("start", "b")]
+
+    def test_max_concurrency_serializes(self):
+        log = []
+        llms = [self.SlowLLM("a", 0.01, log), self.SlowLLM("b", 0.0, log)]
+        llm_factory.run_reviewers(llms, ["x", "y"], max_concurrency=1)
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            llm_factory.run_reviewers([self.SlowLLM("a", 0, [])], [])
+
+
+class TestHTTPClients:
+    """The sync client is process-wide; async clients never outlive their loop."""
+
+    def test_sync_client_is_shared(self):
+        assert llm_factory.get_http_client() is llm_factory.get_http_client()
+
+    def test_async_client_per_loop(self):
+        async def two_lookups():
+            get = llm_factory.get_http_client
+            return get(async_client=True), get(async_client=True)
+
+        first, again = asyncio.run(two_lookups())
+        second, _ = asyncio.run(two_lookups())
+        assert first is again
+        assert second is not first
+
+    def test_async_client_needs_a_running_loop(self):
+        with pytest.raises(RuntimeError):
+            llm_factory.get_http_client(async_client=True)
+
+
+class TestLLMCacheSetting:
+    """AI_ORCHESTRATOR_LLM_CACHE installs LangChain's global LLM cache once."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        from langchain_core.globals import set_llm_cache
+
+        llm_factory.configure_llm_cache.cache_clear()
+        yield
+        set_llm_cache(None)
+        llm_factory.configure_llm_cache.cache_clear()
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv(llm_factory.LLM_CACHE_ENV, raising=False)
+        assert llm_factory.configure_llm_cache() is None
+
+    def test_memory_cache(self, built, monkeypatch):
+        from langchain_core.caches import InMemoryCache
+        from langchain_core.globals import get_llm_cache
+
+        monkeypatch.setenv(llm_factory.LLM_CACHE_ENV, "memory")
+        llm_factory.create_llm("gpt-4o")
+        installed = get_llm_cache()
+        assert isinstance(installed, InMemoryCache)
+        llm_factory.create_llm("gpt-4o-mini")
+        assert get_llm_cache() is installed
+
+    def test_unknown_mode(self, monkeypatch):
+        monkeypatch.setenv(llm_factory.LLM_CACHE_ENV, "semantic")
+        with pytest.raises(ValueError):
+            llm_factory.configure_llm_cache()
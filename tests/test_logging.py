@@ -0,0 +1,201 @@
+"""
+Tests for OrchestratorLogger.
+"""
+from ai_orchestrator import OrchestratorLogger
+from ai_orchestrator.utils.logger import PRDLogger
+
+
+class TestOrchestratorLogger:
+    """Tests for background file logging."""
+
+    def test_close_flushes_records_to_file(self, tmp_path):
+        """Records queued before close() are written to the log file."""
+        logger = OrchestratorLogger("s1", log_dir=str(tmp_path), console_output=False)
+        logger.info("hello from the orchestrator")
+        logger.close()
+
+        log_file = tmp_path / "s1" / "refinement.log"
+        assert "hello from the orchestrator" in log_file.read_text()
+
+    def test_close_is_idempotent(self, tmp_path):
+        """Closing twice (or via the context manager) is safe."""
+        with OrchestratorLogger("s2", log_dir=str(tmp_path), console_output=False) as logger:
+            logger.debug("message")
+        logger.close()
+
+    def test_console_routing_respects_verbosity(self, tmp_path, capsys):
+        """Plain info is console-only when verbose; milestones and warnings always show."""
+        logger = OrchestratorLogger("s3", log_dir=str(tmp_path))
+        logger.info("detail line")
+        logger.warning("careful")
+        logger.log_iteration_start(1, 3)
+        logger.close()
+
+        out = capsys.readouterr().out
+        assert "detail line" not in out
+        assert "[WARNING] careful" in out
+        assert "\nIteration 1/3\n" in out
+
+    def test_errors_go_to_stderr(self, tmp_path, capsys):
+        """Errors are printed to stderr, not stdout."""
+        logger = OrchestratorLogger("s5", log_dir=str(tmp_path))
+        logger.error("boom")
+        logger.close()
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == "  [ERROR] boom\n"
+
+    def test_console_output_disabled(self, tmp_path, capsys):
+        """console_output=False silences the console entirely."""
+        logger = OrchestratorLogger("s4", log_dir=str(tmp_path), console_output=False)
+        logger.error("boom")
+        logger.close()
+        assert capsys.readouterr() == ("", "")
+
+    def test_log_file_is_utf8(self, tmp_path):
+        """The log file is written as UTF-8 whatever the locale encoding."""
+        logger = OrchestratorLogger("s6", log_dir=str(tmp_path), console_output=False)
+        assert logger._file_handler.encoding == "utf-8"
+        logger.info("café ✓")
+        logger.close()
+
+        log_file = tmp_path / "s6" / "refinement.log"
+        assert "café ✓" in log_file.read_text(encoding="utf-8")
+
+    def test_recreates_removed_log_dir(self, tmp_path):
+        """A cached directory that was deleted is recreated on the next session."""
+        import shutil
+
+        OrchestratorLogger("s1", log_dir=str(tmp_path), console_output=False).close()
+        shutil.rmtree(tmp_path / "s1")
+        with OrchestratorLogger("s1", log_dir=str(tmp_path), console_output=False) as logger:
+            logger.info("again")
+        assert "again" in (tmp_path / "s1" / "refinement.log").read_text()
+
+    def test_debug_skipped_when_level_raised(self, tmp_path):
+        """track_tokens still accumulates but emits nothing once DEBUG is off."""
+        import logging
+
+        logger = OrchestratorLogger("s1", log_dir=str(tmp_path), console_output=False)
+        logger.logger.setLevel(logging.INFO)
+        assert logger.is_debug_enabled() is False
+        logger.track_tokens("critic", {"total_tokens": 5})
+        logger.close()
+        assert logger.token_usage == {"critic": 5}
+        assert "Token usage" not in (tmp_path / "s1" / "refinement.log").read_text()
+
+    def test_token_summary_uses_precomputed_totals(self, tmp_path):
+        """log_token_summary() logs a summary passed in instead of recomputing it."""
+        with OrchestratorLogger("s1", log_dir=str(tmp_path), console_output=False) as logger:
+            logger.track_tokens("critic", {"total_tokens": 5})
+            logger.log_token_summary({"critic": 1200, "total": 1200})
+        text = (tmp_path / "s1" / "refinement.log").read_text()
+        assert "critic: 1,200 tokens" in text
+        assert "TOTAL: 1,200 tokens" in text
+
+
+class TestPRDLogger:
+    """The legacy PRD logger touches the filesystem only once it writes."""
+
+    def test_unused_session_creates_nothing(self, tmp_path):
+        logger = PRDLogger("s1", log_dir=str(tmp_path))
+        logger.close()
+        assert not (tmp_path / "s1").exists()
+
+    def test_first_write_creates_log(self, tmp_path, capsys):
+        logger = PRDLogger("s1", log_dir=str(tmp_path))
+        logger.info("hello %s", "world")
+        logger.log_moderator_output("refined")
+        logger.close()
+
+        assert "hello world" in (tmp_path / "s1" / "refinement.log").read_text()
+        assert "refined" in (tmp_path / "s1" / "moderator_outputs.log").read_text()
+        assert capsys.readouterr().out == "hello world\n"
+
+    def test_side_files_are_opened_once(self, tmp_path, monkeypatch):
+        import builtins
+        import gc
+
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        logger = PRDLogger("s1", log_dir=str(tmp_path), verbose=False)
+        for i in range(3):
+            logger.log_review_summary("Critic", 1, 0, f"response {i}")
+            logger.log_moderator_output(f"draft {i}")
+        monkeypatch.undo()
+        del logger
+        gc.collect()  # collecting the logger flushes its side files
+
+        assert sorted(p for p in opened if not p.endswith("refinement.log")) == sorted([
+            str(tmp_path / "s1" / "Critic_responses.log"),
+            str(tmp_path / "s1" / "moderator_outputs.log"),
+        ])
+        responses = (tmp_path / "s1" / "Critic_responses.log").read_text()
+        assert [f"response {i}" in responses for i in range(3)] == [True] * 3
+        assert "draft 2" in (tmp_path / "s1" / "moderator_outputs.log").read_text()
+
+    def test_llm_dumps_skipped_when_level_raised(self, tmp_path):
+        import logging
+
+        logger = PRDLogger("s1", log_dir=str(tmp_path))
+        logger.file_logger.setLevel(logging.INFO)
+        logger.log_llm_request("Critic", "prompt body")
+        logger.log_llm_response("Critic", "response body", {"total_tokens": 7})
+        logger.close()
+
+        log = (tmp_path / "s1" / "refinement.log").read_text()
+        assert "prompt body" not in log and "response body" not in log
+        assert "[Critic] Token usage: 0 prompt + 0 completion = 7 total" in log
+
+    def test_iteration_timestamp_is_shared(self, tmp_path):
+        logger = PRDLogger("s1", log_dir=str(tmp_path), verbose=False)
+        logger.begin_iteration()
+        logger.log_review_summary("Critic", 1, 0, "review")
+        logger.log_moderator_output("refined")
+        logger.close()
+
+        stamp = f"Timestamp: {logger._iter_ts}\n"
+        assert stamp in (tmp_path / "s1" / "Critic_responses.log").read_text()
+        assert stamp in (tmp_path / "s1" / "moderator_outputs.log").read_text()
+
+    def test_log_issues_reads_models_and_dicts(self, tmp_path):
+        from ai_orchestrator.models.prd_models import PRDIssue
+
+        issue = PRDIssue(category="product", description="vague goal", severity="High",
+                         suggested_fix="add metrics", reviewer="Critic")
+        logger = PRDLogger("s1", log_dir=str(tmp_path), verbose=False)
+        logger.log_issues("Critic", [issue, {"description": "from dict"}])
+        logger.close()
+
+        log = (tmp_path / "s1" / "refinement.log").read_text()
+        assert "Issue 1 [High]: vague goal" in log and "Fix: add metrics" in log
+        assert "Issue 2 [Unknown]: from dict" in log and "Fix: No fix suggested" in log
+
+    def test_grouped_console_output(self, tmp_path, capsys):
+        logger = PRDLogger("s1", log_dir=str(tmp_path), verbose=True)
+        logger.section("Round 1")
+        logger.log_token_summary({"Critic": 1200, "Moderator": 300})
+        logger.close()
+
+        sep = "=" * 60
+        assert capsys.readouterr().out == (
+            f"\n{sep}\nRound 1\n{sep}\n"
+            "\nToken Usage Summary:\n  Critic: 1,200 tokens\n  Moderator: 300 tokens\n"
+            "  TOTAL: 1,500 tokens\n"
+        )
+
+    def test_next_iteration_flushes_side_files(self, tmp_path):
+        logger = PRDLogger("s1", log_dir=str(tmp_path), verbose=False)
+        logger.begin_iteration()
+        logger.log_review_summary("Critic", 1, 0, "first round")
+        logger.begin_iteration()
+
+        assert "first round" in (tmp_path / "s1" / "Critic_responses.log").read_text()
+        logger.close()
@@ -3,27 +3,52 @@ Tests for memory store implementations.
 
 Tests InMemoryStore and SQLiteMemoryStore.
 """
-import os
-import tempfile
+import uuid
+from pathlib import Path
+
 import pytest
 
+from ai_orchestrator.plugins import MemoryStore, MemoryStoreError
 from ai_orchestrator.storage import InMemoryStore, SQLiteMemoryStore
-from ai_orchestrator.plugins import MemoryStore
+
+
+def test_backends_are_imported_on_first_use():
+    """Importing one store leaves the other backend (and pydantic) unloaded."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from ai_orchestrator.storage import InMemoryStore\n"
+        "assert 'ai_orchestrator.storage.memory_sqlite' not in sys.modules\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "import ai_orchestrator.storage as storage\n"
+        "assert storage.SQLiteMemoryStore.__name__ == 'SQLiteMemoryStore'\n"
+        "assert 'SQLiteMemoryStore' in dir(storage)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
 
 
 class TestInMemoryStore:
     """Tests for InMemoryStore."""
 
-    def test_protocol_compliance(self):
+    @pytest.fixture(scope="module")
+    def shared_store(self):
+        return InMemoryStore()
+
+    @pytest.fixture
+    def store(self, shared_store):
+        """One store for the module, emptied after each test."""
+        yield shared_store
+        shared_store.clear()
+
+    def test_protocol_compliance(self, store):
         """Test that InMemoryStore satisfies MemoryStore protocol."""
-        store = InMemoryStore()
         assert isinstance(store, MemoryStore)
         assert store.backend_name == "inmemory"
 
-    def test_put_and_get(self):
+    def test_put_and_get(self, store):
         """Test basic put and get operations."""
-        store = InMemoryStore()
-
         store.put(
             namespace="test",
             key="fact_1",
@@ -35,16 +60,13 @@ class TestInMemoryStore:
         assert item.key == "fact_1"
         assert item.value["content"] == "User prefers dark mode"
 
-    def test_get_nonexistent(self):
+    def test_get_nonexistent(self, store):
         """Test get for nonexistent key returns None."""
-        store = InMemoryStore()
         item = store.get(namespace="test", key="nonexistent")
         assert item is None
 
-    def test_put_updates_existing(self):
+    def test_put_updates_existing(self, store):
         """Test that put merges with existing values."""
-        store = InMemoryStore()
-
         store.put(namespace="test", key="user_1", value={"name": "Alice"})
         store.put(namespace="test", key="user_1", value={"preference": "dark"})
 
@@ -53,25 +75,46 @@ class TestInMemoryStore:
         assert item.value["name"] == "Alice"
         assert item.value["preference"] == "dark"
 
-    def test_delete(self):
-        """Test delete operation."""
-        store = InMemoryStore()
+    def test_put_many(self, store):
+        """put_many writes every item with one shared timestamp and merges updates."""
+        store.put(namespace="test", key="a", value={"name": "Alice"})
+
+        store.put_many(
+            namespace="test",
+            items=[("a", {"theme": "dark"}), ("b", {"theme": "light"})],
+        )
+
+        a = store.get(namespace="test", key="a")
+        b = store.get(namespace="test", key="b")
+        assert a.value == {"name": "Alice", "theme": "dark"}
+        assert a.updated_at_iso == b.updated_at_iso == b.created_at_iso
+        assert [r.key for r in store.search(namespace="test", query="light")] == ["b"]
 
+        store.delete_many(namespace="test", keys=["a", "missing"])
+        assert store.get(namespace="test", key="a") is None
+        assert store.search(namespace="test", query="dark") == []
+
+    def test_put_with_precomputed_timestamp(self, store):
+        """An explicit now is used for both timestamps on insert."""
+        store.put(namespace="test", key="a", value={"x": 1}, now="2026-01-01T00:00:00+00:00")
+
+        item = store.get(namespace="test", key="a")
+        assert item.created_at_iso == item.updated_at_iso == "2026-01-01T00:00:00+00:00"
+
+    def test_delete(self, store):
+        """Test delete operation."""
         store.put(namespace="test", key="temp", value={"data": "temporary"})
         store.delete(namespace="test", key="temp")
 
         item = store.get(namespace="test", key="temp")
         assert item is None
 
-    def test_delete_nonexistent(self):
+    def test_delete_nonexistent(self, store):
         """Test delete on nonexistent key doesn't raise."""
-        store = InMemoryStore()
         store.delete(namespace="test", key="nonexistent")  # Should not raise
 
-    def test_search_with_query(self):
+    def test_search_with_query(self, store):
         """Test search with query string."""
-        store = InMemoryStore()
-
         store.put(namespace="test", key="fact_1", value={"content": "User prefers dark mode"})
         store.put(namespace="test", key="fact_2", value={"content": "User likes coffee"})
         store.put(namespace="test", key="fact_3", value={"content": "User prefers light theme"})
@@ -81,30 +124,132 @@ class TestInMemoryStore:
         # dark mode should be found
         assert any("dark" in str(r.value) for r in results)
 
-    def test_search_empty_query(self):
-        """Test search with empty query returns recent items."""
-        store = InMemoryStore()
+    def test_search_tracks_merged_updates(self, store):
+        """Overwritten fields stop matching; untouched fields keep matching."""
+        store.put(namespace="test", key="user_1", value={"name": "Alice", "theme": "dark"})
+        store.put(namespace="test", key="user_1", value={"theme": "light"})
+
+        assert [r.key for r in store.search(namespace="test", query="light")] == ["user_1"]
+        assert store.search(namespace="test", query="dark") == []
+        assert [r.key for r in store.search(namespace="test", query="alice")] == ["user_1"]
+        assert "_search_text" not in store.get(namespace="test", key="user_1").metadata
+
+    def test_search_ranks_by_matched_terms(self, store):
+        """Items matching more query tokens rank first."""
+        store.put(namespace="test", key="a", value={"content": "prefers dark mode"})
+        store.put(namespace="test", key="b", value={"content": "dark chocolate"})
+        store.put(namespace="test", key="c", value={"content": "coffee"})
+
+        results = store.search(namespace="test", query="Dark mode", k=10)
+        assert [r.key for r in results] == ["a", "b"]
+        assert results[0].score > results[1].score > 0
+
+    def test_search_prefers_rarer_terms(self, store):
+        """BM25 weights a rare matching term above a common one."""
+        store.put(namespace="test", key="common", value={"content": "user note"})
+        store.put(namespace="test", key="rare", value={"content": "user espresso"})
+        store.put(namespace="test", key="other", value={"content": "user tea"})
+
+        results = store.search(namespace="test", query="user espresso", k=1)
+        assert [r.key for r in results] == ["rare"]
+
+    def test_search_score_is_okapi_bm25(self, store):
+        """Scores equal the textbook BM25 formula."""
+        import math
+
+        from ai_orchestrator.storage.memory_inmemory import BM25_B, BM25_K1
+
+        store.put(namespace="test", key="a", value={"content": "espresso espresso"})
+        store.put(namespace="test", key="b", value={"content": "tea"})
+
+        # "a" has 3 tokens (content, espresso x2); avg length is 2.5 tokens
+        idf = math.log((2 - 1 + 0.5) / (1 + 0.5) + 1.0)
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * 3 / 2.5)
+        expected = idf * 2 * (BM25_K1 + 1.0) / (2 + norm)
+        [item] = store.search(namespace="test", query="espresso")
+        assert item.score == pytest.approx(expected)
+
+    def test_search_prefers_shorter_documents(self, store):
+        """Length normalization follows merged updates and deletes."""
+        store.put(namespace="test", key="short", value={"content": "espresso"})
+        store.put(namespace="test", key="long", value={"content": "espresso"})
+        store.put(namespace="test", key="long", value={"extra": "with a long tail of words"})
+        store.put(namespace="test", key="gone", value={"content": "espresso shot"})
+        store.delete(namespace="test", key="gone")
+
+        results = store.search(namespace="test", query="espresso")
+        assert [r.key for r in results] == ["short", "long"]
+        assert store._total_len["test"] == sum(store._item_len["test"].values())
+
+    def test_search_indexes_nested_leaves_only(self, store):
+        """Nested strings are searchable; nulls and container syntax are not."""
+        store.put(namespace="test", key="a", value={"profile": {"tags": ["alpha", None]}})
+
+        assert [r.key for r in store.search(namespace="test", query="alpha")] == ["a"]
+        assert store.search(namespace="test", query="none") == []
+
+    def test_search_skips_deleted_items(self, store):
+        """Deleted items are dropped from the search index."""
+        store.put(namespace="test", key="temp", value={"data": "temporary"})
+        store.delete(namespace="test", key="temp")
+
+        assert store.search(namespace="test", query="temporary") == []
 
+    def test_search_empty_query(self, store):
+        """Test search with empty query returns recent items."""
         store.put(namespace="test", key="item_1", value={"data": "first"})
         store.put(namespace="test", key="item_2", value={"data": "second"})
 
         results = store.search(namespace="test", query="", k=10)
         assert len(results) == 2
 
-    def test_search_respects_k(self):
+    def test_search_respects_k(self, store):
         """Test search respects k limit."""
-        store = InMemoryStore()
-
-        for i in range(10):
-            store.put(namespace="test", key=f"item_{i}", value={"index": i})
+        store.put_many(
+            namespace="test", items=[(f"item_{i}", {"index": i}) for i in range(10)]
+        )
 
         results = store.search(namespace="test", query="", k=3)
         assert len(results) == 3
 
-    def test_compact(self):
-        """Test compact returns statistics."""
-        store = InMemoryStore()
+    def test_ttl_expires_items(self, store):
+        """Items past their TTL disappear from get, search and compact."""
+        store.put(namespace="test", key="gone", value={"data": "ephemeral"}, ttl_seconds=0)
+        store.put(namespace="test", key="kept", value={"data": "durable"}, ttl_seconds=3600)
 
+        assert store.get(namespace="test", key="gone") is None
+        assert store.search(namespace="test", query="ephemeral") == []
+        assert store.get(namespace="test", key="kept") is not None
+        assert store.compact(namespace="test")["count"] == 1
+
+    def test_ttl_cleared_by_later_put(self, store):
+        """Re-putting without a TTL cancels the earlier expiry."""
+        store.put(namespace="test", key="a", value={"data": "one"}, ttl_seconds=0)
+        store.put(namespace="test", key="a", value={"data": "two"})
+
+        item = store.get(namespace="test", key="a")
+        assert item is not None
+        assert item.value["data"] == "two"
+
+    def test_put_does_not_merge_into_expired_item(self, store, monkeypatch):
+        """An item past its TTL is replaced, not merged into, by a later put."""
+        from ai_orchestrator.storage import memory_inmemory
+
+        clock = [1000.0]
+        monkeypatch.setattr(memory_inmemory.time, "monotonic", lambda: clock[0])
+        store.put(namespace="test", key="a", value={"secret": "old"}, ttl_seconds=1)
+        clock[0] += 5
+        store.put(namespace="test", key="a", value={"b": 1})
+        store.put_many(namespace="test", items=[("c", {"secret": "old"})], ttl_seconds=1)
+        clock[0] += 5
+        store.put_many(namespace="test", items=[("c", {"b": 2})])
+
+        assert store.get(namespace="test", key="a").value == {"b": 1}
+        assert store.get(namespace="test", key="c").value == {"b": 2}
+        assert store.search(namespace="test", query="old") == []
+
+    def test_compact(self, store):
+        """Test compact returns statistics."""
         store.put(namespace="test", key="item_1", value={"data": "one"})
         store.put(namespace="test", key="item_2", value={"data": "two"})
 
@@ -113,10 +258,8 @@ class TestInMemoryStore:
         assert stats["count"] == 2
         assert stats["backend"] == "inmemory"
 
-    def test_namespace_isolation(self):
+    def test_namespace_isolation(self, store):
         """Test that namespaces are isolated."""
-        store = InMemoryStore()
-
         store.put(namespace="ns1", key="key", value={"data": "namespace 1"})
         store.put(namespace="ns2", key="key", value={"data": "namespace 2"})
 
@@ -126,10 +269,8 @@ class TestInMemoryStore:
         assert item1.value["data"] == "namespace 1"
         assert item2.value["data"] == "namespace 2"
 
-    def test_clear_namespace(self):
+    def test_clear_namespace(self, store):
         """Test clearing a single namespace."""
-        store = InMemoryStore()
-
         store.put(namespace="ns1", key="key", value={"data": "1"})
         store.put(namespace="ns2", key="key", value={"data": "2"})
 
@@ -138,10 +279,8 @@ class TestInMemoryStore:
         assert store.get(namespace="ns1", key="key") is None
         assert store.get(namespace="ns2", key="key") is not None
 
-    def test_clear_all(self):
+    def test_clear_all(self, store):
         """Test clearing all namespaces."""
-        store = InMemoryStore()
-
         store.put(namespace="ns1", key="key", value={"data": "1"})
         store.put(namespace="ns2", key="key", value={"data": "2"})
 
@@ -150,10 +289,8 @@ class TestInMemoryStore:
         assert store.get(namespace="ns1", key="key") is None
         assert store.get(namespace="ns2", key="key") is None
 
-    def test_list_namespaces(self):
+    def test_list_namespaces(self, store):
         """Test listing namespaces."""
-        store = InMemoryStore()
-
         store.put(namespace="alpha", key="key", value={"data": "1"})
         store.put(namespace="beta", key="key", value={"data": "2"})
 
@@ -165,113 +302,382 @@ class TestInMemoryStore:
 class TestSQLiteMemoryStore:
     """Tests for SQLiteMemoryStore."""
 
+    @pytest.fixture(scope="session")
+    def shared_store(self, tmp_path_factory):
+        """One store for the whole session; tests isolate themselves by namespace."""
+        store = SQLiteMemoryStore(path=str(tmp_path_factory.mktemp("memory") / "shared.db"))
+        yield store
+        store.close()
+
+    @pytest.fixture
+    def ns(self, shared_store):
+        """A fresh namespace (and f"{ns}/..." children), cleared after the test."""
+        namespace = f"t_{uuid.uuid4().hex}"
+        yield namespace
+        for name in shared_store.list_namespaces():
+            if name == namespace or name.startswith(f"{namespace}/"):
+                shared_store.clear(namespace=name)
+
     @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database file."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    def test_protocol_compliance(self, temp_db):
+    def temp_db(self, tmp_path):
+        """Path of a not-yet-created database in the test's own directory."""
+        return str(tmp_path / "store.db")
+
+    def test_protocol_compliance(self, shared_store, ns):
         """Test that SQLiteMemoryStore satisfies MemoryStore protocol."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
         assert isinstance(store, MemoryStore)
         assert store.backend_name == "sqlite"
 
-    def test_put_and_get(self, temp_db):
+    def test_put_and_get(self, shared_store, ns):
         """Test basic put and get operations."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
 
         store.put(
-            namespace="test",
+            namespace=ns,
             key="fact_1",
             value={"content": "User prefers dark mode"},
         )
 
-        item = store.get(namespace="test", key="fact_1")
+        item = store.get(namespace=ns, key="fact_1")
         assert item is not None
         assert item.key == "fact_1"
         assert item.value["content"] == "User prefers dark mode"
 
-    def test_get_nonexistent(self, temp_db):
+    def test_get_nonexistent(self, shared_store, ns):
         """Test get for nonexistent key returns None."""
-        store = SQLiteMemoryStore(path=temp_db)
-        item = store.get(namespace="test", key="nonexistent")
+        store = shared_store
+        item = store.get(namespace=ns, key="nonexistent")
         assert item is None
 
-    def test_put_updates_existing(self, temp_db):
+    def test_put_updates_existing(self, shared_store, ns):
         """Test that put merges with existing values."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
 
-        store.put(namespace="test", key="user_1", value={"name": "Alice"})
-        store.put(namespace="test", key="user_1", value={"preference": "dark"})
+        with store.transaction():
+            store.put(namespace=ns, key="user_1", value={"name": "Alice"})
+            store.put(namespace=ns, key="user_1", value={"preference": "dark"})
 
-        item = store.get(namespace="test", key="user_1")
+        item = store.get(namespace=ns, key="user_1")
         assert item is not None
         assert item.value["name"] == "Alice"
         assert item.value["preference"] == "dark"
 
-    def test_delete(self, temp_db):
-        """Test delete operation."""
+    def test_put_merge_is_shallow(self, shared_store, ns):
+        """Nulls overwrite and nested objects are replaced, not deep-merged."""
+        store = shared_store
+
+        store.put(namespace=ns, key="k", value={"a": 1, "nested": {"x": 1}, "gone": "v"})
+        store.put(namespace=ns, key="k", value={"nested": {"y": 2}, "gone": None})
+
+        item = store.get(namespace=ns, key="k")
+        assert item.value == {"a": 1, "nested": {"y": 2}, "gone": None}
+
+    def test_put_merge_keeps_created_at_and_search_text(self, shared_store, ns):
+        """The upsert keeps created_at and reindexes the merged value."""
+        store = shared_store
+
+        store.put(namespace=ns, key="k", value={"name": "Alice", "color": "red"})
+        created = store.get(namespace=ns, key="k").created_at_iso
+        store.put(namespace=ns, key="k", value={"color": "Blue"}, ttl_seconds=60)
+
+        item = store.get(namespace=ns, key="k")
+        assert item.created_at_iso == created
+        assert [i.key for i in store.search(namespace=ns, query="alice")] == ["k"]
+        assert [i.key for i in store.search(namespace=ns, query="blue")] == ["k"]
+        assert store.search(namespace=ns, query="red") == []
+
+    @pytest.mark.parametrize("json1", [True, False])
+    def test_merged_search_text_matches_full_rebuild(self, temp_db, json1):
+        """Appended and recomputed search text equal a fresh stringify of the value."""
+        from ai_orchestrator.storage.memory_sqlite import _stringify
+
         store = SQLiteMemoryStore(path=temp_db)
+        store._json_patch = store._json_patch and json1
+        updates = [
+            {"Name": "Alice", "tags": ["A", 1]},
+            {"role": "Admin"},              # new key: appended
+            {},                             # no-op
+            {"name": "bob", "extra": None},  # new keys, one null
+            {"role": "User"},               # overwrite: recomputed
+        ]
+        for value in updates:
+            store.put(namespace="test", key="k", value=value)
+            with store._conn() as conn:
+                stored = conn.execute(
+                    "SELECT search_text FROM memory_items WHERE key = 'k'"
+                ).fetchone()[0]
+            assert stored == _stringify(store.get(namespace="test", key="k").value)
+        assert store.search(namespace="test", query="admin") == []
+
+    def test_put_many_and_delete_many(self, shared_store, ns):
+        """Bulk writes share one timestamp, merge updates and keep item order."""
+        store = shared_store
+        store.put(namespace=ns, key="a", value={"name": "Alice"})
+
+        store.put_many(
+            namespace=ns,
+            items=[
+                ("a", {"role": "admin"}),
+                ("b", {"nested": {"x": 1}}),
+                ("b", {"extra": None}),
+                ("c", {"name": "Carol"}),
+            ],
+        )
 
-        store.put(namespace="test", key="temp", value={"data": "temporary"})
-        store.delete(namespace="test", key="temp")
+        a = store.get(namespace=ns, key="a")
+        b = store.get(namespace=ns, key="b")
+        assert a.value == {"name": "Alice", "role": "admin"}
+        assert b.value == {"nested": {"x": 1}, "extra": None}
+        assert a.updated_at_iso == b.updated_at_iso
 
-        item = store.get(namespace="test", key="temp")
+        store.delete_many(namespace=ns, keys=["a", "c", "missing"])
+        assert store.get(namespace=ns, key="a") is None
+        assert store.get(namespace=ns, key="c") is None
+        assert store.get(namespace=ns, key="b") is not None
+
+    def test_non_string_nested_keys(self, shared_store, ns):
+        """Nested int keys are stored as strings, as the stdlib json module would."""
+        store = shared_store
+        store.put(namespace=ns, key="k", value={"by_id": {7: "seven"}})
+
+        assert store.get(namespace=ns, key="k").value == {"by_id": {"7": "seven"}}
+
+    def test_put_many_commits_once(self, temp_db, monkeypatch):
+        """A batch of small items is one transaction, not one commit per row."""
+        import sqlite3
+
+        statements = []
+        connect = sqlite3.connect
+
+        def traced_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(sqlite3, "connect", traced_connect)
+        store = SQLiteMemoryStore(path=temp_db)
+        statements.clear()
+
+        store.put_many(namespace="test", items=[(f"k{i}", {"n": i}) for i in range(10)])
+
+        assert statements.count("BEGIN IMMEDIATE") == 1
+        assert statements.count("COMMIT") == 1
+        assert store.compact(namespace="test")["count"] == 10
+        store.close()
+
+    def test_put_many_is_atomic(self, shared_store, ns):
+        """A failing item rolls back the whole batch."""
+        store = shared_store
+
+        with pytest.raises(MemoryStoreError):
+            store.put_many(
+                namespace=ns,
+                items=[("ok", {"data": "1"}), ("bad", {"data": object()})],
+            )
+        assert store.get(namespace=ns, key="ok") is None
+
+    def test_transaction_commits_once(self, temp_db):
+        """Calls inside transaction() are committed together, including nested blocks."""
+        store = SQLiteMemoryStore(path=temp_db)
+        other = SQLiteMemoryStore(path=temp_db)
+
+        with store.transaction():
+            store.put(namespace="test", key="a", value={"data": "1"})
+            with store.transaction():
+                store.put_many(namespace="test", items=[("b", {"data": "2"})])
+                store.delete(namespace="test", key="a")
+            assert store.get(namespace="test", key="b") is not None
+            assert other.get(namespace="test", key="b") is None
+
+        assert store.get(namespace="test", key="a") is None
+        assert other.get(namespace="test", key="b") is not None
+        store.close()
+        other.close()
+
+    def test_transaction_rolls_back_on_error(self, temp_db):
+        """An exception inside transaction() discards every write in the block."""
+        store = SQLiteMemoryStore(path=temp_db)
+        store.put(namespace="test", key="keep", value={"data": "0"})
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.put(namespace="test", key="new", value={"data": "1"})
+                store.clear(namespace="test")
+                raise RuntimeError("abort")
+
+        assert store.get(namespace="test", key="new") is None
+        assert store.get(namespace="test", key="keep") is not None
+        store.put(namespace="test", key="after", value={"data": "2"})
+        assert store.compact(namespace="test")["count"] == 2
+        store.close()
+
+    def test_delete(self, shared_store, ns):
+        """Test delete operation."""
+        store = shared_store
+
+        store.put(namespace=ns, key="temp", value={"data": "temporary"})
+        store.delete(namespace=ns, key="temp")
+
+        item = store.get(namespace=ns, key="temp")
         assert item is None
 
-    def test_search_with_query(self, temp_db):
+    def test_search_with_query(self, shared_store, ns):
         """Test search with query string."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
 
-        store.put(namespace="test", key="fact_1", value={"content": "User prefers dark mode"})
-        store.put(namespace="test", key="fact_2", value={"content": "User likes coffee"})
-        store.put(namespace="test", key="fact_3", value={"content": "User prefers light theme"})
+        store.put_many(namespace=ns, items=[
+            ("fact_1", {"content": "User prefers dark mode"}),
+            ("fact_2", {"content": "User likes coffee"}),
+            ("fact_3", {"content": "User prefers light theme"}),
+        ])
 
-        results = store.search(namespace="test", query="dark", k=10)
+        results = store.search(namespace=ns, query="dark", k=10)
         assert len(results) >= 1
 
-    def test_search_empty_query(self, temp_db):
-        """Test search with empty query returns recent items."""
+    def test_search_index_follows_updates_and_deletes(self, shared_store, ns):
+        """The full-text index tracks merged updates, deletes and clears."""
+        store = shared_store
+
+        store.put(namespace=ns, key="a", value={"theme": "dark mode"})
+        store.put(namespace=ns, key="a", value={"theme": "light mode"})
+        store.put(namespace=ns, key="b", value={"theme": "dark chocolate"})
+        store.put(namespace=f"{ns}/other", key="c", value={"theme": "dark"})
+
+        assert [r.key for r in store.search(namespace=ns, query="dark")] == ["b"]
+        assert [r.key for r in store.search(namespace=ns, query="ght mo")] == ["a"]
+
+        store.delete(namespace=ns, key="b")
+        store.clear(namespace=f"{ns}/other")
+        assert store.search(namespace=ns, query="dark") == []
+        assert store.search(namespace=f"{ns}/other", query="dark") == []
+
+    def test_short_query_falls_back_to_like(self, shared_store, ns):
+        """Queries under three characters still match as substrings."""
+        store = shared_store
+
+        store.put(namespace=ns, key="a", value={"lang": "go"})
+
+        assert [r.key for r in store.search(namespace=ns, query="go")] == ["a"]
+
+    def test_existing_rows_are_indexed(self, temp_db):
+        """Rows written before the index existed are searchable after reopening."""
+        import sqlite3
+
+        store = SQLiteMemoryStore(path=temp_db)
+        store.put(namespace="test", key="a", value={"content": "espresso"})
+        store.close()
+        with sqlite3.connect(temp_db) as conn:
+            conn.executescript(
+                "DROP TRIGGER memory_fts_ai; DROP TRIGGER memory_fts_ad;"
+                "DROP TRIGGER memory_fts_au; DROP TABLE memory_fts;"
+                "PRAGMA user_version = 0;"
+            )
+
+        reopened = SQLiteMemoryStore(path=temp_db)
+        assert reopened._fts
+        assert [r.key for r in reopened.search(namespace="test", query="espresso")] == ["a"]
+        reopened.close()
+
+    def test_fts_index_reads_text_from_items(self, temp_db):
+        """The FTS index is external-content and stays consistent through writes."""
+        store = SQLiteMemoryStore(path=temp_db)
+        store.put_many(namespace="test", items=[
+            ("a", {"content": "espresso"}),
+            ("b", {"content": "green tea"}),
+        ])
+        store.put(namespace="test", key="a", value={"content": "flat white"})
+        store.delete(namespace="test", key="b")
+
+        with store._conn() as conn:
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'memory_fts'"
+            ).fetchone()[0]
+            assert "content='memory_items'" in sql
+            conn.execute("INSERT INTO memory_fts(memory_fts, rank) VALUES ('integrity-check', 1)")
+        assert [r.key for r in store.search(namespace="test", query="flat whi")] == ["a"]
+        assert store.search(namespace="test", query="espresso") == []
+        assert store.search(namespace="test", query="green") == []
+        store.close()
+
+    def test_schema_version_is_stamped(self, temp_db, monkeypatch):
+        """A current database is reopened without re-running the schema script."""
+        import sqlite3
+
+        from ai_orchestrator.storage.memory_sqlite import _SCHEMA_VERSION
+
+        SQLiteMemoryStore(path=temp_db).close()
+        statements = []
+        connect = sqlite3.connect
+
+        def traced_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(sqlite3, "connect", traced_connect)
         store = SQLiteMemoryStore(path=temp_db)
 
-        store.put(namespace="test", key="item_1", value={"data": "first"})
-        store.put(namespace="test", key="item_2", value={"data": "second"})
+        with store._conn() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+        assert store._fts
+        assert not any("CREATE" in sql for sql in statements)
+        store.close()
 
-        results = store.search(namespace="test", query="", k=10)
+    def test_search_text_skips_container_syntax(self, shared_store, ns):
+        """Nested values contribute their leaves, not their repr()."""
+        store = shared_store
+
+        store.put(namespace=ns, key="a", value={"tags": ["alpha", "beta"], "owner": None})
+
+        assert [r.key for r in store.search(namespace=ns, query="alpha beta")] == ["a"]
+        assert store.search(namespace=ns, query="none") == []
+
+    def test_search_empty_query(self, shared_store, ns):
+        """Test search with empty query returns recent items."""
+        store = shared_store
+
+        store.put_many(
+            namespace=ns,
+            items=[("item_1", {"data": "first"}), ("item_2", {"data": "second"})],
+        )
+
+        results = store.search(namespace=ns, query="", k=10)
         assert len(results) == 2
 
-    def test_compact(self, temp_db):
+    def test_compact(self, shared_store, ns):
         """Test compact returns statistics."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
 
-        store.put(namespace="test", key="item_1", value={"data": "one"})
-        store.put(namespace="test", key="item_2", value={"data": "two"})
+        store.put_many(
+            namespace=ns,
+            items=[("item_1", {"data": "one"}), ("item_2", {"data": "two"})],
+        )
 
-        stats = store.compact(namespace="test")
-        assert stats["namespace"] == "test"
+        stats = store.compact(namespace=ns)
+        assert stats["namespace"] == ns
         assert stats["count"] == 2
         assert stats["backend"] == "sqlite"
 
-    def test_namespace_isolation(self, temp_db):
+    def test_namespace_isolation(self, shared_store, ns):
         """Test that namespaces are isolated."""
-        store = SQLiteMemoryStore(path=temp_db)
+        store = shared_store
 
-        store.put(namespace="ns1", key="key", value={"data": "namespace 1"})
-        store.put(namespace="ns2", key="key", value={"data": "namespace 2"})
+        with store.transaction():
+            store.put(namespace=f"{ns}/1", key="key", value={"data": "namespace 1"})
+            store.put(namespace=f"{ns}/2", key="key", value={"data": "namespace 2"})
 
-        item1 = store.get(namespace="ns1", key="key")
-        item2 = store.get(namespace="ns2", key="key")
+        item1 = store.get(namespace=f"{ns}/1", key="key")
+        item2 = store.get(namespace=f"{ns}/2", key="key")
 
         assert item1.value["data"] == "namespace 1"
         assert item2.value["data"] == "namespace 2"
 
     def test_persistence(self, temp_db):
         """Test that data persists across store instances."""
-        store1 = SQLiteMemoryStore(path=temp_db)
+        store1 = SQLiteMemoryStore(path=temp_db, fast=False)
+        with store1._conn() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
         store1.put(namespace="test", key="persistent", value={"data": "should persist"})
 
         # Create new store instance pointing to same file
@@ -281,24 +687,89 @@ class TestSQLiteMemoryStore:
         assert item is not None
         assert item.value["data"] == "should persist"
 
-    def test_clear_namespace(self, temp_db):
-        """Test clearing a single namespace."""
+    def test_fast_pragmas_by_default(self, temp_db):
+        """Stores default to WAL with synchronous=NORMAL and a busy timeout."""
+        store = SQLiteMemoryStore(path=temp_db)
+        with store._conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        store.close()
+
+    def test_close_is_idempotent(self, temp_db):
+        """The shared connection can be closed explicitly or via the context manager."""
+        with SQLiteMemoryStore(path=temp_db) as store:
+            store.put(namespace="test", key="a", value={"data": "1"})
+        store.close()
+
+        assert SQLiteMemoryStore(path=temp_db).get(namespace="test", key="a") is not None
+
+    def test_closed_connection_is_reused(self, temp_db):
+        """A closed store's connection is handed to the next store on the file."""
+        store = SQLiteMemoryStore(path=temp_db)
+        store.put(namespace="test", key="a", value={"data": "1"})
+        conn = store._connection
+        store.close()
+
+        reopened = SQLiteMemoryStore(path=temp_db)
+        durable = SQLiteMemoryStore(path=temp_db, fast=False)
+        live = SQLiteMemoryStore(path=temp_db)
+        assert reopened._connection is conn
+        assert durable._connection is not conn
+        assert live._connection is not conn
+        assert reopened.get(namespace="test", key="a") is not None
+        for s in (reopened, durable, live):
+            s.close()
+
+    def test_replaced_file_gets_a_new_connection(self, temp_db):
+        """A parked connection is not reused once its file has been removed."""
         store = SQLiteMemoryStore(path=temp_db)
+        store.put(namespace="test", key="a", value={"data": "1"})
+        conn = store._connection
+        store.close()
+        # WAL mode leaves -wal/-shm companions next to the database
+        for path in Path(temp_db).parent.glob("store.db*"):
+            path.unlink()
+
+        fresh = SQLiteMemoryStore(path=temp_db)
+        assert fresh._connection is not conn
+        assert fresh.get(namespace="test", key="a") is None
+        fresh.close()
+
+    def test_concurrent_puts_share_connection(self, temp_db):
+        """Writes from several threads are serialized on the one connection."""
+        from concurrent.futures import ThreadPoolExecutor
 
-        store.put(namespace="ns1", key="key", value={"data": "1"})
-        store.put(namespace="ns2", key="key", value={"data": "2"})
+        store = SQLiteMemoryStore(path=temp_db)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(
+                lambda i: store.put(namespace="test", key=f"k{i}", value={"i": i}),
+                range(40),
+            ))
 
-        store.clear(namespace="ns1")
+        assert store.compact(namespace="test")["count"] == 40
+        store.close()
 
-        assert store.get(namespace="ns1", key="key") is None
-        assert store.get(namespace="ns2", key="key") is not None
+    def test_clear_namespace(self, shared_store, ns):
+        """Test clearing a single namespace."""
+        store = shared_store
+
+        with store.transaction():
+            store.put(namespace=f"{ns}/1", key="key", value={"data": "1"})
+            store.put(namespace=f"{ns}/2", key="key", value={"data": "2"})
+
+        store.clear(namespace=f"{ns}/1")
+
+        assert store.get(namespace=f"{ns}/1", key="key") is None
+        assert store.get(namespace=f"{ns}/2", key="key") is not None
 
     def test_clear_all(self, temp_db):
         """Test clearing all namespaces."""
         store = SQLiteMemoryStore(path=temp_db)
 
-        store.put(namespace="ns1", key="key", value={"data": "1"})
-        store.put(namespace="ns2", key="key", value={"data": "2"})
+        with store.transaction():
+            store.put(namespace="ns1", key="key", value={"data": "1"})
+            store.put(namespace="ns2", key="key", value={"data": "2"})
 
         store.clear()
 
@@ -309,9 +780,63 @@ class TestSQLiteMemoryStore:
         """Test listing namespaces."""
         store = SQLiteMemoryStore(path=temp_db)
 
-        store.put(namespace="alpha", key="key", value={"data": "1"})
-        store.put(namespace="beta", key="key", value={"data": "2"})
+        with store.transaction():
+            store.put(namespace="alpha", key="key", value={"data": "1"})
+            store.put(namespace="beta", key="key", value={"data": "2"})
 
         namespaces = store.list_namespaces()
         assert "alpha" in namespaces
         assert "beta" in namespaces
+
+    def test_namespace_queries_use_the_primary_key(self, temp_db):
+        """Namespace filters and listing seek the (namespace, key) b-tree."""
+        from ai_orchestrator.storage import memory_sqlite
+
+        store = SQLiteMemoryStore(path=temp_db)
+        store.put_many(namespace="b", items=[(f"k{i}", {"i": i}) for i in range(5)])
+        store.put(namespace="a", key="k", value={})
+        store.put(namespace="c", key="k", value={})
+
+        assert store.list_namespaces() == ["a", "b", "c"]
+        with store._conn() as conn:
+            for sql, params in (
+                (memory_sqlite._LIST_NAMESPACES_SQL, ()),
+                (memory_sqlite._CLEAR_SQL, ("a",)),
+                (memory_sqlite._COUNT_SQL, ("a",)),
+            ):
+                plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+                assert not any(step.startswith("SCAN memory_items") for step in plan), plan
+        store.close()
+
+    def test_recent_listing_uses_covering_index(self, shared_store, ns):
+        """Empty-query search reads only the covering index."""
+        store = shared_store
+        store.put(namespace=ns, key="key", value={"data": "1"})
+
+        from ai_orchestrator.storage.memory_sqlite import _SEARCH_RECENT_SQL
+
+        with store._conn() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN " + _SEARCH_RECENT_SQL, (ns, 5)
+            ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "COVERING INDEX idx_memory_cover" in detail
+        assert "TEMP B-TREE" not in detail
+
+
+class TestClock:
+    """Tests for the cached UTC timestamp helper."""
+
+    def test_matches_datetime_isoformat(self):
+        from datetime import datetime, timezone
+
+        from ai_orchestrator.storage._clock import utc_now_iso
+
+        before = datetime.now(timezone.utc)
+        stamp = utc_now_iso()
+        after = datetime.now(timezone.utc)
+
+        parsed = datetime.fromisoformat(stamp)
+        assert before <= parsed <= after
+        assert len(stamp) == len("2026-01-01T00:00:00.000000+00:00")
+        assert utc_now_iso() >= stamp
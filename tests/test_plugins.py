@@ -15,93 +15,124 @@ from ai_orchestrator.plugins import (
     MemoryItem,
     ModelProvider,
     EmbeddingProvider,
+    SharedPrefixProvider,
     Retriever,
     MemoryStore,
     ProviderError,
     RetrieverError,
     MemoryStoreError,
+    generate_with_shared_prefix,
+    implements,
 )
+from ai_orchestrator.storage import InMemoryStore
 
 
 class TestPluginTypes:
     """Tests for plugin type dataclasses."""
 
-    def test_chat_message(self):
-        """Test ChatMessage creation and immutability."""
-        msg = ChatMessage(role="user", content="Hello")
-        assert msg.role == "user"
-        assert msg.content == "Hello"
-        assert msg.name is None
-        assert msg.metadata == {}
-
-        # With metadata
-        msg2 = ChatMessage(
-            role="assistant",
-            content="Hi there",
-            name="helper",
-            metadata={"key": "value"},
-        )
-        assert msg2.name == "helper"
-        assert msg2.metadata["key"] == "value"
-
-    def test_model_usage(self):
-        """Test ModelUsage creation."""
-        usage = ModelUsage(
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            input_cost_usd=0.001,
-            output_cost_usd=0.002,
-        )
-        assert usage.prompt_tokens == 100
-        assert usage.total_tokens == 150
-
-    def test_model_response(self):
-        """Test ModelResponse creation."""
-        usage = ModelUsage(total_tokens=100)
-        response = ModelResponse(
-            text="Generated text",
-            model="gpt-4o",
-            usage=usage,
-            metadata={"finish_reason": "stop"},
-        )
-        assert response.text == "Generated text"
-        assert response.model == "gpt-4o"
-        assert response.usage.total_tokens == 100
-
-    def test_document_chunk(self):
-        """Test DocumentChunk creation."""
-        chunk = DocumentChunk(
-            chunk_id="chunk_001",
-            text="This is a chunk of text.",
-            metadata={"source": "document.pdf", "page": 1},
-        )
-        assert chunk.chunk_id == "chunk_001"
-        assert chunk.text == "This is a chunk of text."
-        assert chunk.metadata["page"] == 1
-
-    def test_retrieved_chunk(self):
-        """Test RetrievedChunk creation."""
-        chunk = DocumentChunk(chunk_id="1", text="text")
-        retrieved = RetrievedChunk(
-            chunk=chunk,
-            score=0.95,
-            metadata={"method": "vector"},
-        )
-        assert retrieved.chunk.chunk_id == "1"
-        assert retrieved.score == 0.95
-
-    def test_memory_item(self):
-        """Test MemoryItem creation."""
-        item = MemoryItem(
-            key="fact_001",
-            value={"content": "User prefers dark mode"},
-            created_at_iso="2026-01-01T00:00:00Z",
-            updated_at_iso="2026-01-02T00:00:00Z",
-            score=0.8,
-        )
-        assert item.key == "fact_001"
-        assert item.value["content"] == "User prefers dark mode"
+    @pytest.mark.parametrize(
+        "cls, kwargs, defaults",
+        [
+            (ChatMessage, dict(role="user", content="Hello"), {"name": None, "metadata": {}}),
+            (
+                ChatMessage,
+                dict(role="assistant", content="Hi there", name="helper", metadata={"key": "value"}),
+                {},
+            ),
+            (
+                ModelUsage,
+                dict(
+                    prompt_tokens=100,
+                    completion_tokens=50,
+                    total_tokens=150,
+                    input_cost_usd=0.001,
+                    output_cost_usd=0.002,
+                ),
+                {},
+            ),
+            (
+                ModelResponse,
+                dict(
+                    text="Generated text",
+                    model="gpt-4o",
+                    usage=ModelUsage(total_tokens=100),
+                    metadata={"finish_reason": "stop"},
+                ),
+                {},
+            ),
+            (
+                DocumentChunk,
+                dict(
+                    chunk_id="chunk_001",
+                    text="This is a chunk of text.",
+                    metadata={"source": "document.pdf", "page": 1},
+                ),
+                {},
+            ),
+            (
+                RetrievedChunk,
+                dict(
+                    chunk=DocumentChunk(chunk_id="1", text="text"),
+                    score=0.95,
+                    metadata={"method": "vector"},
+                ),
+                {},
+            ),
+            (
+                MemoryItem,
+                dict(
+                    key="fact_001",
+                    value={"content": "User prefers dark mode"},
+                    created_at_iso="2026-01-01T00:00:00Z",
+                    updated_at_iso="2026-01-02T00:00:00Z",
+                    score=0.8,
+                ),
+                {},
+            ),
+        ],
+        ids=[
+            "ChatMessage-defaults",
+            "ChatMessage",
+            "ModelUsage",
+            "ModelResponse",
+            "DocumentChunk",
+            "RetrievedChunk",
+            "MemoryItem",
+        ],
+    )
+    def test_construction(self, cls, kwargs, defaults):
+        """Fields hold the values passed in, and omitted ones their defaults."""
+        obj = cls(**kwargs)
+        for name, expected in {**kwargs, **defaults}.items():
+            assert getattr(obj, name) == expected, name
+
+    def test_default_metadata_is_shared_and_read_only(self):
+        """Instances without metadata share one immutable empty mapping."""
+        a = ChatMessage(role="user", content="a")
+        b = ChatMessage(role="user", content="b")
+        assert a.metadata is b.metadata
+        with pytest.raises(TypeError):
+            a.metadata["key"] = "value"
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            ChatMessage(role="user", content="a"),
+            ModelUsage(),
+            ModelResponse(text="t"),
+            DocumentChunk(chunk_id="1", text="t"),
+            RetrievedChunk(chunk=DocumentChunk(chunk_id="1", text="t"), score=1.0),
+            MemoryItem(key="k", value={}, created_at_iso="", updated_at_iso=""),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_types_are_slotted_and_frozen(self, instance):
+        """Plugin types carry no per-instance __dict__ and reject mutation."""
+        from dataclasses import FrozenInstanceError, fields
+
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            setattr(instance, fields(instance)[0].name, None)
 
 
 class TestProtocolCompliance:
@@ -135,6 +166,58 @@ class TestProtocolCompliance:
         response = provider.generate([ChatMessage(role="user", content="Hello")])
         assert response.text == "fake response"
 
+    def test_shared_prefix_native(self):
+        """Providers with generate_shared_prefix get one batched call."""
+
+        class BatchingProvider:
+            provider_name = "batch"
+            calls = 0
+
+            def generate(self, messages, **kwargs):
+                raise AssertionError("per-call path should not be used")
+
+            def generate_shared_prefix(self, prefix, suffixes, **kwargs):
+                self.calls += 1
+                return [ModelResponse(text=s[0].content) for s in suffixes]
+
+        provider = BatchingProvider()
+        assert isinstance(provider, SharedPrefixProvider)
+        prefix = [ChatMessage(role="user", content="document")]
+        suffixes = [[ChatMessage(role="user", content=q)] for q in ("a", "b")]
+
+        responses = generate_with_shared_prefix(provider, prefix, suffixes)
+        assert [r.text for r in responses] == ["a", "b"]
+        assert provider.calls == 1
+
+        # The capability check is cached per class; later instances reuse it
+        second = BatchingProvider()
+        generate_with_shared_prefix(second, prefix, suffixes)
+        assert second.calls == 1
+
+    def test_shared_prefix_fallback_marks_cache(self):
+        """Plain providers get one call per suffix with a cache hint on the prefix."""
+        seen = []
+
+        class PlainProvider:
+            provider_name = "plain"
+
+            def generate(self, messages, **kwargs):
+                seen.append(messages)
+                return ModelResponse(text=messages[-1].content)
+
+        prefix = [
+            ChatMessage(role="system", content="rules"),
+            ChatMessage(role="user", content="document"),
+        ]
+        suffixes = [[ChatMessage(role="user", content=q)] for q in ("a", "b")]
+
+        responses = generate_with_shared_prefix(PlainProvider(), prefix, suffixes, max_tokens=5)
+        assert [r.text for r in responses] == ["a", "b"]
+        assert len(seen) == 2
+        assert seen[0][1].metadata["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in seen[0][0].metadata
+        assert prefix[1].metadata == {}
+
     def test_embedding_provider_protocol(self):
         """Test that a class can satisfy EmbeddingProvider protocol."""
 
@@ -236,6 +319,36 @@ class TestProtocolCompliance:
         assert isinstance(store, MemoryStore)
 
 
+class TestImplements:
+    """implements() agrees with isinstance() on the plugin protocols."""
+
+    PROTOCOLS = (ModelProvider, EmbeddingProvider, SharedPrefixProvider, Retriever, MemoryStore)
+
+    @pytest.mark.parametrize("make", [
+        InMemoryStore,
+        lambda: ModelResponse(text="not a plugin"),
+        object,
+    ])
+    def test_matches_isinstance(self, make):
+        obj = make()
+        for proto in self.PROTOCOLS:
+            assert implements(obj, proto) == isinstance(obj, proto), proto
+
+    def test_none_member_does_not_implement(self):
+        """A member set to None on the class opts out, as with isinstance()."""
+
+        class NoBatching:
+            provider_name = "plain"
+            generate_shared_prefix = None
+
+            def generate(self, messages, **kwargs):
+                return ModelResponse(text="")
+
+        assert implements(NoBatching(), ModelProvider)
+        assert not implements(NoBatching(), SharedPrefixProvider)
+        assert not isinstance(NoBatching(), SharedPrefixProvider)
+
+
 class TestErrors:
     """Test custom error classes."""
 
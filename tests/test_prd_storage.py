@@ -0,0 +1,202 @@
+"""
+Tests for PRDStorage session persistence.
+"""
+import pytest
+
+from ai_orchestrator.models.document_models import Document, DocumentIssue, DocumentReview
+from ai_orchestrator.storage.prd_storage import PRDStorage
+
+
+def make_review(severity: str = "High") -> DocumentReview:
+    return DocumentReview(
+        reviewer_name="Critic",
+        issues=[
+            DocumentIssue(category="General", description="x", severity=severity, reviewer="Critic")
+        ],
+        overall_assessment="ok",
+    )
+
+
+class TestSaveIteration:
+    """Iterations are appended to a single session log and readable back."""
+
+    def test_round_trip(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        session_id = storage.create_session_with_id("s1", "Title")
+        doc = Document(version=1, title="Title", content="v1 body")
+        review = make_review()
+        doc.add_review(review)
+
+        storage.save_iteration(session_id, doc, [review])
+
+        log = tmp_path / session_id / "iterations.jsonl"
+        assert len(log.read_text(encoding="utf-8").splitlines()) == 1
+        assert storage.load_prd(session_id, 1).content == "v1 body"
+        reviews = storage.load_reviews(session_id, 1)
+        assert reviews[0]["issues"][0]["severity"] == "High"
+        assert storage.get_latest_version(session_id) == 1
+
+    def test_multiple_versions(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        session_id = storage.create_session_with_id("s1", "Title")
+        doc = Document(version=1, title="Title", content="v1")
+        storage.save_iteration(session_id, doc, [make_review()])
+        doc.version, doc.content = 2, "v2"
+        storage.save_iteration(session_id, doc, [])
+
+        assert storage.get_latest_version(session_id) == 2
+        assert storage.load_prd(session_id, 2).content == "v2"
+        assert storage.load_reviews(session_id, 2) == []
+        assert len(storage.load_reviews(session_id, 1)) == 1
+
+    def test_per_version_files_take_precedence(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        session_id = storage.create_session_with_id("s1", "Title")
+        doc = Document(version=1, title="Title", content="from log")
+        storage.save_iteration(session_id, doc, [])
+        doc.content = "from file"
+        storage.save_prd(session_id, doc)
+
+        assert storage.load_prd(session_id, 1).content == "from file"
+
+    def test_missing_version(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        session_id = storage.create_session_with_id("s1", "Title")
+        assert storage.load_reviews(session_id, 3) == []
+        assert storage.get_latest_version(session_id) == 0
+
+
+class TestSessionIndex:
+    """The sessions index is cached in memory and written atomically."""
+
+    def test_metadata_list_and_delete(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "First")
+        storage.create_session_with_id("s2", "Second")
+
+        assert storage.get_session_metadata("s2")["title"] == "Second"
+        assert {s["session_id"] for s in storage.list_sessions()} == {"s1", "s2"}
+
+        assert storage.delete_session("s1")
+        assert [s["session_id"] for s in storage.list_sessions()] == ["s2"]
+        assert [s["session_id"] for s in PRDStorage(base_dir=str(tmp_path)).list_sessions()] == ["s2"]
+        with pytest.raises(ValueError):
+            storage.get_session_metadata("s1")
+        assert not list(tmp_path.glob(".prd_index.*"))
+
+    def test_sees_writes_from_another_instance(self, tmp_path):
+        first = PRDStorage(base_dir=str(tmp_path))
+        assert first.list_sessions() == []
+        PRDStorage(base_dir=str(tmp_path)).create_session_with_id("s1", "Elsewhere")
+
+        assert first.get_session_metadata("s1")["title"] == "Elsewhere"
+
+    def test_returned_metadata_is_a_copy(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        storage.get_session_metadata("s1")["title"] = "mutated"
+        storage.list_sessions()[0]["title"] = "mutated"
+
+        assert storage.get_session_metadata("s1")["title"] == "Title"
+
+    def test_latest_version_is_indexed(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        doc = Document(version=2, title="Title", content="v2")
+        storage.save_prd("s1", doc)
+        doc.version = 1
+        storage.save_prd("s1", doc)
+
+        assert storage.get_session_metadata("s1")["latest_version"] == 2
+        (tmp_path / "s1" / "prd_v2.json").unlink()
+        assert storage.get_latest_version("s1") == 2
+
+    def test_latest_version_falls_back_to_files(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        del storage._session_by_id["s1"]["latest_version"]
+        storage._flush_index()
+        storage.save_prd("s1", Document(version=3, title="Title", content="v3"))
+
+        assert "latest_version" not in storage.get_session_metadata("s1")
+        assert storage.get_latest_version("s1") == 3
+
+
+class TestDocumentFiles:
+    """Document and review files are compact unless pretty output is requested."""
+
+    def test_compact_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("AI_ORCHESTRATOR_PRETTY_JSON", raising=False)
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        storage.save_prd("s1", Document(version=1, title="Title", content="body"))
+        storage.save_reviews("s1", 1, [make_review()])
+
+        assert b"\n" not in (tmp_path / "s1" / "prd_v1.json").read_bytes()
+        assert b"\n" not in (tmp_path / "s1" / "reviews_v1.json").read_bytes()
+        assert storage.load_prd("s1", 1).content == "body"
+        assert storage.load_reviews("s1", 1)[0]["reviewer_name"] == "Critic"
+
+    def test_pretty_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("AI_ORCHESTRATOR_PRETTY_JSON", "1")
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        storage.save_prd("s1", Document(version=1, title="Title", content="body"))
+
+        assert b'\n  "' in (tmp_path / "s1" / "prd_v1.json").read_bytes()
+
+    def test_flush_session_writes_everything(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        doc = Document(version=2, title="Title", content="body")
+
+        storage.flush_session(
+            "s1", prd=doc, reviews=[make_review()],
+            config={"participants": ["Critic"]}, report={"converged": True},
+        )
+
+        assert storage.load_prd("s1", 2).content == "body"
+        assert storage.load_reviews("s1", 2)[0]["reviewer_name"] == "Critic"
+        assert storage.load_roundtable_config("s1") == {"participants": ["Critic"]}
+        assert storage.load_convergence_report("s1") == {"converged": True}
+        assert storage.get_latest_version("s1") == 2
+
+    def test_flush_session_reviews_need_a_version(self, tmp_path):
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+
+        with pytest.raises(ValueError):
+            storage.flush_session("s1", reviews=[make_review()])
+        storage.flush_session("s1", reviews=[make_review()], version=4)
+        assert len(storage.load_reviews("s1", 4)) == 1
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        import os
+
+        from ai_orchestrator.storage import prd_storage
+
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        storage.save_convergence_report("s1", {"round": 1})
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(prd_storage.os, "replace", fail)
+        with pytest.raises(OSError):
+            storage.save_convergence_report("s1", {"round": 2})
+        monkeypatch.setattr(prd_storage.os, "replace", os.replace)
+
+        assert storage.load_convergence_report("s1") == {"round": 1}
+        assert [p.name for p in (tmp_path / "s1").iterdir()] == ["convergence_report.json"]
+
+    def test_files_get_default_permissions(self, tmp_path):
+        """Atomic writes leave files readable like a plain open() would."""
+        storage = PRDStorage(base_dir=str(tmp_path))
+        storage.create_session_with_id("s1", "Title")
+        storage.save_prd("s1", Document(version=1, title="Title", content="body"))
+        (tmp_path / "plain").write_bytes(b"")
+
+        expected = (tmp_path / "plain").stat().st_mode & 0o777
+        for path in (tmp_path / "prd_index.json", tmp_path / "s1" / "prd_v1.json"):
+            assert path.stat().st_mode & 0o777 == expected
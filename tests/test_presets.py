@@ -0,0 +1,29 @@
+"""
+Tests for prebuilt roundtable presets.
+"""
+import pytest
+
+from ai_orchestrator.presets import PRESET_VERSION, load_preset_data
+
+
+class TestPresets:
+    """Tests for load_preset_data."""
+
+    @pytest.mark.parametrize("preset", ["prd", "code-review", "architecture", "business-strategy"])
+    def test_builtin_presets_load(self, preset):
+        """Every built-in preset ships a current, complete config."""
+        data = load_preset_data(preset)
+        assert data is not None
+        assert data["preset_version"] == PRESET_VERSION
+        assert data["participants"]
+        assert data["moderator_focus"]
+        assert data["convergence_criteria"]
+        for participant in data["participants"]:
+            assert "JSON object" in participant["system_prompt"]
+            name = participant["name"]
+            article = "an" if name[0] in "AEIOU" else "a"
+            assert participant["system_prompt"].startswith(f"You are {article} {name}.")
+
+    def test_unknown_preset_returns_none(self):
+        """Missing preset files fall through to LLM generation."""
+        assert load_preset_data("does-not-exist") is None
@@ -7,7 +7,12 @@ import pytest
 from typing import Any, Dict, Optional, Sequence
 
 from ai_orchestrator import (
+    AsyncEngine,
+    EngineError,
+    NullLogger,
     run_roundtable,
+    run_roundtable_async,
+    ThreadedEngine,
     RoundtableConfig,
     RoundtableResult,
     Issue,
@@ -19,9 +24,17 @@ from ai_orchestrator import (
 class FakeAgent:
     """A fake agent for testing that returns configurable reviews."""
 
+    __slots__ = ("_name", "_issues", "_assessment")
+
     def __init__(self, name: str, issues: list[tuple[str, Severity]] = None):
         self._name = name
-        self._issues = issues or []
+        # The review never depends on the document, so its issues are built
+        # once and shared by every review (each still gets its own list)
+        self._issues = tuple(
+            Issue(category="test", description=desc, severity=severity, reviewer=name)
+            for desc, severity in issues or ()
+        )
+        self._assessment = f"Review by {name}"
 
     @property
     def name(self) -> str:
@@ -33,22 +46,16 @@ class FakeAgent:
         """Return a fake review with configured issues."""
         return Review(
             reviewer_name=self._name,
-            issues=[
-                Issue(
-                    category="test",
-                    description=desc,
-                    severity=severity,
-                    reviewer=self._name,
-                )
-                for desc, severity in self._issues
-            ],
-            overall_assessment=f"Review by {self._name}",
+            issues=list(self._issues),
+            overall_assessment=self._assessment,
         )
 
 
 class FakeModerator:
     """A fake moderator that appends a version number to the document."""
 
+    __slots__ = ("suffix", "call_count")
+
     def __init__(self, suffix: str = "[REFINED]"):
         self.suffix = suffix
         self.call_count = 0
@@ -172,6 +179,43 @@ class TestRunRoundtable:
             assert "TechCritic" in reviewer_names
             assert "SecurityCritic" in reviewer_names
 
+    def test_reviews_overlap_by_default(self):
+        """The sync runner fans each iteration's reviews out concurrently."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierAgent(FakeAgent):
+            def review(self, document, context=None):
+                barrier.wait()  # deadlocks (times out) unless all run at once
+                return super().review(document, context)
+
+        result = run_roundtable(
+            document="Doc",
+            agents=[BarrierAgent(f"A{i}") for i in range(3)],
+            moderator=FakeModerator(),
+            config=RoundtableConfig(max_iterations=1),
+        )
+
+        assert [r.reviewer_name for r in result.iterations[0].reviews] == ["A0", "A1", "A2"]
+
+    def test_agent_timeout_from_config(self):
+        """config.agent_timeout_s bounds each review under the default engine."""
+        import time
+
+        class SlowAgent(FakeAgent):
+            def review(self, document, context=None):
+                time.sleep(0.3)  # the runner still joins this thread on exit
+                return super().review(document, context)
+
+        with pytest.raises(EngineError, match="Agent 'Slow' failed: review timed out"):
+            run_roundtable(
+                document="Doc",
+                agents=[FakeAgent("Ok"), SlowAgent("Slow")],
+                moderator=FakeModerator(),
+                config=RoundtableConfig(max_iterations=1, agent_timeout_s=0.05),
+            )
+
     def test_result_structure(self):
         """Test that result contains all expected fields."""
         agents = [FakeAgent("Agent")]
@@ -239,10 +283,28 @@ class TestRunRoundtable:
 
         assert result.session_id == "custom_session_123"
 
+    def test_generated_session_ids_are_unique(self):
+        """Back-to-back sessions in the same second get distinct IDs."""
+        results = [
+            run_roundtable(
+                document="Test",
+                agents=[FakeAgent("Agent")],
+                moderator=FakeModerator(),
+                config=RoundtableConfig(max_iterations=1),
+                logger=NullLogger(),
+            )
+            for _ in range(2)
+        ]
+
+        assert results[0].session_id != results[1].session_id
+        assert all(r.session_id.startswith("session_") for r in results)
+
     def test_context_passed_to_agents(self):
         """Test that context is passed to agents and moderator."""
 
         class ContextAwareAgent:
+            __slots__ = ("_name", "received_context")
+
             def __init__(self):
                 self._name = "ContextAgent"
                 self.received_context = None
@@ -260,6 +322,8 @@ class TestRunRoundtable:
                 )
 
         class ContextAwareModerator:
+            __slots__ = ("received_context",)
+
             def __init__(self):
                 self.received_context = None
 
@@ -315,6 +379,8 @@ class TestIssueTracking:
 
         # 3 agents * 2 iterations = 6 issues total (1 issue per agent per iteration)
         assert result.total_issues_identified == 6
+        assert result.iterations[0].issue_count == 3
+        assert result.to_dict()["history"][0]["issues_count"] == 3
 
     def test_final_issue_count(self):
         """Test that final issue count reflects last iteration."""
@@ -336,3 +402,177 @@ class TestIssueTracking:
         assert result.final_issue_count["high"] == 1
         assert result.final_issue_count["medium"] == 1
         assert result.final_issue_count["low"] == 1
+
+    def test_token_usage_aggregated_across_iterations(self):
+        """Reported review usage is summed per agent into the result."""
+
+        class MeteredAgent(FakeAgent):
+            def review(self, document, context=None):
+                review = super().review(document, context)
+                review.token_usage = {"prompt_tokens": 70, "completion_tokens": 30, "total_tokens": 100}
+                return review
+
+        agents = [
+            MeteredAgent("Metered", [("critical", Severity.HIGH)]),
+            FakeAgent("Silent"),
+        ]
+        result = run_roundtable(
+            document="Test",
+            agents=agents,
+            moderator=FakeModerator(),
+            config=RoundtableConfig(max_iterations=2),
+            logger=NullLogger(),
+        )
+
+        assert result.iterations[0].metadata["token_usage"] == {"Metered": 100}
+        assert result.token_usage == {"Metered": 200, "total": 200}
+
+
+class TestAsyncEngine:
+    """Tests for concurrent reviews via AsyncEngine / run_roundtable_async."""
+
+    async def test_async_runner_matches_sync(self):
+        """run_roundtable_async produces the same reviews as the sync runner."""
+        agents = [
+            FakeAgent("A", [("a", Severity.MEDIUM)]),
+            FakeAgent("B", [("b", Severity.HIGH)]),
+        ]
+        config = RoundtableConfig(max_iterations=2)
+
+        result = await run_roundtable_async(
+            document="Doc", agents=agents, moderator=FakeModerator(), config=config
+        )
+
+        assert len(result.iterations) == 2
+        for iteration in result.iterations:
+            assert [r.reviewer_name for r in iteration.reviews] == ["A", "B"]
+
+    async def test_reviews_run_concurrently(self):
+        """Native areview coroutines overlap instead of running back to back."""
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        class SlowAgent(FakeAgent):
+            async def areview(self, document, context=None):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return self.review(document, context)
+
+        agents = [SlowAgent(f"Agent{i}") for i in range(4)]
+        engine = AsyncEngine(max_parallel_agents=2)
+        iteration = await engine.step("Doc", agents, FakeModerator())
+
+        assert peak == 2
+        assert len(iteration.reviews) == 4
+
+    async def test_failure_waits_for_siblings(self):
+        """One failing agent surfaces as EngineError after the others finish."""
+        class BrokenAgent(FakeAgent):
+            def review(self, document, context=None):
+                raise RuntimeError("boom")
+
+        finished = []
+
+        class TrackingAgent(FakeAgent):
+            def review(self, document, context=None):
+                finished.append(self.name)
+                return super().review(document, context)
+
+        engine = AsyncEngine()
+        with pytest.raises(EngineError, match="Agent 'Broken' failed: boom"):
+            await engine.step(
+                "Doc", [BrokenAgent("Broken"), TrackingAgent("Ok")], FakeModerator()
+            )
+        assert finished == ["Ok"]
+
+    async def test_sync_runner_inside_event_loop(self):
+        """run_roundtable still works when called from a running loop."""
+        result = run_roundtable(
+            document="Doc",
+            agents=[FakeAgent("A")],
+            moderator=FakeModerator(),
+            config=RoundtableConfig(max_iterations=1),
+        )
+        assert result.stopped_by == "no_high_issues"
+
+
+class TestThreadedEngine:
+    """Tests for pooled reviews via ThreadedEngine."""
+
+    def test_runs_with_sync_runner_and_preserves_order(self):
+        agents = [FakeAgent(f"Agent{i}", [("x", Severity.HIGH)]) for i in range(3)]
+        with ThreadedEngine() as engine:
+            result = run_roundtable(
+                document="Doc",
+                agents=agents,
+                moderator=FakeModerator(),
+                engine=engine,
+                config=RoundtableConfig(max_iterations=2),
+            )
+            pool = engine._pool
+        assert pool is not None and engine._pool is None
+        for iteration in result.iterations:
+            assert [r.reviewer_name for r in iteration.reviews] == ["Agent0", "Agent1", "Agent2"]
+
+    def test_reviews_overlap(self):
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierAgent(FakeAgent):
+            def review(self, document, context=None):
+                barrier.wait()  # deadlocks (times out) unless all run at once
+                return super().review(document, context)
+
+        with ThreadedEngine() as engine:
+            iteration = engine.step("Doc", [BarrierAgent(f"A{i}") for i in range(3)], FakeModerator())
+        assert len(iteration.reviews) == 3
+
+    def test_unfinished_reviews_time_out(self):
+        import threading
+
+        release = threading.Event()
+
+        class StuckAgent(FakeAgent):
+            def review(self, document, context=None):
+                release.wait(5)
+                return super().review(document, context)
+
+        with ThreadedEngine(agent_timeout_s=0.05) as engine:
+            try:
+                with pytest.raises(EngineError, match="Agent 'Stuck' failed: review timed out"):
+                    engine.step("Doc", [FakeAgent("Ok"), StuckAgent("Stuck")], FakeModerator())
+            finally:
+                release.set()
+
+    def test_failure_is_wrapped(self):
+        class BrokenAgent(FakeAgent):
+            def review(self, document, context=None):
+                raise RuntimeError("boom")
+
+        with ThreadedEngine() as engine:
+            with pytest.raises(EngineError, match="Agent 'Broken' failed: boom"):
+                engine.step("Doc", [FakeAgent("Ok"), BrokenAgent("Broken")], FakeModerator())
+
+
+class TestNullLogger:
+    """run_roundtable with logging disabled."""
+
+    def test_null_logger_writes_nothing(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        result = run_roundtable(
+            document="Doc",
+            agents=[FakeAgent("A", [("x", Severity.HIGH)])],
+            moderator=FakeModerator(),
+            config=RoundtableConfig(max_iterations=2),
+            logger=NullLogger(),
+        )
+        assert len(result.iterations) == 2
+        assert result.token_usage == {"total": 0}
+        assert list(tmp_path.iterdir()) == []
+        assert capsys.readouterr().out == ""